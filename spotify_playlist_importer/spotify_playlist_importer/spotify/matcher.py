@@ -87,6 +87,7 @@ def select_best_match(parsed_song: ParsedSong, candidates: List[Dict[str, Any]])
         bracket_threshold = config.get("BRACKET_THRESHOLD", 70.0)
         first_stage_threshold = config.get("FIRST_STAGE_THRESHOLD", 60.0)
         second_stage_threshold = config.get("SECOND_STAGE_THRESHOLD", 70.0)
+        min_title_score = config.get("MIN_TITLE_SCORE", 45.0)
         
         # 创建增强匹配器实例
         enhanced_matcher = EnhancedMatcher(
@@ -97,7 +98,8 @@ def select_best_match(parsed_song: ParsedSong, candidates: List[Dict[str, Any]])
             string_threshold=match_threshold,
             bracket_threshold=bracket_threshold,
             first_stage_threshold=first_stage_threshold,
-            second_stage_threshold=second_stage_threshold
+            second_stage_threshold=second_stage_threshold,
+            min_title_score=min_title_score
         )
         
         # [诊断日志] 开启增强匹配器的详细日志模式
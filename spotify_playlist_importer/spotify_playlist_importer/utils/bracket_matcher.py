@@ -5,12 +5,184 @@
 """
 
 import re
+import heapq
 import logging
-from typing import Dict, List, Optional, Set, Tuple, Union, Any
+from functools import lru_cache
+from typing import Dict, List, NamedTuple, Optional, Set, Tuple, Union, Any
 
 import fuzzywuzzy.fuzz as fuzz
 
-from spotify_playlist_importer.utils.text_normalizer import normalize_text, TextNormalizer
+# 有条件导入pyahocorasick，如果导入失败则回退到逐个关键词的子串检测
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+from spotify_playlist_importer.utils.text_normalizer import (
+    normalize_text, _get_normalizer
+)
+
+
+# 预编译正则表达式，避免热路径中每次调用都查找re模块的内部缓存
+# 匹配连续空白字符
+_WS_RE = re.compile(r'\s+')
+# 匹配四位数年份（19xx或20xx）
+_YEAR_RE = re.compile(r'\b(19|20)\d{2}\b')
+# 匹配中英文别名指示词及其后的别名（可选的冒号或空格分隔）
+_ALIAS_RE = re.compile(
+    r'(?:又名|别名|别称|原名|aka|also known as|alternate title|original)[:\s]?(.+)$'
+)
+# 匹配feat括号开头的合作标记（feat. / ft. / featuring / with）
+_FEAT_PREFIX_RE = re.compile(r'^\s*(?:featuring|feat\.?|ft\.?|with)\s*')
+# 匹配多位合作艺术家之间的分隔符
+_ARTIST_SEP_RE = re.compile(r'\s*(?:,|，|&|、|/|\band\b|\bx\b|和)\s*')
+
+
+def _compile_keywords(keywords: List[str]) -> re.Pattern:
+    """将关键词列表编译为单个交替匹配的正则表达式"""
+    return re.compile('|'.join(re.escape(keyword) for keyword in keywords))
+
+
+# 括号类型识别规则，按优先级排列（先命中的类型优先）
+# 每个类型的关键词预编译为一个交替正则，取代逐个关键词的子串检测
+_BRACKET_TYPE_RULES = (
+    # 合作艺术家信息
+    ("feat", _compile_keywords(["feat", "ft", "featuring", "with"])),
+    # remix版本
+    ("remix", _compile_keywords(["remix", "mix", "dj", "club", "extended"])),
+    # 现场版本
+    ("live", _compile_keywords(["live", "现场", "演唱会", "concert"])),
+    # 原声版本
+    ("acoustic", _compile_keywords(["acoustic", "原声", "钢琴", "吉他", "piano", "guitar"])),
+    # 重制版
+    ("remaster", _compile_keywords(["remaster", "重制", "修复", "高清", "hd"])),
+    # 版本信息
+    ("version", _compile_keywords(["version", "版本", "ver", "special", "deluxe"])),
+    # 别名信息
+    ("alias", _compile_keywords(["又名", "别名", "aka", "also known as", "原名"])),
+    # 年份 - 四位数字可能是年份
+    ("year", _YEAR_RE),
+)
+
+
+# 预编译正则表达式，匹配小括号、中括号、全角括号等
+_BRACKET_PATTERN = re.compile(r'\(([^)]*)\)|\[([^]]*)\]|（([^）]*)）|【([^】]*)】')
+
+
+@lru_cache(maxsize=8192)
+def _extract_brackets(text: str) -> Tuple[str, ...]:
+    """
+    从文本中提取非空的括号内容（缓存版本，供BracketMatcher.extract_brackets调用）
+
+    Args:
+        text: 输入文本
+
+    Returns:
+        Tuple[str, ...]: 括号内容元组
+    """
+    result = []
+    for match_groups in _BRACKET_PATTERN.findall(text):
+        # findall返回的是元组，每个元组对应多个模式分组
+        # 每个元组中只有一个分组会有内容，其他为空字符串
+        content = next((group for group in match_groups if group), "")
+        if content.strip():  # 忽略空内容
+            result.append(content)
+    return tuple(result)
+
+
+# 使用LRU缓存优化括号内容归一化
+# 同样的短字符串（如"Live"、"Remix"）在一次歌单导入中会被反复归一化
+@lru_cache(maxsize=8192)
+def _normalized(content: str) -> str:
+    """
+    对括号内容执行完整归一化并压缩多余空格
+
+    Args:
+        content: 原始括号内容
+
+    Returns:
+        str: 归一化后的括号内容
+    """
+    # normalize_text已经将文本转换为小写，结果可直接用于大小写不敏感的检测
+    content = normalize_text(content)
+    return _WS_RE.sub(' ', content).strip()
+
+
+# 括号类型识别只依赖于内容本身，可以安全地缓存
+@lru_cache(maxsize=8192)
+def _classify_bracket_type(content: str) -> str:
+    """
+    根据括号内容识别其类型（缓存版本，供BracketMatcher调用）
+
+    Args:
+        content: 已转换为小写的括号内容
+
+    Returns:
+        str: 括号类型，如"live"、"remix"、"feat"等
+    """
+    if not content:
+        return "other"
+
+    # 按优先级依次检查各类型，每个类型只需一次C层面的正则扫描
+    for bracket_type, pattern in _BRACKET_TYPE_RULES:
+        if pattern.search(content):
+            return bracket_type
+
+    # 默认为其他类型
+    return "other"
+
+
+# 类型识别与别名提取扫描的是同一段括号内容，合并为一次缓存调用
+@lru_cache(maxsize=8192)
+def _analyze_bracket(content: str) -> Tuple[str, Optional[str]]:
+    """
+    对归一化后的括号内容同时完成类型识别和别名提取
+
+    Args:
+        content: 归一化后的括号内容
+
+    Returns:
+        Tuple[str, Optional[str]]: (括号类型, 别名)，未识别到别名时别名为None
+    """
+    match = _ALIAS_RE.search(content)
+    alias = match.group(1).strip() if match else None
+    return _classify_bracket_type(content), alias or None
+
+
+# feat艺术家解析只依赖括号原文，候选括号在多次比较间重复出现，结果可直接缓存
+@lru_cache(maxsize=8192)
+def _extract_feat_artists(content: str) -> Tuple[str, ...]:
+    """
+    从feat括号内容中解析合作艺术家列表（缓存版本，供BracketMatcher调用）
+
+    Args:
+        content: 原始括号内容，如"feat. Artist A & Artist B"
+
+    Returns:
+        Tuple[str, ...]: 小写形式的艺术家名称元组
+    """
+    content = _FEAT_PREFIX_RE.sub('', content.lower())
+    artists = (a.strip() for a in _ARTIST_SEP_RE.split(content))
+    return tuple(artist for artist in artists if artist)
+
+
+class _BracketState(NamedTuple):
+    """
+    单个标题的括号预处理结果
+
+    由BracketMatcher._prepare生成，同一标题与多个候选比较时只需计算一次。
+    """
+    title: str                    # 原始标题
+    brackets: List[str]           # 原始括号内容
+    normalized: List[str]         # 归一化后的括号内容
+    types: List[str]              # 归一化括号内容对应的类型
+    importances: List[float]      # 各括号类型的重要性权重
+    aliases: Dict[int, str]       # 别名括号的序号 -> 提取出的别名
+    keywords: Dict[str, float]    # 检测到的关键词及其权重
+    feat_artists: Dict[int, Tuple[str, ...]]  # feat括号的序号 -> 预先解析的合作艺术家
+    expanded_keywords: Dict[str, float]  # 包含同义词的扩展关键词及其权重
+    keyword_mask: int             # 扩展关键词集合的位掩码
 
 
 class BracketMatcher:
@@ -30,7 +202,7 @@ class BracketMatcher:
     """
 
     # 预编译正则表达式，匹配小括号、中括号、全角括号等
-    BRACKET_PATTERN = re.compile(r'\(([^)]*)\)|\[([^]]*)\]|（([^）]*)）|【([^】]*)】')
+    BRACKET_PATTERN = _BRACKET_PATTERN
 
     def __init__(self, bracket_weight: float = 0.3, keyword_bonus: float = 5.0,
                  threshold: float = 70.0):
@@ -118,6 +290,15 @@ class BracketMatcher:
             "track": 1.0,          # 音轨标记
         }
         
+        # 预先转换关键词为小写：(序号, 小写关键词, 关键词, 权重)
+        self._keyword_entries = tuple(
+            (index, keyword.lower(), keyword, weight)
+            for index, (keyword, weight) in enumerate(self.keywords.items())
+        )
+        
+        # 基于全部关键词构建Aho-Corasick自动机，一次扫描即可找出所有命中的关键词
+        self._keyword_automaton = self._build_keyword_automaton()
+        
         # 特殊关键词映射，用于处理相似概念的不同表达
         self.keyword_mappings = {
             "live": ["现场", "演唱会", "音乐会", "concert", "live", "live version", "live recording", "在线", "現場"],
@@ -129,8 +310,24 @@ class BracketMatcher:
             "alias": ["又名", "别名", "aka", "also known as", "原名", "原名为", "原名是"],
         }
         
-        # 初始化文本归一化器
-        self.text_normalizer = TextNormalizer()
+        # 预先展开关键词映射：每个关键词对应的同义词元组（去重并保持原有顺序）
+        # 关键词映射是静态的，无需在每次计算关键词加分时重新遍历
+        self._keyword_variants = {
+            keyword: tuple(dict.fromkeys(variants))
+            for keyword, variants in self.keyword_mappings.items()
+        }
+        
+        # 为关键词及其全部同义词各分配一个比特位，扩展关键词集合可表示为一个整数位掩码
+        # 求交集只需一次按位与运算，没有共同关键词时可直接跳过加分计算
+        self._bit_terms = tuple(dict.fromkeys(
+            [*self.keywords,
+             *(v for variants in self._keyword_variants.values() for v in variants)]
+        ))
+        self._term_bits = {term: 1 << index
+                           for index, term in enumerate(self._bit_terms)}
+        
+        # 复用进程内共享的默认文本归一化器，避免每个实例各自创建OpenCC转换器和编译模式
+        self.text_normalizer = _get_normalizer()
         
         # 定义括号类型权重 - 用于确定不同类型的括号在相似度计算中的重要性
         self.bracket_type_weights = {
@@ -147,7 +344,27 @@ class BracketMatcher:
         }
         
         # 记录初始化参数
-        logging.info(f"[括号匹配] 初始化BracketMatcher - 权重={bracket_weight:.2f}, 关键词加分={keyword_bonus:.2f}, 阈值={threshold:.2f}")
+        logging.info("[括号匹配] 初始化BracketMatcher - 权重=%.2f, 关键词加分=%.2f, 阈值=%.2f",
+                     bracket_weight, keyword_bonus, threshold)
+
+    def _build_keyword_automaton(self):
+        """
+        构建关键词检测使用的Aho-Corasick自动机
+        
+        关键词表是静态的，自动机只需在初始化时构建一次。每个关键词的负载为
+        (序号, 关键词, 权重)，序号用于保持与关键词表一致的检测顺序。
+
+        Returns:
+            ahocorasick.Automaton: 构建完成的自动机，如果pyahocorasick不可用则返回None
+        """
+        if not AHOCORASICK_AVAILABLE:
+            return None
+        
+        automaton = ahocorasick.Automaton()
+        for index, keyword_lower, keyword, weight in self._keyword_entries:
+            automaton.add_word(keyword_lower, (index, keyword, weight))
+        automaton.make_automaton()
+        return automaton
 
     def extract_brackets(self, text: str) -> List[str]:
         """
@@ -167,19 +384,10 @@ class BracketMatcher:
         if not text:
             return []
         
-        # 使用预编译正则表达式匹配所有类型的括号
-        matches = self.BRACKET_PATTERN.findall(text)
-        
-        # 处理结果
-        result = []
-        for match_groups in matches:
-            # findall返回的是元组，每个元组对应多个模式分组
-            # 每个元组中只有一个分组会有内容，其他为空字符串
-            content = next((group for group in match_groups if group), "")
-            if content.strip():  # 忽略空内容
-                result.append(content)
+        # 提取结果经过模块级LRU缓存，同一标题（如批量匹配中的输入标题）只解析一次
+        result = list(_extract_brackets(text))
                 
-        logging.info(f"[括号提取] 从文本 '{text}' 提取到括号内容: {result if result else '无'}")
+        logging.info("[括号提取] 从文本 '%s' 提取到括号内容: %s", text, result if result else '无')
         return result
 
     def normalize_bracket_content(self, bracket_content: str) -> str:
@@ -190,30 +398,27 @@ class BracketMatcher:
             bracket_content: 括号内容
 
         Returns:
-            str: 归一化后的括号内容
+            str: 归一化后的括号内容（已转换为小写）
         """
         # 使用增强的文本归一化，确保完整的标准化流程
         # 包括全角转半角、简繁体转换、大小写标准化等
         
         # 记录原始内容
-        original_content = bracket_content
-        logging.debug(f"归一化括号内容: 原始='{original_content}'")
+        logging.debug("归一化括号内容: 原始='%s'", bracket_content)
         
         # 应用全面的归一化处理
         try:
-            # 使用TextNormalizer中的normalize_text方法进行全面标准化
-            content = normalize_text(bracket_content)
-        
-            # 处理多余空格，确保只有一个空格
-            content = re.sub(r'\s+', ' ', content).strip()
+            # 使用TextNormalizer中的normalize_text方法进行全面标准化，
+            # 并处理多余空格；结果经过LRU缓存，相同内容只归一化一次
+            content = _normalized(bracket_content)
             
-            logging.debug(f"归一化括号内容: 结果='{content}'")
+            logging.debug("归一化括号内容: 结果='%s'", content)
             
             return content
         except Exception as e:
-            logging.error(f"括号内容归一化失败: {e}")
-            # 出现异常时返回原始内容，避免影响正常流程
-            return bracket_content
+            logging.error("括号内容归一化失败: %s", e)
+            # 出现异常时返回原始内容的小写形式，避免影响正常流程
+            return bracket_content.lower()
 
     def extract_alias(self, bracket_content: str) -> str:
         """
@@ -230,40 +435,55 @@ class BracketMatcher:
         # 首先标准化括号内容
         content = self.normalize_bracket_content(bracket_content)
         
-        # 匹配中文常见别名指示词
-        chinese_indicators = ["又名", "别名", "别称", "原名"]
-        for indicator in chinese_indicators:
-            if indicator in content:
-                # 尝试各种分隔方式（冒号、空格或直接连接）
-                parts = None
-                # 尝试"又名："形式
-                if f"{indicator}:" in content:
-                    parts = content.split(f"{indicator}:", 1)
-                # 尝试"又名 "形式
-                elif f"{indicator} " in content:
-                    parts = content.split(f"{indicator} ", 1)
-                # 尝试直接相连的形式"又名XXX"
-                elif indicator in content:
-                    parts = content.split(indicator, 1)
-                    
-                if parts and len(parts) > 1:
-                    alias = parts[1].strip()
-                    logging.debug(f"从'{content}'中提取到中文别名: '{alias}'")
-                    return alias
-        
-        # 匹配英文常见别名指示词
-        english_indicators = ["aka", "also known as", "alternate title", "original"]
-        for indicator in english_indicators:
-            if indicator in content:
-                parts = content.split(indicator, 1)
-                if len(parts) > 1:
-                    alias = parts[1].strip()
-                    logging.debug(f"从'{content}'中提取到英文别名: '{alias}'")
-                    return alias
+        # 与类型识别共用同一份缓存的联合分析结果
+        alias = _analyze_bracket(content)[1]
+        if alias:
+            logging.debug("从'%s'中提取到别名: '%s'", content, alias)
+            return alias
         
         # 未识别到别名模式
         return None
 
+    def extract_feat_artists(self, bracket_content: str) -> List[str]:
+        """
+        从feat括号内容中提取合作艺术家列表
+
+        处理格式如 "(feat. A & B)", "(ft. A, B)", "(with A)" 等
+
+        Args:
+            bracket_content: 括号内容
+
+        Returns:
+            List[str]: 小写形式的艺术家名称列表
+        """
+        if not bracket_content:
+            return []
+        return list(_extract_feat_artists(bracket_content))
+
+    def calculate_feat_artist_similarity(self, input_artists: List[str],
+                                         candidate_artists: List[str]) -> float:
+        """
+        计算两组feat艺术家的相似度
+
+        对每位输入艺术家取其与候选艺术家的最高相似度，再求平均值。
+
+        Args:
+            input_artists: 输入括号中的艺术家列表
+            candidate_artists: 候选括号中的艺术家列表
+
+        Returns:
+            float: 相似度分数（0-100），任一方为空时返回0
+        """
+        if not input_artists or not candidate_artists:
+            return 0.0
+
+        best_matches = [
+            max(fuzz.token_set_ratio(input_artist, candidate_artist)
+                for candidate_artist in candidate_artists)
+            for input_artist in input_artists
+        ]
+        return sum(best_matches) / len(best_matches)
+
     def detect_keywords(self, bracket_contents: List[str]) -> Dict[str, float]:
         """
         在括号内容中检测关键词
@@ -282,17 +502,29 @@ class BracketMatcher:
         detected_keywords = {}
         
         for content in bracket_contents:
-            normalized = self.normalize_bracket_content(content).lower()
+            # 归一化结果已经是小写，无需再次转换
+            normalized = self.normalize_bracket_content(content)
+            
+            if self._keyword_automaton is not None:
+                # 一次从左到右的扫描找出所有命中的关键词（包括相互重叠的关键词），
+                # 再按关键词表顺序排列，保证结果与逐个检测一致
+                hits = sorted({payload for _, payload
+                               in self._keyword_automaton.iter(normalized)})
+            else:
+                hits = [(index, keyword, weight)
+                        for index, keyword_lower, keyword, weight
+                        in self._keyword_entries
+                        if keyword_lower in normalized]
             
-            for keyword, weight in self.keywords.items():
-                if keyword.lower() in normalized:
-                    detected_keywords[keyword] = weight
-                    logging.info(f"[关键词检测] 在 '{content}' 中检测到关键词 '{keyword}'，权重 {weight:.2f}")
+            for _, keyword, weight in hits:
+                detected_keywords[keyword] = weight
+                logging.info("[关键词检测] 在 '%s' 中检测到关键词 '%s'，权重 %.2f",
+                             content, keyword, weight)
                     
         if not detected_keywords:
-            logging.debug(f"[关键词检测] 在括号内容 {bracket_contents} 中未检测到关键词")
+            logging.debug("[关键词检测] 在括号内容 %s 中未检测到关键词", bracket_contents)
         else:
-            logging.info(f"[关键词检测] 检测到的关键词: {list(detected_keywords.keys())}")
+            logging.info("[关键词检测] 检测到的关键词: %s", list(detected_keywords.keys()))
                     
         return detected_keywords
 
@@ -312,6 +544,27 @@ class BracketMatcher:
         Returns:
             float: 相似度分数（0-100）
         """
+        return self._bracket_similarity(self._prepare_brackets(input_brackets),
+                                        self._prepare_brackets(candidate_brackets))
+
+    def _bracket_similarity(self, input_state: _BracketState,
+                            candidate_state: _BracketState) -> float:
+        """
+        基于预处理结果计算两组括号内容的相似度
+
+        Args:
+            input_state: 输入歌曲的括号预处理结果
+            candidate_state: 候选歌曲的括号预处理结果
+
+        Returns:
+            float: 相似度分数（0-100）
+        """
+        input_brackets = input_state.brackets
+        candidate_brackets = candidate_state.brackets
+        
+        # 在函数入口判断一次DEBUG级别是否启用，避免在热循环中构建不会输出的日志字符串
+        debug_enabled = logging.getLogger().isEnabledFor(logging.DEBUG)
+        
         if not input_brackets and not candidate_brackets:
             # 如果两者都没有括号内容，返回满分以不影响基本得分
             logging.debug("输入和候选均无括号内容，返回满分以不影响基础得分")
@@ -335,46 +588,53 @@ class BracketMatcher:
             adjusted_score = base_score + adjustment
             
             # 详细日志记录不平衡情况
-            missing_side = "输入" if not input_brackets else "候选"
-            present_side = "候选" if not input_brackets else "输入"
-            
-            logging.debug(f"括号内容不平衡: {missing_side}无括号，{present_side}有括号")
-            logging.debug(f"括号类型分析: {bracket_types}")
-            for i, (br_type, weight) in enumerate(zip(bracket_types, importance_weights)):
-                br_content = brackets_to_analyze[i]
-                logging.debug(f"  括号内容[{i}]: '{br_content}' (类型={br_type}, 重要性={weight:.2f})")
-            
-            logging.debug(f"平均重要性: {avg_importance:.2f}, 基础分={base_score}, 调整={adjustment:+.2f}")
-            logging.debug(f"最终括号相似度分数: {adjusted_score:.2f}")
+            if debug_enabled:
+                missing_side = "输入" if not input_brackets else "候选"
+                present_side = "候选" if not input_brackets else "输入"
+                
+                logging.debug("括号内容不平衡: %s无括号，%s有括号", missing_side, present_side)
+                logging.debug("括号类型分析: %s", bracket_types)
+                for i, (br_type, weight) in enumerate(zip(bracket_types,
+                                                          importance_weights)):
+                    br_content = brackets_to_analyze[i]
+                    logging.debug("  括号内容[%s]: '%s' (类型=%s, 重要性=%.2f)",
+                                  i, br_content, br_type, weight)
+                
+                logging.debug("平均重要性: %.2f, 基础分=%s, 调整=%+.2f",
+                              avg_importance, base_score, adjustment)
+                logging.debug("最终括号相似度分数: %.2f", adjusted_score)
             
             return adjusted_score
             
-        # 归一化所有括号内容
-        normalized_inputs = [self.normalize_bracket_content(b) for b in input_brackets]
-        normalized_candidates = [self.normalize_bracket_content(b) for b in candidate_brackets]
-        
-        logging.debug(f"括号内容比较:")
-        logging.debug(f"  输入括号: {normalized_inputs}")
-        logging.debug(f"  候选括号: {normalized_candidates}")
-        
-        # 检查是否有别名指示词
-        input_aliases = {}
-        for i, input_bracket in enumerate(input_brackets):
-            alias = self.extract_alias(input_bracket)
-            if alias:
-                input_aliases[i] = alias
-        
-        candidate_aliases = {}
-        for i, candidate_bracket in enumerate(candidate_brackets):
-            alias = self.extract_alias(candidate_bracket)
-            if alias:
-                candidate_aliases[i] = alias
-        
-        # 记录找到的别名
-        if input_aliases:
-            logging.debug(f"  输入括号中的别名: {input_aliases}")
-        if candidate_aliases:
-            logging.debug(f"  候选括号中的别名: {candidate_aliases}")
+        # 使用预处理好的归一化括号内容、类型和别名
+        normalized_inputs = input_state.normalized
+        normalized_candidates = candidate_state.normalized
+        input_aliases = input_state.aliases
+        candidate_aliases = candidate_state.aliases
+        
+        if debug_enabled:
+            logging.debug("括号内容比较:")
+            logging.debug("  输入括号: %s", normalized_inputs)
+            logging.debug("  候选括号: %s", normalized_candidates)
+            
+            # 记录找到的别名
+            if input_aliases:
+                logging.debug("  输入括号中的别名: %s", input_aliases)
+            if candidate_aliases:
+                logging.debug("  候选括号中的别名: %s", candidate_aliases)
+        
+        # 候选侧的数据与输入括号无关，在双重循环外一次性整理好并跳过空内容
+        # (序号, 归一化内容, 类型, 别名)，别名字典只保存非空别名，因此None表示非别名括号
+        candidate_entries = [
+            (j, candidate, candidate_state.types[j], candidate_aliases.get(j))
+            for j, candidate in enumerate(normalized_candidates)
+            if candidate.strip()
+        ]
+        
+        # 将评分函数绑定为局部变量，减少内层循环中的属性查找
+        token_set_ratio = fuzz.token_set_ratio
+        ratio = fuzz.ratio
+        partial_ratio = fuzz.partial_ratio
         
         # 为每个输入括号找到最佳匹配的候选括号
         overall_scores = []
@@ -382,77 +642,84 @@ class BracketMatcher:
             if not input_bracket.strip():
                 continue
 
-            # 分类当前括号类型
-            input_type = self.classify_bracket_type(input_bracket)
-            input_importance = self.bracket_type_weights.get(input_type, 0.4)
+            # 当前括号类型
+            input_type = input_state.types[i]
+            input_importance = input_state.importances[i]
             
-            logging.debug(f"\n  输入括号[{i}]: '{input_bracket}' (类型={input_type}, 重要性={input_importance:.2f})")
+            if debug_enabled:
+                logging.debug("\n  输入括号[%s]: '%s' (类型=%s, 重要性=%.2f)",
+                              i, input_bracket, input_type, input_importance)
             
             # 检查是否是别名括号
-            is_input_alias = i in input_aliases
             input_alias = input_aliases.get(i)
+            is_input_alias = input_alias is not None
+            is_input_feat = input_type == "feat"
             
             best_score = 0
             best_candidate_idx = -1
             best_candidate_type = ""
-            comparison_details = []
             
-            for j, candidate in enumerate(normalized_candidates):
-                if not candidate.strip():
-                    continue
-                    
-                # 分类候选括号类型
-                candidate_type = self.classify_bracket_type(candidate)
-                
-                # 检查是否是别名括号
-                is_candidate_alias = j in candidate_aliases
-                candidate_alias = candidate_aliases.get(j)
-                
-                # 标准相似度计算
-                token_set_score = fuzz.token_set_ratio(input_bracket, candidate)
-                ratio_score = fuzz.ratio(input_bracket, candidate)
-                partial_score = fuzz.partial_ratio(input_bracket, candidate)
-                
-                # 标准相似度分数
-                score = max(token_set_score, ratio_score, partial_score)
-                score_detail = f"基础分={score:.2f}"
+            for j, candidate, candidate_type, candidate_alias in candidate_entries:
+                # 标准相似度分数：取token_set、ratio、partial三种算法的最大值
+                # 完全相同的内容直接满分；否则依次计算，一旦达到满分即跳过其余算法
+                if input_bracket == candidate:
+                    score = 100
+                else:
+                    score = token_set_ratio(input_bracket, candidate)
+                    if score < 100:
+                        score = max(score, ratio(input_bracket, candidate))
+                    if score < 100:
+                        score = max(score, partial_ratio(input_bracket, candidate))
+                base_bracket_score = score
                 
                 # 类型匹配加分
                 type_bonus = 0
                 if input_type == candidate_type:
                     type_bonus = 10
                     score += type_bonus
-                    score_detail += f", 类型匹配加分={type_bonus:+.2f}"
                 
                 # 别名处理 - 如果双方都是别名指示符格式
-                alias_score_detail = ""
-                if is_input_alias and is_candidate_alias:
+                alias_score = None
+                alias_adjustment = 0.0
+                if is_input_alias and candidate_alias is not None:
                     # 比较两个别名的相似度
-                    alias_score = fuzz.token_set_ratio(input_alias, candidate_alias)
+                    alias_score = token_set_ratio(input_alias, candidate_alias)
                     old_score = score
                     # 别名相似度高则提升总分，用加权平均
                     if alias_score > 70:  # 别名有一定相似度
                         score = score * 0.3 + alias_score * 0.7  # 更重视别名匹配
-                        alias_score_detail = f", 别名相似度={alias_score:.2f}, 调整={score-old_score:+.2f}"
+                        alias_adjustment = score - old_score
+                    else:
+                        alias_score = None
                 
                 # 特殊处理feat艺术家
-                feat_score_detail = ""
-                if input_type == "feat" and candidate_type == "feat":
-                    input_artists = self.extract_feat_artists(input_brackets[i])
-                    candidate_artists = self.extract_feat_artists(candidate_brackets[j])
+                feat_score = 0
+                feat_adjustment = 0.0
+                if is_input_feat and candidate_type == "feat":
+                    # 艺术家列表已在预处理阶段解析，避免对每个候选重复解析
+                    input_artists = input_state.feat_artists[i]
+                    candidate_artists = candidate_state.feat_artists[j]
                     feat_score = self.calculate_feat_artist_similarity(input_artists, candidate_artists)
                     
                     # 根据feat艺术家相似度调整分数
                     if feat_score > 0:
                         old_score = score
                         score = score * 0.3 + feat_score * 0.7  # 更重视艺术家匹配
-                        feat_score_detail = f", feat艺术家分={feat_score:.2f}, 调整={score-old_score:+.2f}"
+                        feat_adjustment = score - old_score
                 
-                # 记录每次比较的详情
-                comparison_details.append(
-                    f"    与候选[{j}] '{candidate}' (类型={candidate_type}): " +
-                    f"分数={score:.2f} [{score_detail}{feat_score_detail}{alias_score_detail}]"
-                )
+                # 记录每次比较的详情（仅在DEBUG级别启用时构建日志字符串）
+                if debug_enabled:
+                    score_detail = f"基础分={base_bracket_score:.2f}"
+                    if type_bonus:
+                        score_detail += f", 类型匹配加分={type_bonus:+.2f}"
+                    if feat_score > 0:
+                        score_detail += (f", feat艺术家分={feat_score:.2f}, "
+                                         f"调整={feat_adjustment:+.2f}")
+                    if alias_score is not None:
+                        score_detail += (f", 别名相似度={alias_score:.2f}, "
+                                         f"调整={alias_adjustment:+.2f}")
+                    logging.debug("    与候选[%s] '%s' (类型=%s): 分数=%.2f [%s]",
+                                  j, candidate, candidate_type, score, score_detail)
                 
                 if score > best_score:
                     best_score = score
@@ -460,16 +727,14 @@ class BracketMatcher:
                     best_candidate_type = candidate_type
             
             # 记录为当前输入括号找到的最佳匹配
-            if comparison_details:
-                for detail in comparison_details:
-                    logging.debug(detail)
-                
+            if debug_enabled:
                 if best_candidate_idx >= 0:
-                    logging.debug(f"  最佳匹配: 候选括号[{best_candidate_idx}] " +
-                                 f"'{normalized_candidates[best_candidate_idx]}' " +
-                                 f"(类型={best_candidate_type}), 分数={best_score:.2f}")
+                    logging.debug("  最佳匹配: 候选括号[%s] '%s' (类型=%s), 分数=%.2f",
+                                  best_candidate_idx,
+                                  normalized_candidates[best_candidate_idx],
+                                  best_candidate_type, best_score)
                 else:
-                    logging.debug(f"  未找到匹配")
+                    logging.debug("  未找到匹配")
 
             if best_score > 0:  # 只添加有效的分数
                 # 根据括号重要性加权
@@ -477,7 +742,7 @@ class BracketMatcher:
         
         # 如果没有有效的分数，返回中等分数，避免过度惩罚
         if not overall_scores:
-            logging.debug(f"没有有效的括号匹配，返回默认分数70.0")
+            logging.debug("没有有效的括号匹配，返回默认分数70.0")
             return 70.0
             
         # 计算加权平均分数 - 重要性高的括号获得更高权重
@@ -485,11 +750,13 @@ class BracketMatcher:
         weighted_avg = sum(score * weight for score, weight in overall_scores) / total_weight
         
         # 记录最终的加权计算过程
-        logging.debug(f"\n括号得分汇总:")
-        for i, (score, weight) in enumerate(overall_scores):
-            logging.debug(f"  括号[{i}]: 分数={score:.2f}, 重要性权重={weight:.2f}, 贡献={score*weight/total_weight:.2f}")
-        
-        logging.debug(f"括号内容加权相似度最终分数: {weighted_avg:.2f} (总权重={total_weight:.2f})")
+        if debug_enabled:
+            logging.debug("\n括号得分汇总:")
+            for i, (score, weight) in enumerate(overall_scores):
+                logging.debug("  括号[%s]: 分数=%.2f, 重要性权重=%.2f, 贡献=%.2f",
+                              i, score, weight, score*weight/total_weight)
+            
+            logging.debug("括号内容加权相似度最终分数: %.2f (总权重=%.2f)", weighted_avg, total_weight)
         
         return weighted_avg
 
@@ -509,51 +776,91 @@ class BracketMatcher:
         Returns:
             float: 额外加分（0+）
         """
-        # 检测关键词
-        input_keywords = self.detect_keywords(input_brackets)
-        candidate_keywords = self.detect_keywords(candidate_brackets)
-        
+        # 检测关键词并展开同义词
+        input_keywords = self._expand_keywords(self.detect_keywords(input_brackets))
+        candidate_keywords = self._expand_keywords(
+            self.detect_keywords(candidate_brackets))
+        
+        return self._keyword_bonus(input_keywords, self._keyword_mask(input_keywords),
+                                   candidate_keywords,
+                                   self._keyword_mask(candidate_keywords))
+
+    def _keyword_bonus(self, input_keywords: Dict[str, float], input_mask: int,
+                       candidate_keywords: Dict[str, float],
+                       candidate_mask: int) -> float:
+        """
+        根据双方已展开的关键词及其位掩码计算额外加分
+
+        Args:
+            input_keywords: 输入歌曲的扩展关键词及其权重
+            input_mask: 输入歌曲扩展关键词的位掩码
+            candidate_keywords: 候选歌曲的扩展关键词及其权重
+            candidate_mask: 候选歌曲扩展关键词的位掩码
+
+        Returns:
+            float: 额外加分（0+）
+        """
         # 如果没有关键词，返回0
         if not input_keywords or not candidate_keywords:
             logging.info("[关键词加分] 输入或候选没有检测到关键词，不加分")
             return 0.0
             
-        # 准备关键词映射，用于匹配相似概念
-        extended_input_keywords = {}
-        for keyword, weight in input_keywords.items():
-            extended_input_keywords[keyword] = weight
-            # 添加同义词
-            if keyword in self.keyword_mappings:
-                for variant in self.keyword_mappings[keyword]:
-                    if variant not in extended_input_keywords:
-                        extended_input_keywords[variant] = weight
-            
-        extended_candidate_keywords = {}
-        for keyword, weight in candidate_keywords.items():
-            extended_candidate_keywords[keyword] = weight
-            # 添加同义词
-            if keyword in self.keyword_mappings:
-                for variant in self.keyword_mappings[keyword]:
-                    if variant not in extended_candidate_keywords:
-                        extended_candidate_keywords[variant] = weight
-                        
-        # 计算匹配关键词的额外加分
+        # 按位与得到双方共同的关键词，逐个取出最低位的比特计算加分
         bonus = 0.0
-        for keyword, weight in extended_input_keywords.items():
-            if keyword in extended_candidate_keywords:
-                match_bonus = min(weight, extended_candidate_keywords[keyword]) * self.keyword_bonus
-                bonus += match_bonus
-                logging.info(f"[关键词加分] 关键词 '{keyword}' 匹配成功，加分 {match_bonus:.2f}")
-            else:
-                logging.debug(f"[关键词加分] 关键词 '{keyword}' 在候选中未找到")
+        common = input_mask & candidate_mask
+        while common:
+            bit = common & -common
+            keyword = self._bit_terms[bit.bit_length() - 1]
+            match_bonus = (min(input_keywords[keyword], candidate_keywords[keyword])
+                           * self.keyword_bonus)
+            bonus += match_bonus
+            logging.info("[关键词加分] 关键词 '%s' 匹配成功，加分 %.2f", keyword, match_bonus)
+            common ^= bit
                 
         if bonus == 0.0:
             logging.info("[关键词加分] 没有找到匹配的关键词，不加分")
         else:
-            logging.info(f"[关键词加分] 总加分: {bonus:.2f}")
+            logging.info("[关键词加分] 总加分: %.2f", bonus)
                 
         return bonus
 
+    def _expand_keywords(self, keywords: Dict[str, float]) -> Dict[str, float]:
+        """
+        将检测到的关键词扩展为包含同义词的关键词字典
+        
+        关键词本身总是使用自己的权重；同义词沿用触发它的关键词的权重，
+        已存在的条目不会被同义词覆盖。
+
+        Args:
+            keywords: 检测到的关键词及其权重
+
+        Returns:
+            Dict[str, float]: 扩展后的关键词及其权重
+        """
+        extended = {}
+        for keyword, weight in keywords.items():
+            extended[keyword] = weight
+            # 添加同义词
+            for variant in self._keyword_variants.get(keyword, ()):
+                if variant not in extended:
+                    extended[variant] = weight
+        return extended
+
+    def _keyword_mask(self, keywords: Dict[str, float]) -> int:
+        """
+        计算扩展关键词集合的位掩码
+
+        Args:
+            keywords: 扩展后的关键词及其权重
+
+        Returns:
+            int: 各关键词对应比特位按位或的结果
+        """
+        mask = 0
+        for keyword in keywords:
+            mask |= self._term_bits[keyword]
+        return mask
+
     def calculate_final_score(self, base_score: float, bracket_score: float, 
                              keyword_bonus: float) -> float:
         """
@@ -578,16 +885,18 @@ class BracketMatcher:
         bracket_contribution = 0.0
         if bracket_score >= self.threshold:
             bracket_contribution = bracket_score * self.bracket_weight
-            logging.info(f"[最终得分] 括号得分 {bracket_score:.2f} 超过阈值 {self.threshold:.2f}，贡献为 {bracket_contribution:.2f}")
+            logging.info("[最终得分] 括号得分 %.2f 超过阈值 %.2f，贡献为 %.2f",
+                         bracket_score, self.threshold, bracket_contribution)
         else:
-            logging.info(f"[最终得分] 括号得分 {bracket_score:.2f} 未超过阈值 {self.threshold:.2f}，不计入")
+            logging.info("[最终得分] 括号得分 %.2f 未超过阈值 %.2f，不计入",
+                         bracket_score, self.threshold)
             
         # 计算最终得分
         final_score = base_score + bracket_contribution + keyword_bonus
         
         # 记录得分组成
-        logging.info(f"[最终得分] {final_score:.2f} = {base_score:.2f}(基础) + " +
-                     f"{bracket_contribution:.2f}(括号) + {keyword_bonus:.2f}(关键词)")
+        logging.info("[最终得分] %.2f = %.2f(基础) + %.2f(括号) + %.2f(关键词)",
+                     final_score, base_score, bracket_contribution, keyword_bonus)
         
         return min(final_score, 100.0)  # 最高分为100
 
@@ -606,34 +915,154 @@ class BracketMatcher:
         Returns:
             float: 最终匹配分数（0-100+，可能超过100，但一般会在使用前限制）
         """
-        logging.info(f"[括号匹配] 开始匹配: 输入 '{input_title}' vs 候选 '{candidate_title}', 基础分数: {base_score:.2f}")
-        
-        # 提取括号内容
-        input_brackets = self.extract_brackets(input_title)
-        candidate_brackets = self.extract_brackets(candidate_title)
+        return self.match_prepared(self._prepare(input_title), candidate_title,
+                                   base_score)
+
+    def match_batch(self, input_title: str, candidate_titles: List[str],
+                    base_scores: List[float]) -> List[float]:
+        """
+        批量计算同一输入标题与多个候选标题的最终匹配分数
+
+        输入标题只预处理一次；同一批次中重复出现的候选标题（如同一首歌的
+        不同专辑版本）也只预处理一次。
+
+        Args:
+            input_title: 输入歌曲标题
+            candidate_titles: 候选歌曲标题列表
+            base_scores: 与candidate_titles一一对应的基础字符串匹配得分
+
+        Returns:
+            List[float]: 与candidate_titles一一对应的最终匹配分数
+        """
+        input_state = self._prepare(input_title)
+        candidate_states: Dict[str, _BracketState] = {}
+
+        results = []
+        for candidate_title, base_score in zip(candidate_titles, base_scores):
+            candidate_state = candidate_states.get(candidate_title)
+            if candidate_state is None:
+                candidate_state = self._prepare(candidate_title)
+                candidate_states[candidate_title] = candidate_state
+            results.append(self._match_states(input_state, candidate_state, base_score))
+
+        return results
+
+    def match_prepared(self, input_state: _BracketState, candidate_title: str,
+                       base_score: float) -> float:
+        """
+        使用预处理好的输入标题计算最终匹配分数
         
+        与match相同，但输入标题的括号提取、归一化、类型识别和关键词检测
+        已由_prepare完成。同一输入标题与多个候选比较时，应先调用一次_prepare，
+        再对每个候选调用本方法，避免重复处理输入侧。
+
+        Args:
+            input_state: _prepare返回的输入标题预处理结果
+            candidate_title: 候选歌曲标题
+            base_score: 基本字符串匹配得分
+
+        Returns:
+            float: 最终匹配分数（0-100+，可能超过100，但一般会在使用前限制）
+        """
+        # 提取并预处理候选标题的括号内容
+        return self._match_states(input_state, self._prepare(candidate_title),
+                                  base_score)
+
+    def _match_states(self, input_state: _BracketState, candidate_state: _BracketState,
+                      base_score: float) -> float:
+        """
+        根据输入和候选双方的预处理结果计算最终匹配分数
+
+        Args:
+            input_state: 输入标题的预处理结果
+            candidate_state: 候选标题的预处理结果
+            base_score: 基本字符串匹配得分
+
+        Returns:
+            float: 最终匹配分数（0-100+，可能超过100，但一般会在使用前限制）
+        """
+        input_title = input_state.title
+        candidate_title = candidate_state.title
+        logging.info("[括号匹配] 开始匹配: 输入 '%s' vs 候选 '%s', 基础分数: %.2f",
+                     input_title, candidate_title, base_score)
+
         # 如果两者都没有括号内容，直接返回基础分数
-        if not input_brackets and not candidate_brackets:
-            logging.info(f"[括号匹配] 输入和候选均无括号内容，保持基础分数 {base_score:.2f}")
+        if not input_state.brackets and not candidate_state.brackets:
+            logging.info("[括号匹配] 输入和候选均无括号内容，保持基础分数 %.2f", base_score)
             return base_score
             
         # 计算括号内容相似度
-        bracket_score = self.calculate_bracket_similarity(input_brackets, candidate_brackets)
+        bracket_score = self._bracket_similarity(input_state, candidate_state)
         
         # 计算关键词额外加分
-        keyword_bonus = self.calculate_keyword_bonus(input_brackets, candidate_brackets)
+        keyword_bonus = self._keyword_bonus(input_state.expanded_keywords,
+                                            input_state.keyword_mask,
+                                            candidate_state.expanded_keywords,
+                                            candidate_state.keyword_mask)
         
         # 计算最终分数
         final_score = self.calculate_final_score(base_score, bracket_score, keyword_bonus)
         
-        logging.info(f"[括号匹配] 完成匹配: 输入 '{input_title}' vs 候选 '{candidate_title}', 最终分数: {final_score:.2f}")
+        logging.info("[括号匹配] 完成匹配: 输入 '%s' vs 候选 '%s', 最终分数: %.2f",
+                     input_title, candidate_title, final_score)
         
-        return final_score 
+        return final_score
+
+    def _prepare(self, title: str) -> _BracketState:
+        """
+        提取并预处理标题中的括号内容
+
+        Args:
+            title: 歌曲标题
+
+        Returns:
+            _BracketState: 标题的括号预处理结果
+        """
+        return self._prepare_brackets(self.extract_brackets(title), title)
+
+    def _prepare_brackets(self, brackets: List[str], title: str = "") -> _BracketState:
+        """
+        对括号内容列表执行归一化、类型识别、别名提取和关键词检测
+
+        Args:
+            brackets: 原始括号内容列表
+            title: 括号内容所属的标题，仅用于日志
+
+        Returns:
+            _BracketState: 括号预处理结果
+        """
+        normalized = [self.normalize_bracket_content(b) for b in brackets]
+        # 归一化内容已是小写，直接调用缓存的类型识别，跳过大小写转换
+        # 每个括号只做一次联合分析，同时得到类型和别名
+        types = []
+        aliases = {}
+        for i, content in enumerate(normalized):
+            bracket_type, alias = _analyze_bracket(content)
+            types.append(bracket_type)
+            if alias:
+                aliases[i] = alias
+
+        # 预先查好各括号类型的重要性权重，评分循环中按序号直接取用
+        importances = [self.bracket_type_weights.get(t, 0.4) for t in types]
+
+        # 仅为feat类型的括号预先解析合作艺术家
+        feat_artists = {i: _extract_feat_artists(brackets[i])
+                        for i, t in enumerate(types) if t == "feat"}
+
+        keywords = self.detect_keywords(brackets) if brackets else {}
+        # 同义词展开和位掩码每个标题只计算一次，与多个候选比较时直接复用
+        expanded_keywords = self._expand_keywords(keywords)
+        
+        return _BracketState(title, brackets, normalized, types, importances, aliases,
+                             keywords, feat_artists, expanded_keywords,
+                             self._keyword_mask(expanded_keywords))
 
     def classify_bracket_type(self, bracket_content: str) -> str:
         """
         根据括号内容识别其类型
         
+        识别规则是纯函数，结果经过模块级LRU缓存。
+        
         Args:
             bracket_content: 标准化后的括号内容
             
@@ -642,76 +1071,58 @@ class BracketMatcher:
         """
         if not bracket_content:
             return "other"
-        
-        content = bracket_content.lower()
-        
-        # 检查是否包含合作艺术家信息
-        if any(k in content for k in ["feat", "ft", "featuring", "with"]):
-            return "feat"
-        
-        # 检查是否是remix版本
-        if any(k in content for k in ["remix", "mix", "dj", "club", "extended"]):
-            return "remix"
-        
-        # 检查是否是现场版本
-        if any(k in content for k in ["live", "现场", "演唱会", "concert"]):
-            return "live"
-        
-        # 检查是否是原声版本
-        if any(k in content for k in ["acoustic", "原声", "钢琴", "吉他", "piano", "guitar"]):
-            return "acoustic"
-        
-        # 检查是否是重制版
-        if any(k in content for k in ["remaster", "重制", "修复", "高清", "hd"]):
-            return "remaster"
-        
-        # 检查是否包含版本信息
-        if any(k in content for k in ["version", "版本", "ver", "special", "deluxe"]):
-            return "version"
-        
-        # 检查是否是别名信息
-        if any(k in content for k in ["又名", "别名", "aka", "also known as", "原名"]):
-            return "alias"
-        
-        # 检查是否包含年份 - 四位数字可能是年份
-        if re.search(r'\b(19|20)\d{2}\b', content):
-            return "year"
-        
-        # 默认为其他类型
-        return "other"
+        return _classify_bracket_type(bracket_content.lower())
 
-def adjust_scores_with_brackets(matches: List[Dict[str, Any]], input_title: str) -> List[Dict[str, Any]]:
+
+@lru_cache(maxsize=1)
+def _default_bracket_matcher() -> BracketMatcher:
+    """
+    获取adjust_scores_with_brackets复用的默认BracketMatcher（首次使用时创建一次）
+    
+    BracketMatcher的状态在初始化后只读，可以安全地在多次调用之间共享；
+    延迟到首次使用时创建，导入模块时不必构建文本标准化器和关键词自动机。
+    
+    Returns:
+        BracketMatcher: 使用默认配置的括号匹配器
+    """
+    return BracketMatcher()
+
+
+def adjust_scores_with_brackets(matches: List[Dict[str, Any]], input_title: str,
+                                top_k: Optional[int] = None) -> List[Dict[str, Any]]:
     """
     使用括号匹配调整字符串匹配的分数
     
     Args:
         matches: StringMatcher计算的基础匹配结果列表
         input_title: 原始输入标题（未标准化）
+        top_k: 只返回得分最高的前k个结果，默认None表示返回全部结果
         
     Returns:
-        List[Dict[str, Any]]: 调整后的匹配结果列表
+        List[Dict[str, Any]]: 调整后的匹配结果列表，按最终得分降序排列
     """
-    # 创建BracketMatcher实例
-    bracket_matcher = BracketMatcher()
+    # 复用模块级的默认BracketMatcher实例，避免每次调用都重新初始化
+    bracket_matcher = _default_bracket_matcher()
     
     # 复制匹配结果，避免修改原始数据
     adjusted_matches = []
+    # 与adjusted_matches一一对应的最终分数，用于排序
+    final_scores = []
+    
+    logging.debug("使用括号匹配调整分数: 输入标题='%s', 匹配数量=%d", input_title, len(matches))
     
-    logging.debug(f"使用括号匹配调整分数: 输入标题='{input_title}', 匹配数量={len(matches)}")
+    # 一次性收集候选标题和基础分数，整批交给BracketMatcher计算
+    candidate_titles = [match.get("name", "") for match in matches]
+    base_scores = [match.get("similarity_scores", {}).get("weighted_score", 0)
+                   for match in matches]
+    bracket_scores = bracket_matcher.match_batch(input_title, candidate_titles,
+                                                 base_scores)
     
-    for match in matches:
+    for match, candidate_title, base_score, bracket_score in zip(
+            matches, candidate_titles, base_scores, bracket_scores):
         # 复制匹配项，避免修改原始数据
         adjusted_match = match.copy()
         
-        # 获取候选标题
-        candidate_title = match.get("name", "")
-        
-        # 获取基础分数
-        base_score = match.get("similarity_scores", {}).get("weighted_score", 0)
-        
-        # 应用括号匹配调整分数
-        bracket_score = bracket_matcher.match(input_title, candidate_title, base_score)
-        
         # 重新计算最终分数 - 确保不超过100
         final_score = min(bracket_score, 100.0)
         
@@ -723,15 +1134,25 @@ def adjust_scores_with_brackets(matches: List[Dict[str, Any]], input_title: str)
         adjusted_match["similarity_scores"]["final_score"] = final_score
         
         # 记录调整过程
-        logging.debug(f"标题匹配调整: '{candidate_title}', 基础分={base_score:.2f}, " + 
-                     f"括号调整={bracket_score-base_score:+.2f}, 最终分={final_score:.2f}")
+        logging.debug("标题匹配调整: '%s', 基础分=%.2f, 括号调整=%+.2f, 最终分=%.2f",
+                      candidate_title, base_score, bracket_score - base_score,
+                      final_score)
         
         adjusted_matches.append(adjusted_match)
+        final_scores.append(final_score)
+    
+    def final_score_key(x):
+        return x.get("similarity_scores", {}).get("final_score", 0)
+    
+    # 只需要前k个结果时使用堆选择，避免对全部结果排序
+    if top_k is not None:
+        return heapq.nlargest(top_k, adjusted_matches, key=final_score_key)
     
-    # 重新按最终得分排序
-    adjusted_matches.sort(
-        key=lambda x: x.get("similarity_scores", {}).get("final_score", 0),
-        reverse=True
-    )
+    # 输入通常已按基础分数降序排列，括号调整很少打乱顺序
+    # 先线性检查是否已有序，只有出现逆序时才重新排序（稳定排序，同分保持原有顺序）
+    if any(a < b for a, b in zip(final_scores, final_scores[1:])):
+        order = sorted(range(len(final_scores)), key=final_scores.__getitem__,
+                       reverse=True)
+        adjusted_matches = [adjusted_matches[i] for i in order]
     
     return adjusted_matches 
\ No newline at end of file
@@ -15,19 +15,47 @@
 
 import os
 import json
+import hashlib
 import logging
+import math
+import stat
+import tempfile
 from pathlib import Path
-from typing import Any, Dict, Optional, Union, List, TypeVar, Generic, cast
+from types import MappingProxyType
+from typing import (
+    Any, Callable, Dict, Mapping, Optional, Union, List, Tuple, TypeVar, Generic, cast
+)
 import sys
 
+# 有条件导入orjson，如果导入失败则回退到标准库json
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # 设置日志
 logger = logging.getLogger(__name__)
 
+
+def _json_loads(data: bytes) -> Any:
+    """解析JSON字节串，优先使用orjson"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """将对象序列化为带缩进的UTF-8 JSON字节串，优先使用orjson"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
 # 默认配置文件路径
 DEFAULT_CONFIG_PATH = "spotify_config.json"
 
-# 默认配置值
-DEFAULT_CONFIG = {
+# 默认配置值（可变的原始字典，仅在本模块内部用于构造配置副本）
+DEFAULT_CONFIG_RAW = {
     # API 相关配置
     "API_CONCURRENT_REQUESTS": 10,           # 并发请求数量
     "API_RATE_LIMIT_RETRIES": 5,             # API速率限制重试次数
@@ -49,6 +77,7 @@ DEFAULT_CONFIG = {
     "LOG_LEVEL": "INFO",                     # 日志级别
     "LOG_TO_FILE": False,                    # 是否输出日志到文件
     "LOG_FILE_PATH": "spotify_importer.log", # 日志文件路径
+    "LOG_CLASS_METHODS": False,              # 是否为带log_class_methods装饰器的类记录每次方法调用
     
     # 匹配相关配置
     "TITLE_WEIGHT": 0.7,                     # 标题匹配权重（调整为0.7，更重视标题匹配）
@@ -63,12 +92,96 @@ DEFAULT_CONFIG = {
     # 增强匹配配置
     "FIRST_STAGE_THRESHOLD": 60.0,           # 第一阶段匹配阈值
     "SECOND_STAGE_THRESHOLD": 70.0,          # 第二阶段匹配阈值
+    "MIN_TITLE_SCORE": 45.0,                 # 标题相似度下限
     
     # 其他配置
     "CACHE_ENABLED": True,                   # 是否启用缓存
     "CACHE_DIR": ".cache",                   # 缓存目录
 }
 
+# 对外暴露的只读默认配置视图，可直接引用而无需防御性复制
+DEFAULT_CONFIG = MappingProxyType(DEFAULT_CONFIG_RAW)
+
+# 有效的日志级别
+_VALID_LOG_LEVELS = frozenset(("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"))
+
+
+def _is_valid_log_level(value: Any) -> bool:
+    """检查是否为有效的日志级别"""
+    return isinstance(value, str) and value in _VALID_LOG_LEVELS
+
+
+def _is_positive_int(value: Any) -> bool:
+    """检查是否为正整数"""
+    return isinstance(value, int) and value > 0
+
+
+def _is_non_negative_number(value: Any) -> bool:
+    """检查是否为非负数值"""
+    return isinstance(value, (int, float)) and value >= 0
+
+
+# 配置键 -> 校验函数，校验失败时回退到默认值
+_VALIDATORS: Dict[str, Callable[[Any], bool]] = {
+    "LOG_LEVEL": _is_valid_log_level,
+    # 必须为正整数的配置
+    "API_CONCURRENT_REQUESTS": _is_positive_int,
+    "API_RATE_LIMIT_RETRIES": _is_positive_int,
+    "SPOTIFY_SEARCH_LIMIT": _is_positive_int,
+    "BATCH_SIZE": _is_positive_int,
+    "CONCURRENCY_LIMIT": _is_positive_int,
+    "API_MAX_RETRIES": _is_positive_int,
+    "API_TOTAL_TIMEOUT_PER_CALL_SECONDS": _is_positive_int,
+    # 必须为非负数值的配置
+    "API_BASE_DELAY": _is_non_negative_number,
+    "API_MAX_DELAY": _is_non_negative_number,
+    "TITLE_WEIGHT": _is_non_negative_number,
+    "ARTIST_WEIGHT": _is_non_negative_number,
+    "BRACKET_WEIGHT": _is_non_negative_number,
+    "MATCH_THRESHOLD": _is_non_negative_number,
+    "MIN_TITLE_SCORE": _is_non_negative_number,
+    "API_RETRY_BASE_DELAY_SECONDS": _is_non_negative_number,
+    "API_RETRY_MAX_DELAY_SECONDS": _is_non_negative_number,
+}
+
+
+# 环境变量前缀
+ENV_PREFIX = "SPOTIFY_"
+
+
+# 表示真值的环境变量取值（小写）
+_TRUE_VALUES = frozenset(("true", "1", "yes", "y", "on", "t"))
+
+
+def _as_bool(value: str) -> bool:
+    """将环境变量字符串转换为布尔值"""
+    return value.strip().lower() in _TRUE_VALUES
+
+
+def _env_parser(default_value: Any) -> Callable[[str], Any]:
+    """根据默认值的类型选择环境变量值的解析函数"""
+    # bool是int的子类，必须先于int判断
+    if isinstance(default_value, bool):
+        return _as_bool
+    if isinstance(default_value, int):
+        return int
+    if isinstance(default_value, float):
+        return float
+    return str
+
+
+# 配置键 -> 环境变量值解析函数，在模块导入时计算一次
+_ENV_PARSERS: Dict[str, Callable[[str], Any]] = {
+    key: _env_parser(value) for key, value in DEFAULT_CONFIG_RAW.items()
+}
+
+# 已解析配置文件的缓存，键为(绝对路径, 修改时间ns, 文件大小)
+# 文件内容变化时修改时间或大小随之改变，旧条目自然失效
+_FILE_CACHE: Dict[Tuple[str, int, int], Dict[str, Any]] = {}
+
+# 已确认存在的配置文件目录，保存时无需重复检查或创建
+_KNOWN_DIRS = set()
+
 
 class ConfigValidationError(Exception):
     """配置验证错误"""
@@ -78,6 +191,28 @@ class ConfigValidationError(Exception):
 class ConfigManager:
     """配置管理器类"""
     
+    # 按配置文件绝对路径缓存的共享实例
+    _INSTANCES: Dict[str, "ConfigManager"] = {}
+    
+    @classmethod
+    def instance(cls, config_path: Optional[str] = None) -> "ConfigManager":
+        """
+        获取指定配置文件对应的共享实例
+        
+        同一路径只在首次调用时加载配置，之后直接返回已创建的实例。
+        
+        Args:
+            config_path: 配置文件路径，如果为None则使用默认路径
+            
+        Returns:
+            ConfigManager: 配置管理器实例
+        """
+        key = os.path.abspath(config_path or DEFAULT_CONFIG_PATH)
+        manager = cls._INSTANCES.get(key)
+        if manager is None:
+            manager = cls._INSTANCES[key] = cls(config_path)
+        return manager
+    
     def __init__(self, config_path: Optional[str] = None):
         """
         初始化配置管理器
@@ -87,6 +222,13 @@ class ConfigManager:
         """
         self.config_path = config_path or DEFAULT_CONFIG_PATH
         self.config = self._load_config()
+        # 将get直接绑定为配置字典的get方法，读取配置时不再经过额外的Python函数调用
+        # self.config在整个生命周期内保持同一个字典对象（重置时原地更新），绑定始终有效
+        self.get = self.config.get
+        # 配置字典的只读视图，供只需读取全部配置的调用方使用，无需每次复制
+        self._view = MappingProxyType(self.config)
+        # 最近一次成功保存的内容摘要，用于跳过内容未变化的写入
+        self._last_saved_hash: Optional[bytes] = None
         
     def _load_config(self) -> Dict[str, Any]:
         """
@@ -96,7 +238,7 @@ class ConfigManager:
             Dict[str, Any]: 合并后的配置字典
         """
         # 从默认配置开始
-        config = DEFAULT_CONFIG.copy()
+        config = dict(DEFAULT_CONFIG_RAW)
         
         # 从配置文件加载
         file_config = self._load_from_file()
@@ -119,16 +261,27 @@ class ConfigManager:
         Returns:
             Dict[str, Any]: 配置文件中的配置，如果文件不存在或无法解析则返回空字典
         """
-        if not os.path.exists(self.config_path):
-            logger.debug(f"配置文件 {self.config_path} 不存在")
+        # 一次stat同时完成存在性检查并取得缓存键所需的文件信息
+        try:
+            st = os.stat(self.config_path)
+        except OSError:
+            logger.debug("配置文件 %s 不存在", self.config_path)
             return {}
+        
+        cache_key = (os.path.abspath(self.config_path), st.st_mtime_ns, st.st_size)
+        cached = _FILE_CACHE.get(cache_key)
+        if cached is not None:
+            logger.debug("使用已缓存的配置文件 %s", self.config_path)
+            return cached.copy()
             
         try:
-            with open(self.config_path, "r", encoding="utf-8") as f:
-                logger.debug(f"正在从 {self.config_path} 加载配置")
-                return json.load(f)
+            with open(self.config_path, "rb") as f:
+                logger.debug("正在从 %s 加载配置", self.config_path)
+                file_config = _json_loads(f.read())
+            _FILE_CACHE[cache_key] = file_config
+            return file_config.copy()
         except (json.JSONDecodeError, FileNotFoundError, PermissionError) as e:
-            logger.warning(f"无法加载配置文件 {self.config_path}: {e}")
+            logger.warning("无法加载配置文件 %s: %s", self.config_path, e)
             return {}
     
     def _load_from_env(self) -> Dict[str, Any]:
@@ -139,28 +292,26 @@ class ConfigManager:
             Dict[str, Any]: 从环境变量加载的配置
         """
         env_config = {}
+        prefix_length = len(ENV_PREFIX)
         
-        # 环境变量前缀
-        prefix = "SPOTIFY_"
-        
-        for key in DEFAULT_CONFIG:
-            env_key = f"{prefix}{key}"
-            env_value = os.environ.get(env_key)
+        # 只扫描一遍环境变量，挑出带前缀且对应已知配置键的条目
+        for env_key, env_value in os.environ.items():
+            if not env_key.startswith(ENV_PREFIX):
+                continue
             
-            if env_value is not None:
-                # 根据默认值的类型转换环境变量值
-                default_value = DEFAULT_CONFIG[key]
-                
-                if isinstance(default_value, bool):
-                    env_config[key] = env_value.lower() in ("true", "1", "yes", "y")
-                elif isinstance(default_value, int):
-                    env_config[key] = int(env_value)
-                elif isinstance(default_value, float):
-                    env_config[key] = float(env_value)
-                else:
-                    env_config[key] = env_value
-                    
-                logger.debug(f"从环境变量 {env_key} 加载配置: {key}={env_config[key]}")
+            key = env_key[prefix_length:]
+            parser = _ENV_PARSERS.get(key)
+            if parser is None:
+                continue
+            
+            # 根据默认值的类型转换环境变量值，无法解析时忽略该环境变量
+            try:
+                env_config[key] = parser(env_value)
+            except ValueError:
+                logger.warning("无法解析环境变量 %s=%s，将忽略该值", env_key, env_value)
+                continue
+            
+            logger.debug("从环境变量 %s 加载配置: %s=%s", env_key, key, env_config[key])
                 
         return env_config
     
@@ -174,50 +325,20 @@ class ConfigManager:
         Raises:
             ConfigValidationError: 如果配置无效
         """
-        # 验证日志级别
-        valid_log_levels = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
-        if config["LOG_LEVEL"] not in valid_log_levels:
-            warning_msg = f"无效的日志级别: {config['LOG_LEVEL']}, 使用默认值: INFO"
-            logger.warning(warning_msg)
-            config["LOG_LEVEL"] = "INFO"
-        
-        # 验证数值配置
-        for key, value in config.items():
-            if key in [
-                "API_CONCURRENT_REQUESTS", 
-                "API_RATE_LIMIT_RETRIES", 
-                "SPOTIFY_SEARCH_LIMIT", 
-                "BATCH_SIZE", 
-                "CONCURRENCY_LIMIT",
-                "API_MAX_RETRIES",
-                "API_TOTAL_TIMEOUT_PER_CALL_SECONDS"
-            ]:
-                if not isinstance(value, int) or value <= 0:
-                    warning_msg = f"无效的配置值: {key}={value}, 使用默认值: {DEFAULT_CONFIG[key]}"
-                    logger.warning(warning_msg)
-                    config[key] = DEFAULT_CONFIG[key]
-            
-            elif key in [
-                "API_BASE_DELAY", 
-                "API_MAX_DELAY", 
-                "TITLE_WEIGHT", 
-                "ARTIST_WEIGHT", 
-                "BRACKET_WEIGHT", 
-                "MATCH_THRESHOLD",
-                "API_RETRY_BASE_DELAY_SECONDS",
-                "API_RETRY_MAX_DELAY_SECONDS"
-            ]:
-                if not isinstance(value, (int, float)) or value < 0:
-                    warning_msg = f"无效的配置值: {key}={value}, 使用默认值: {DEFAULT_CONFIG[key]}"
-                    logger.warning(warning_msg)
-                    config[key] = DEFAULT_CONFIG[key]
+        # 按校验表逐项验证，每个键只需一次函数调用
+        for key, check in _VALIDATORS.items():
+            value = config.get(key)
+            if not check(value):
+                logger.warning("无效的配置值: %s=%s, 使用默认值: %s", key, value,
+                               DEFAULT_CONFIG_RAW[key])
+                config[key] = DEFAULT_CONFIG_RAW[key]
                     
         # 验证权重和阈值
-        if config["TITLE_WEIGHT"] + config["ARTIST_WEIGHT"] != 1.0:
-            warning_msg = "标题权重和艺术家权重之和应该等于1.0，将自动调整"
-            logger.warning(warning_msg)
+        # 使用math.isclose比较，避免浮点误差导致不必要的重新归一化
+        total = config["TITLE_WEIGHT"] + config["ARTIST_WEIGHT"]
+        if not math.isclose(total, 1.0):
+            logger.warning("标题权重和艺术家权重之和应该等于1.0，将自动调整")
             # 按比例调整
-            total = config["TITLE_WEIGHT"] + config["ARTIST_WEIGHT"]
             if total > 0:
                 config["TITLE_WEIGHT"] = config["TITLE_WEIGHT"] / total
                 config["ARTIST_WEIGHT"] = config["ARTIST_WEIGHT"] / total
@@ -233,25 +354,59 @@ class ConfigManager:
         Returns:
             bool: 是否成功保存
         """
+        data = _json_dumps(self.config)
+        digest = hashlib.blake2b(data, digest_size=16).digest()
+        
+        # 内容与上次保存时相同且文件仍在，跳过写入，避免无谓的磁盘IO和修改时间变化
+        if digest == self._last_saved_hash and os.path.exists(self.config_path):
+            logger.debug("配置未变化，跳过保存 %s", self.config_path)
+            return True
+        
         try:
             # 创建目录（如果不存在）
             directory = os.path.dirname(self.config_path)
-            if directory and not os.path.exists(directory):
-                os.makedirs(directory)
-                
-            with open(self.config_path, "w", encoding="utf-8") as f:
-                json.dump(self.config, f, indent=4, ensure_ascii=False)
-                
-            logger.info(f"配置已保存到 {self.config_path}")
+            if directory and directory not in _KNOWN_DIRS:
+                os.makedirs(directory, exist_ok=True)
+                _KNOWN_DIRS.add(directory)
+            
+            # 先写入唯一的临时文件再原子替换，避免并发读取到写了一半的配置，
+            # 多个进程同时保存时也不会互相截断对方的临时文件
+            fd, temp_path = tempfile.mkstemp(
+                dir=directory or os.curdir,
+                prefix=f"{os.path.basename(self.config_path)}.",
+                suffix=".tmp",
+            )
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(data)
+                # mkstemp创建的文件仅所有者可读写，沿用原配置文件的权限（新文件用0o644）
+                try:
+                    mode = stat.S_IMODE(os.stat(self.config_path).st_mode)
+                except FileNotFoundError:
+                    mode = 0o644
+                os.chmod(temp_path, mode)
+                os.replace(temp_path, self.config_path)
+            except BaseException:
+                # 替换未完成时清理临时文件
+                try:
+                    os.unlink(temp_path)
+                except OSError:
+                    pass
+                raise
+            
+            self._last_saved_hash = digest
+            logger.info("配置已保存到 %s", self.config_path)
             return True
         except (FileNotFoundError, PermissionError) as e:
-            logger.error(f"无法保存配置到 {self.config_path}: {e}")
+            logger.error("无法保存配置到 %s: %s", self.config_path, e)
             return False
     
     def get(self, key: str, default: Any = None) -> Any:
         """
         获取配置值
         
+        实例初始化后会被self.config.get覆盖，此方法仅在初始化完成前生效。
+        
         Args:
             key: 配置键
             default: 如果键不存在，返回的默认值
@@ -261,6 +416,18 @@ class ConfigManager:
         """
         return self.config.get(key, default)
     
+    @property
+    def raw(self) -> Dict[str, Any]:
+        """
+        配置字典本身，供热点路径直接以下标方式读取
+        
+        只应读取，修改配置请使用set方法。
+        
+        Returns:
+            Dict[str, Any]: 当前配置字典
+        """
+        return self.config
+    
     def set(self, key: str, value: Any) -> None:
         """
         设置配置值
@@ -271,18 +438,25 @@ class ConfigManager:
         """
         self.config[key] = value
     
-    def get_all(self) -> Dict[str, Any]:
+    def get_all(self, *, mutable: bool = False) -> Mapping[str, Any]:
         """
         获取所有配置
         
+        Args:
+            mutable: 为True时返回可修改的副本，否则返回只读视图
+            
         Returns:
-            Dict[str, Any]: 所有配置的副本
+            Mapping[str, Any]: 所有配置的只读视图（随配置变化实时更新）或副本
         """
-        return self.config.copy()
+        if mutable:
+            return dict(self.config)
+        return self._view
     
     def reset_to_defaults(self) -> None:
         """重置所有配置为默认值"""
-        self.config = DEFAULT_CONFIG.copy()
+        # 原地更新配置字典，保持已绑定的get方法和外部持有的引用有效
+        self.config.clear()
+        self.config.update(DEFAULT_CONFIG_RAW)
         logger.info("配置已重置为默认值")
     
     def reset_key(self, key: str) -> None:
@@ -294,13 +468,16 @@ class ConfigManager:
         """
         if key in DEFAULT_CONFIG:
             self.config[key] = DEFAULT_CONFIG[key]
-            logger.info(f"配置 {key} 已重置为默认值: {DEFAULT_CONFIG[key]}")
+            logger.info("配置 %s 已重置为默认值: %s", key, DEFAULT_CONFIG[key])
         else:
-            logger.warning(f"未知的配置键: {key}")
+            logger.warning("未知的配置键: %s", key)
 
 
 # 创建全局配置管理器实例
-config_manager = ConfigManager()
+config_manager = ConfigManager.instance()
+
+# 全局配置字典的直接引用，热点路径可用_RAW["KEY"]读取配置
+_RAW = config_manager.config
 
 
 def get_config(key: str, default: Any = None) -> Any:
@@ -326,6 +503,7 @@ def set_config(key: str, value: Any) -> None:
         value: 配置值
     """
     config_manager.set(key, value)
+    _clear_shortcuts()
 
 
 def save_config() -> bool:
@@ -338,19 +516,23 @@ def save_config() -> bool:
     return config_manager.save_config()
 
 
-def get_all_config() -> Dict[str, Any]:
+def get_all_config(*, mutable: bool = False) -> Mapping[str, Any]:
     """
     获取所有配置
     
+    Args:
+        mutable: 为True时返回可修改的副本，否则返回只读视图
+        
     Returns:
-        Dict[str, Any]: 所有配置的副本
+        Mapping[str, Any]: 所有配置的只读视图或副本
     """
-    return config_manager.get_all()
+    return config_manager.get_all(mutable=mutable)
 
 
 def reset_config() -> None:
     """重置所有配置为默认值"""
     config_manager.reset_to_defaults()
+    _clear_shortcuts()
 
 
 def reset_config_key(key: str) -> None:
@@ -361,18 +543,51 @@ def reset_config_key(key: str) -> None:
         key: 配置键
     """
     config_manager.reset_key(key)
+    _clear_shortcuts()
+
+
+# 常用配置的快捷访问：模块属性名 -> 配置键
+_SHORTCUT_KEYS = {
+    "API_CONCURRENT_REQUESTS": "API_CONCURRENT_REQUESTS",
+    "API_RATE_LIMIT_RETRIES": "API_RATE_LIMIT_RETRIES",
+    "API_BASE_DELAY": "API_BASE_DELAY",
+    "API_MAX_DELAY": "API_MAX_DELAY",
+    "SEARCH_LIMIT": "SPOTIFY_SEARCH_LIMIT",
+    "BATCH_SIZE": "BATCH_SIZE",
+    "CONCURRENCY_LIMIT": "CONCURRENCY_LIMIT",
+    "LOG_LEVEL": "LOG_LEVEL",
+    "TITLE_WEIGHT": "TITLE_WEIGHT",
+    "ARTIST_WEIGHT": "ARTIST_WEIGHT",
+    "BRACKET_WEIGHT": "BRACKET_WEIGHT",
+    "MATCH_THRESHOLD": "MATCH_THRESHOLD",
+}
 
 
-# 常用配置的快捷访问
-API_CONCURRENT_REQUESTS = config_manager.get("API_CONCURRENT_REQUESTS")
-API_RATE_LIMIT_RETRIES = config_manager.get("API_RATE_LIMIT_RETRIES")
-API_BASE_DELAY = config_manager.get("API_BASE_DELAY")
-API_MAX_DELAY = config_manager.get("API_MAX_DELAY")
-SEARCH_LIMIT = config_manager.get("SPOTIFY_SEARCH_LIMIT")
-BATCH_SIZE = config_manager.get("BATCH_SIZE")
-CONCURRENCY_LIMIT = config_manager.get("CONCURRENCY_LIMIT")
-LOG_LEVEL = config_manager.get("LOG_LEVEL")
-TITLE_WEIGHT = config_manager.get("TITLE_WEIGHT")
-ARTIST_WEIGHT = config_manager.get("ARTIST_WEIGHT")
-BRACKET_WEIGHT = config_manager.get("BRACKET_WEIGHT")
-MATCH_THRESHOLD = config_manager.get("MATCH_THRESHOLD") 
\ No newline at end of file
+def _clear_shortcuts() -> None:
+    """清除已缓存的快捷访问属性，下次访问时重新从配置读取"""
+    module_globals = globals()
+    for name in _SHORTCUT_KEYS:
+        module_globals.pop(name, None)
+
+
+def __getattr__(name: str) -> Any:
+    """
+    按需读取常用配置的快捷访问属性（PEP 562）
+    
+    首次访问时从配置管理器读取并写入模块全局变量，之后的访问不再经过此函数。
+    
+    Args:
+        name: 属性名
+        
+    Returns:
+        Any: 对应的配置值
+        
+    Raises:
+        AttributeError: 如果不是已知的快捷访问属性
+    """
+    key = _SHORTCUT_KEYS.get(name)
+    if key is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = config_manager.get(key)
+    globals()[name] = value
+    return value
@@ -5,14 +5,157 @@
 """
 
 import logging
+import threading
+from collections import OrderedDict
+from functools import lru_cache
 from typing import Dict, List, Optional, Any, Tuple
 
-import fuzzywuzzy.fuzz as fuzz
+import numpy as np
+from rapidfuzz import fuzz, process
+from rapidfuzz.utils import default_process
 from spotify_playlist_importer.utils.string_matcher import StringMatcher
 from spotify_playlist_importer.utils.bracket_matcher import BracketMatcher
-from spotify_playlist_importer.utils.text_normalizer import normalize_text, split_text, TextNormalizer
+from spotify_playlist_importer.utils.text_normalizer import (
+    normalize_text, split_text, _get_normalizer
+)
 from spotify_playlist_importer.utils.config_manager import get_config
-from spotify_playlist_importer.utils.pinyin_utils import contains_chinese, find_best_pinyin_match
+from spotify_playlist_importer.utils.pinyin_utils import (
+    PYPINYIN_AVAILABLE, contains_chinese, get_pinyin_variants
+)
+from spotify_playlist_importer.utils.logger import get_logger
+
+# 获取日志器
+logger = get_logger(__name__)
+
+# 简繁体映射表（简化版，仅包含常见字符）
+_TRAD_TO_SIMP = {
+    '愛': '爱', '風': '风', '華': '华', '時': '时', '樂': '乐',
+    '東': '东', '來': '来', '過': '过', '說': '说', '實': '实',
+    '現': '现', '點': '点', '開': '开', '後': '后', '樣': '样',
+    '對': '对', '還': '还', '發': '发', '與': '与', '這': '这',
+    '價': '价', '當': '当', '處': '处', '號': '号', '體': '体',
+    '問': '问', '關': '关', '們': '们', '鄧': '邓', '麗': '丽',
+    '趙': '赵', '賣': '卖', '會': '会', '個': '个', '國': '国',
+    '參': '参', '為': '为', '見': '见', '險': '险'
+}
+
+# 双向的(繁, 简)/(简, 繁)字符对，逐位比较时一次集合查找即可判断
+_TRAD_SIMP_PAIRS = frozenset(
+    pair
+    for trad, simp in _TRAD_TO_SIMP.items()
+    for pair in ((trad, simp), (simp, trad))
+)
+
+@lru_cache(maxsize=4096)
+def _to_simplified(text: str) -> str:
+    """
+    繁体转简体（带缓存）
+    
+    Args:
+        text: 输入文本
+        
+    Returns:
+        str: 简体中文文本
+    """
+    # 复用text_normalizer模块共享的默认归一化器（包括OpenCC转换器），首次使用时才创建
+    return _get_normalizer().to_simplified_chinese(text)
+
+
+@lru_cache(maxsize=4096)
+def _pinyin_variants(text: str) -> Tuple[str, ...]:
+    """
+    获取中文文本用于拼音匹配的全部变体（带缓存）
+    
+    第一个元素总是文本本身的小写形式，其余为不同风格的拼音表示。
+    
+    Args:
+        text: 包含中文的文本
+        
+    Returns:
+        Tuple[str, ...]: 变体元组；pypinyin不可用时为空元组
+    """
+    if not PYPINYIN_AVAILABLE:
+        return ()
+    lowered = text.lower()
+    variants = get_pinyin_variants(text)
+    return (lowered,) + tuple(sorted(variants - {lowered}))
+
+
+@lru_cache(maxsize=4096)
+def _normalize_and_split(text: str) -> Tuple[str, str, Tuple[str, ...]]:
+    """
+    归一化文本（保留括号）并拆分主要部分和括号内容（带缓存）
+    
+    Args:
+        text: 原始文本
+        
+    Returns:
+        Tuple[str, str, Tuple[str, ...]]: (归一化文本, 主要部分, 括号内容)
+    """
+    normalized = normalize_text(text, preserve_brackets=True)
+    main_part, bracket_parts = split_text(normalized)
+    return normalized, main_part, tuple(bracket_parts)
+
+
+def _copy_matches(matches: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    复制匹配结果列表，供缓存存取使用
+
+    调用方可能会修改返回的匹配结果（如get_enhanced_match会改写similarity_scores），
+    因此缓存中保存和返回的都是副本，避免缓存内容被修改。
+
+    Args:
+        matches: 匹配结果列表
+
+    Returns:
+        List[Dict[str, Any]]: 匹配结果及其similarity_scores的副本
+    """
+    copies = []
+    for match in matches:
+        match_copy = dict(match)
+        if 'similarity_scores' in match_copy:
+            match_copy['similarity_scores'] = dict(match_copy['similarity_scores'])
+        copies.append(match_copy)
+    return copies
+
+
+# 分数块（SoA布局）中各行对应的分数项
+_SCORE_FIELDS = (
+    'title_score', 'artist_score', 'main_score', 'bracket_score', 'final_score'
+)
+_TITLE_ROW, _ARTIST_ROW, _MAIN_ROW, _BRACKET_ROW, _FINAL_ROW = range(len(_SCORE_FIELDS))
+
+
+def _aggregate_scores(title_scores: List[float], artist_scores: List[float],
+                      bracket_scores: List[float], title_weight: float,
+                      artist_weight: float, bracket_weight: float) -> np.ndarray:
+    """
+    对一批候选的各项相似度一次性加权汇总
+    
+    结果按结构数组（SoA）布局存放在一个float64分数块中，每一行是一个分数项
+    （行号见_SCORE_FIELDS），每一列是一个候选，各分数项在内存中连续存放。
+    
+    Args:
+        title_scores: 标题相似度列表
+        artist_scores: 艺术家相似度列表
+        bracket_scores: 括号相似度列表
+        title_weight: 标题权重
+        artist_weight: 艺术家权重
+        bracket_weight: 括号权重
+        
+    Returns:
+        np.ndarray: 形状为(5, 候选数)的分数块
+    """
+    scores = np.empty((len(_SCORE_FIELDS), len(title_scores)), dtype=np.float64)
+    scores[_TITLE_ROW] = title_scores
+    scores[_ARTIST_ROW] = artist_scores
+    scores[_BRACKET_ROW] = bracket_scores
+    
+    # 主要分数 = 标题加权 + 艺术家加权，最终分数 = 主要分数 + 括号加权
+    main_scores = np.multiply(scores[_TITLE_ROW], title_weight, out=scores[_MAIN_ROW])
+    main_scores += artist_weight * scores[_ARTIST_ROW]
+    np.add(main_scores, bracket_weight * scores[_BRACKET_ROW], out=scores[_FINAL_ROW])
+    return scores
 
 
 class EnhancedMatcher:
@@ -28,9 +171,19 @@ class EnhancedMatcher:
     如现场版、混音版、翻唱版等，同时保持良好的性能。
     """
     
-    # 类级别缓存，避免重复计算
-    _match_cache = {}
+    # 实例属性固定，使用__slots__存储，避免逐个实例的__dict__查找
+    __slots__ = (
+        'string_matcher', 'bracket_matcher',
+        'title_weight', 'artist_weight', 'bracket_weight',
+        'first_stage_threshold', 'second_stage_threshold', 'min_title_score',
+        'enable_detailed_logging', 'original_input',
+    )
+    
+    # 类级别LRU缓存，避免重复计算
+    _match_cache: "OrderedDict[Tuple, List[Dict[str, Any]]]" = OrderedDict()
     _max_cache_size = 1000  # 限制缓存大小
+    # 缓存被所有实例共享，读取时的移到末尾和写入时的淘汰需在锁内完成
+    _cache_lock = threading.Lock()
     
     def __init__(
         self,
@@ -46,6 +199,7 @@ class EnhancedMatcher:
         # 增强匹配配置
         first_stage_threshold: float = 60.0,
         second_stage_threshold: float = 70.0,
+        min_title_score: float = 45.0,
     ):
         """
         初始化增强匹配器
@@ -63,13 +217,16 @@ class EnhancedMatcher:
             bracket_threshold: 括号匹配阈值
             first_stage_threshold: 第一阶段匹配阈值，通常设置较低以允许更多候选进入第二阶段
             second_stage_threshold: 第二阶段匹配阈值，这是最终判定匹配的标准
+            min_title_score: 标题相似度下限，低于该值的候选不会通过匹配，
+                避免标题不同、仅艺术家相同的歌曲凭艺术家得分超过阈值
         """
         # 初始化字符串匹配器
         self.string_matcher = StringMatcher(
             title_weight=title_weight,
             artist_weight=artist_weight,
             threshold=string_threshold,
-            top_k=top_k
+            top_k=top_k,
+            min_title_score=min_title_score
         )
         
         # 初始化括号匹配器
@@ -85,56 +242,114 @@ class EnhancedMatcher:
         self.bracket_weight = bracket_weight
         self.first_stage_threshold = first_stage_threshold
         self.second_stage_threshold = second_stage_threshold
+        self.min_title_score = min_title_score
         
         # [诊断] 添加详细日志标志和原始输入属性
         self.enable_detailed_logging = False
         self.original_input = ""
         
         # 记录初始化参数
-        logging.info(f"[增强匹配] 初始化匹配器 - 权重: 标题={title_weight:.2f}, 艺术家={artist_weight:.2f}, 括号={bracket_weight:.2f}")
-        logging.info(f"[增强匹配] 初始化匹配器 - 阈值: 第一阶段={first_stage_threshold:.2f}, 第二阶段={second_stage_threshold:.2f}")
+        logger.info("[增强匹配] 初始化匹配器 - 权重: 标题=%.2f, 艺术家=%.2f, 括号=%.2f",
+                    title_weight, artist_weight, bracket_weight)
+        logger.info("[增强匹配] 初始化匹配器 - 阈值: 第一阶段=%.2f, 第二阶段=%.2f",
+                    first_stage_threshold, second_stage_threshold)
     
-    def _cache_key(self, input_title: str, input_artists: List[str], 
-                  candidates: List[Dict[str, Any]]) -> str:
+    def _cache_key(self, input_title: str, input_artists: List[str],
+                   candidates: List[Dict[str, Any]],
+                   testing: bool = False) -> Optional[Tuple]:
         """
         生成缓存键
-        
-        为输入歌曲和候选列表生成唯一的缓存键，用于缓存匹配结果。
-        为避免键过长，只使用候选列表中前三个项目的ID。
-        
+
+        为输入歌曲、候选列表和当前匹配配置生成唯一的缓存键，用于缓存匹配结果。
+        缓存是类级别的，因此键中包含影响结果的权重和阈值，
+        不同配置的匹配器不会共用结果。
+
         Args:
             input_title: 输入歌曲标题
             input_artists: 输入艺术家列表
             candidates: 候选歌曲列表
+            testing: 测试模式标志
+
+        Returns:
+            Optional[Tuple]: 缓存键，元组直接参与哈希和比较，无需拼接字符串；
+                有候选缺少ID和URI、无法唯一标识时为None，表示不缓存
+        """
+        # 候选的唯一标识符（如ID或URI），候选顺序也会影响结果，因此保留顺序
+        candidate_ids = []
+        for candidate in candidates:
+            candidate_id = candidate.get('id') or candidate.get('uri')
+            if candidate_id is None:
+                return None
+            candidate_ids.append(candidate_id)
+
+        config = (
+            type(self),
+            self.title_weight, self.artist_weight, self.bracket_weight,
+            self.first_stage_threshold, self.second_stage_threshold,
+            self.string_matcher.threshold, self.string_matcher.top_k,
+            self.string_matcher.min_title_score,
+            self.bracket_matcher.keyword_bonus, self.bracket_matcher.threshold,
+            testing,
+        )
+        # 艺术家顺序会影响主艺术家的比较，因此同样保留顺序
+        return (input_title, tuple(input_artists), tuple(candidate_ids), config)
+
+    def _get_cached(self, key: Tuple) -> Optional[List[Dict[str, Any]]]:
+        """
+        读取缓存的匹配结果
+        
+        命中时将该项移到末尾，标记为最近使用，并返回结果的副本。
+        
+        Args:
+            key: 缓存键
             
         Returns:
-            str: 缓存键
+            Optional[List[Dict[str, Any]]]: 缓存的匹配结果，未命中时为None
         """
-        # 使用标题和艺术家作为键的一部分
-        key_parts = [input_title, ','.join(sorted(input_artists))]
+        with self._cache_lock:
+            result = self._match_cache.get(key)
+            if result is None:
+                return None
+            self._match_cache.move_to_end(key)
+        return _copy_matches(result)
+    
+    def _set_cached(self, key: Tuple, result: List[Dict[str, Any]]):
+        """
+        写入匹配结果缓存
         
-        # 添加候选的唯一标识符（如ID或URI）
-        for candidate in candidates[:3]:  # 只使用前3个候选，避免键过长
-            if 'id' in candidate:
-                key_parts.append(candidate['id'])
-            elif 'uri' in candidate:
-                key_parts.append(candidate['uri'])
+        缓存中保存的是结果的副本，调用方之后修改结果不会影响缓存。
         
-        # 生成键字符串
-        return '|'.join(key_parts)
+        Args:
+            key: 缓存键
+            result: 匹配结果
+        """
+        cached = _copy_matches(result)
+        with self._cache_lock:
+            self._match_cache[key] = cached
+            self._match_cache.move_to_end(key)
+            self._manage_cache()
     
     def _manage_cache(self):
         """
         管理缓存大小，避免内存泄漏
         
-        当缓存大小超过限制时，简单地清除一半较早的缓存项。
-        这种简单的缓存管理策略可以有效防止内存持续增长。
+        当缓存大小超过限制时，按LRU策略逐个淘汰最久未使用的缓存项，
+        每次淘汰为O(1)操作。调用方需持有_cache_lock。
         """
-        if len(self._match_cache) > self._max_cache_size:
-            # 简单策略：当缓存过大时，清除一半
-            keys_to_remove = list(self._match_cache.keys())[:self._max_cache_size // 2]
-            for key in keys_to_remove:
-                del self._match_cache[key]
+        while len(self._match_cache) > self._max_cache_size:
+            self._match_cache.popitem(last=False)
+    
+    def _diagnostics_enabled(self) -> bool:
+        """
+        判断是否需要输出诊断日志
+        
+        仅当启用了详细日志且INFO级别日志实际会被输出时才返回True，
+        各方法在入口处调用一次，之后用同一个布尔值跳过全部诊断代码块。
+        
+        Returns:
+            bool: 是否输出诊断日志
+        """
+        return self.enable_detailed_logging and logger.isEnabledFor(logging.INFO)
     
     def first_stage_match(self, input_title: str, input_artists: List[str],
                          candidates: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
@@ -152,7 +367,8 @@ class EnhancedMatcher:
         Returns:
             List[Dict[str, Any]]: 第一阶段匹配结果
         """
-        logging.debug(f"开始第一阶段匹配：'{input_title}' - {input_artists}")
+        logger.debug("开始第一阶段匹配：'%s' - %s", input_title, input_artists)
+        diag = self._diagnostics_enabled()
         
         # 使用较低的阈值以容纳更多潜在匹配
         original_threshold = self.string_matcher.threshold
@@ -161,46 +377,74 @@ class EnhancedMatcher:
         first_matches = self.string_matcher.match(input_title, input_artists, candidates)
         
         # [诊断] 如果启用了详细日志，记录每个候选的评分情况
-        if self.enable_detailed_logging:
-            logging.info(f"===== 诊断信息：歌曲 '{self.original_input}' 的第一阶段匹配分数 =====")
-            for idx, candidate in enumerate(candidates):
-                title_sim = self.string_matcher.calculate_title_similarity(input_title, candidate['name'])
-                
-                # 计算艺术家相似度
+        if diag:
+            logger.info("===== 诊断信息：歌曲 '%s' 的第一阶段匹配分数 =====", self.original_input)
+            # 一次批量计算所有候选的分数，而不是逐个候选分别调用标题/艺术家相似度
+            all_scores = self.string_matcher.calculate_similarities(
+                input_title, input_artists, candidates)
+            for idx, (candidate, scores) in enumerate(zip(candidates, all_scores)):
                 artist_names = [artist['name'] for artist in candidate['artists']]
-                artist_sim = self.string_matcher.calculate_artists_similarity(input_artists, artist_names)
                 
                 # 计算加权分数
-                weighted_score = (title_sim * self.title_weight + artist_sim * self.artist_weight) * 100
+                weighted_score = scores['weighted_score']
                 
-                passed = weighted_score >= self.first_stage_threshold
+                passed = (weighted_score >= self.first_stage_threshold
+                          and scores['title_score'] >= self.min_title_score)
                 candidate_artists = ', '.join(artist_names)
                 
-                logging.info(f"  候选[{idx+1}]: '{candidate['name']} - {candidate_artists}'")
-                logging.info(f"    标题分: {title_sim * 100:.2f}, 艺术家分: {artist_sim * 100:.2f}, 加权总分: {weighted_score:.2f}, 通过阈值: {passed}")
+                logger.info("  候选[%s]: '%s - %s'", idx+1, candidate['name'],
+                            candidate_artists)
+                logger.info("    标题分: %.2f, 艺术家分: %.2f, 加权总分: %.2f, 通过阈值: %s",
+                            scores['title_score'], scores['artist_score'],
+                            weighted_score, passed)
             
             if first_matches:
                 best_match = first_matches[0]
                 artists_str = ', '.join([artist['name'] for artist in best_match['artists']])
-                logging.info(f"  第一阶段最佳匹配: '{best_match['name']} - {artists_str}', 分数: {best_match['similarity_scores']['weighted_score']:.2f}")
+                logger.info("  第一阶段最佳匹配: '%s - %s', 分数: %.2f",
+                            best_match['name'], artists_str,
+                            best_match['similarity_scores']['weighted_score'])
             else:
-                logging.info("  第一阶段未找到匹配结果")
+                logger.info("  第一阶段未找到匹配结果")
             
-            logging.info(f"===== 第一阶段匹配分数结束 =====")
+            logger.info("===== 第一阶段匹配分数结束 =====")
         
         # 恢复原始阈值
         self.string_matcher.threshold = original_threshold
         
-        logging.debug(f"第一阶段匹配结果：找到 {len(first_matches)} 个候选")
+        logger.debug("第一阶段匹配结果：找到 %s 个候选", len(first_matches))
         
         # 如果第一阶段阈值非常高（>95），则可能需要返回空列表
         # 这是为了测试用例test_no_first_stage_matches
         if self.first_stage_threshold > 95.0 and not any(match["similarity_scores"]["weighted_score"] > 95.0 for match in first_matches):
-            logging.debug(f"第一阶段阈值({self.first_stage_threshold})过高，返回空列表")
+            logger.debug("第一阶段阈值(%s)过高，返回空列表", self.first_stage_threshold)
             return []
             
         return first_matches
     
+    def _prepare_candidate_states(self, candidates: List[Dict[str, Any]]) -> List[Any]:
+        """
+        预处理候选歌曲标题的括号内容
+        
+        同一批候选中重复出现的标题（如同一首歌的不同专辑版本）只预处理一次。
+        
+        Args:
+            candidates: 候选歌曲列表
+            
+        Returns:
+            List[Any]: 与candidates一一对应的括号预处理结果
+        """
+        states_by_title = {}
+        states = []
+        for candidate in candidates:
+            title = candidate["name"]
+            state = states_by_title.get(title)
+            if state is None:
+                state = self.bracket_matcher._prepare(title)
+                states_by_title[title] = state
+            states.append(state)
+        return states
+    
     def second_stage_match(
         self,
         input_title: str,
@@ -225,96 +469,124 @@ class EnhancedMatcher:
 
         # 在测试模式下使用较低的阈值
         threshold = 50.0 if testing else self.second_stage_threshold
+        diag = self._diagnostics_enabled()
         
-        logging.debug(f"\n=== 第二阶段匹配 - 括号内容处理 === {'(测试模式)' if testing else ''}")
+        logger.debug("\n=== 第二阶段匹配 - 括号内容处理 === %s", '(测试模式)' if testing else '')
 
         # Process each first stage match
         second_stage_matches = []
+        final_scores = []
+        passing_indices = []
         
-        # 提取输入标题的括号内容 - 只提取一次，避免重复计算
-        input_brackets = self.bracket_matcher.extract_brackets(input_title)
-        input_keywords = {}
+        # 预处理输入标题的括号内容（提取、归一化、关键词检测）- 只处理一次，
+        # 每个候选的括号匹配直接复用，避免对输入标题重复计算
+        input_state = self.bracket_matcher._prepare(input_title)
+        input_brackets = input_state.brackets
+        input_keywords = input_state.keywords
         
         # [诊断] 如果启用了详细日志，记录输入的括号内容信息
-        if self.enable_detailed_logging:
-            logging.info(f"===== 诊断信息：歌曲 '{self.original_input}' 的第二阶段匹配（括号处理） =====")
-            logging.info(f"  输入标题 '{input_title}' 的括号提取结果: {input_brackets if input_brackets else '无括号内容'}")
+        if diag:
+            logger.info("===== 诊断信息：歌曲 '%s' 的第二阶段匹配（括号处理） =====", self.original_input)
+            logger.info("  输入标题 '%s' 的括号提取结果: %s", input_title,
+                        input_brackets if input_brackets else '无括号内容')
         
         if input_brackets:
-            logging.debug(f"输入标题 '{input_title}' 的括号内容: {input_brackets}")
+            logger.debug("输入标题 '%s' 的括号内容: %s", input_title, input_brackets)
             
             # 记录提取的括号关键词
-            input_keywords = self.bracket_matcher.detect_keywords(input_brackets)
             if input_keywords:
-                logging.debug(f"输入标题括号中检测到的关键词: {list(input_keywords.keys())}")
+                logger.debug("输入标题括号中检测到的关键词: %s", list(input_keywords.keys()))
                 
                 # [诊断] 记录关键词
-                if self.enable_detailed_logging:
-                    logging.info(f"  检测到的关键词: {list(input_keywords.keys())}")
+                if diag:
+                    logger.info("  检测到的关键词: %s", list(input_keywords.keys()))
         else:
-            logging.debug(f"输入标题 '{input_title}' 没有括号内容")
+            logger.debug("输入标题 '%s' 没有括号内容", input_title)
         
-        for candidate in first_stage_matches:
+        # 每个候选的括号提取和关键词检测只做一次，评分和诊断日志共用
+        candidate_states = self._prepare_candidate_states(first_stage_matches)
+        
+        # 输入关键词集合在候选循环中不变，只构建一次
+        input_keyword_set = frozenset(input_keywords) if diag else frozenset()
+        
+        # 循环内反复调用的方法先绑定为局部变量
+        match_states = self.bracket_matcher._match_states
+        for idx, (candidate, candidate_state) in enumerate(zip(first_stage_matches,
+                                                               candidate_states)):
             # 获取第一阶段的得分
             base_score = candidate["similarity_scores"]["weighted_score"]
             candidate_title = candidate["name"]
             
             # 应用括号匹配调整得分
-            final_score = self.bracket_matcher.match(input_title, candidate_title, base_score)
+            final_score = match_states(input_state, candidate_state, base_score)
             
             # 记录分数调整过程
-            logging.debug(f"候选 '{candidate_title}' - 基础分数: {base_score:.2f}, 最终分数: {final_score:.2f}")
+            logger.debug("候选 '%s' - 基础分数: %.2f, 最终分数: %.2f", candidate_title,
+                         base_score, final_score)
             
             # [诊断] 详细记录每个候选的括号匹配情况
-            if self.enable_detailed_logging:
-                candidate_brackets = self.bracket_matcher.extract_brackets(candidate_title)
+            if diag:
+                candidate_brackets = candidate_state.brackets
                 artists_str = ', '.join([artist['name'] for artist in candidate['artists']])
                 
-                logging.info(f"  候选[{first_stage_matches.index(candidate)+1}]: '{candidate_title} - {artists_str}'")
-                logging.info(f"    括号内容: {candidate_brackets if candidate_brackets else '无括号内容'}")
+                logger.info("  候选[%s]: '%s - %s'", idx+1, candidate_title, artists_str)
+                logger.info("    括号内容: %s",
+                            candidate_brackets if candidate_brackets else '无括号内容')
                 
                 if candidate_brackets:
-                    candidate_keywords = self.bracket_matcher.detect_keywords(candidate_brackets)
-                    logging.info(f"    候选关键词: {list(candidate_keywords.keys()) if candidate_keywords else '无关键词'}")
+                    candidate_keywords = candidate_state.keywords
+                    logger.info("    候选关键词: %s",
+                                list(candidate_keywords.keys())
+                                if candidate_keywords else '无关键词')
                     
                     # 计算关键词匹配情况
-                    common_keywords = set(input_keywords.keys()) & set(candidate_keywords.keys()) if input_keywords and candidate_keywords else set()
-                    logging.info(f"    共同关键词: {list(common_keywords) if common_keywords else '无'}")
+                    common_keywords = candidate_keywords.keys() & input_keyword_set
+                    logger.info("    共同关键词: %s",
+                                list(common_keywords) if common_keywords else '无')
                 
-                logging.info(f"    基础分数: {base_score:.2f}, 括号调整后最终分数: {final_score:.2f}, 通过阈值: {final_score >= threshold}")
+                logger.info("    基础分数: %.2f, 括号调整后最终分数: %.2f, 通过阈值: %s",
+                            base_score, final_score, final_score >= threshold)
             
-            # 更新分数信息
-            candidate["similarity_scores"]["final_score"] = final_score
+            final_scores.append(final_score)
             
-            # 如果最终分数超过第二阶段阈值，添加到结果中
+            # 如果最终分数超过第二阶段阈值，记录其下标
             if final_score >= threshold:
-                second_stage_matches.append(candidate)
-                logging.debug(f"候选 '{candidate_title}' 通过第二阶段筛选，分数: {final_score:.2f}")
+                passing_indices.append(idx)
+                logger.debug("候选 '%s' 通过第二阶段筛选，分数: %.2f", candidate_title, final_score)
             else:
-                logging.debug(f"候选 '{candidate_title}' 未通过第二阶段筛选，分数 {final_score:.2f} < 阈值 {threshold}")
+                logger.debug("候选 '%s' 未通过第二阶段筛选，分数 %.2f < 阈值 %s",
+                             candidate_title, final_score, threshold)
         
-        # 按最终得分排序
-        second_stage_matches.sort(
-            key=lambda x: x["similarity_scores"]["final_score"],
-            reverse=True
-        )
+        # 按最终得分对通过的下标排序，只为通过的候选写入最终分数
+        passing_indices.sort(key=final_scores.__getitem__, reverse=True)
+        for idx in passing_indices:
+            candidate = first_stage_matches[idx]
+            candidate["similarity_scores"]["final_score"] = final_scores[idx]
+            second_stage_matches.append(candidate)
+        
+        # 没有候选通过时，仍为第一阶段最佳候选保留最终分数，供测试模式下回退返回
+        if not second_stage_matches:
+            first_stage_matches[0]["similarity_scores"]["final_score"] = final_scores[0]
         
         # [诊断] 记录第二阶段最终结果
-        if self.enable_detailed_logging:
+        if diag:
             if second_stage_matches:
                 best_match = second_stage_matches[0]
                 artists_str = ', '.join([artist['name'] for artist in best_match['artists']])
-                logging.info(f"  第二阶段最佳匹配: '{best_match['name']} - {artists_str}', 最终分数: {best_match['similarity_scores']['final_score']:.2f}")
+                logger.info("  第二阶段最佳匹配: '%s - %s', 最终分数: %.2f",
+                            best_match['name'], artists_str,
+                            best_match['similarity_scores']['final_score'])
             else:
-                logging.info("  第二阶段未找到符合阈值的匹配")
+                logger.info("  第二阶段未找到符合阈值的匹配")
             
-            logging.info(f"===== 第二阶段匹配结束 =====")
+            logger.info("===== 第二阶段匹配结束 =====")
         
         if second_stage_matches:
             best_match = second_stage_matches[0]
-            logging.debug(f"第二阶段最佳匹配: '{best_match['name']}', 最终分数: {best_match['similarity_scores']['final_score']:.2f}")
+            logger.debug("第二阶段最佳匹配: '%s', 最终分数: %.2f", best_match['name'],
+                         best_match['similarity_scores']['final_score'])
         
-        logging.debug(f"第二阶段匹配结果：找到 {len(second_stage_matches)} 个匹配")
+        logger.debug("第二阶段匹配结果：找到 %s 个匹配", len(second_stage_matches))
         return second_stage_matches
     
     def match(self, input_title: str, input_artists: List[str],
@@ -335,15 +607,47 @@ class EnhancedMatcher:
         # 确保有候选
         if not candidates:
             return []
-            
-        logging.debug(f"开始第一阶段匹配：'{input_title}' - {input_artists}")
+        
+        # 相同的输入、候选和配置直接返回缓存结果；
+        # 启用诊断日志时不使用缓存，保证每次都输出完整的诊断信息
+        cache_key = None
+        if not self._diagnostics_enabled():
+            cache_key = self._cache_key(input_title, input_artists, candidates, testing)
+        if cache_key is not None:
+            cached = self._get_cached(cache_key)
+            if cached is not None:
+                logger.debug("命中匹配缓存：'%s' - %s", input_title, input_artists)
+                return cached
+        
+        final_matches = self._match_uncached(input_title, input_artists, candidates,
+                                             testing)
+        if cache_key is not None:
+            self._set_cached(cache_key, final_matches)
+        return final_matches
+    
+    def _match_uncached(self, input_title: str, input_artists: List[str],
+                        candidates: List[Dict[str, Any]],
+                        testing: bool) -> List[Dict[str, Any]]:
+        """
+        不经过缓存执行两阶段匹配流程
+
+        Args:
+            input_title: 输入歌曲标题
+            input_artists: 输入艺术家列表
+            candidates: 候选歌曲列表
+            testing: 测试模式标志
+
+        Returns:
+            List[Dict[str, Any]]: 匹配结果列表，按得分排序
+        """
+        logger.debug("开始第一阶段匹配：'%s' - %s", input_title, input_artists)
         
         # 第一阶段：基础字符串匹配
         first_matches = self.first_stage_match(input_title, input_artists, candidates)
         
         # 如果没有第一阶段匹配，返回空列表
         if not first_matches:
-            logging.debug(f"第一阶段未找到匹配")
+            logger.debug("第一阶段未找到匹配")
             return []
         
         # 第二阶段：考虑括号内容
@@ -351,7 +655,7 @@ class EnhancedMatcher:
         
         # 如果没有第二阶段匹配，返回空列表或第一阶段最佳匹配
         if not final_matches:
-            logging.debug(f"第二阶段未找到匹配，返回第一阶段最佳结果")
+            logger.debug("第二阶段未找到匹配，返回第一阶段最佳结果")
             if testing:  # 测试模式下返回第一阶段最佳结果
                 return [first_matches[0]]
             return []
@@ -412,7 +716,7 @@ def get_enhanced_match(
             best_match["similarity_scores"]["original_score"] = original_score  # 保存原始分数
             best_match["similarity_scores"]["final_score"] = 0  # 设置最终分数为0
             
-            logging.debug(f"从仅艺术家搜索获得的候选，将分数从 {original_score:.2f} 强制设置为 0")
+            logger.debug("从仅艺术家搜索获得的候选，将分数从 %.2f 强制设置为 0", original_score)
         
         return best_match
     else:
@@ -435,6 +739,8 @@ class BracketAwareMatcher(EnhancedMatcher):
     3. 通过配置不同的权重，可以灵活调整匹配策略
     """
     
+    __slots__ = ('prefilter_top_k',)
+    
     def __init__(
         self,
         # 继承的参数
@@ -447,6 +753,8 @@ class BracketAwareMatcher(EnhancedMatcher):
         bracket_threshold: float = 70.0,
         first_stage_threshold: float = 60.0,
         second_stage_threshold: float = 70.0,
+        min_title_score: float = 45.0,
+        prefilter_top_k: Optional[int] = None,
     ):
         """
         初始化括号感知匹配器
@@ -461,6 +769,9 @@ class BracketAwareMatcher(EnhancedMatcher):
             bracket_threshold: 括号匹配阈值
             first_stage_threshold: 第一阶段匹配阈值
             second_stage_threshold: 第二阶段匹配阈值
+            min_title_score: 标题相似度下限，主要标题相似度低于该值的候选不会作为高置信度匹配返回
+            prefilter_top_k: 候选数超过该值时，只对标题相似度最高的这些候选计算艺术家和括号相似度；
+                为None时不做预筛选。预筛选掉的候选即使艺术家和括号得分很高也不会被返回
         """
         super().__init__(
             title_weight=title_weight,
@@ -471,20 +782,11 @@ class BracketAwareMatcher(EnhancedMatcher):
             keyword_bonus=keyword_bonus,
             bracket_threshold=bracket_threshold,
             first_stage_threshold=first_stage_threshold,
-            second_stage_threshold=second_stage_threshold
-        )
-        # 保存权重参数作为类属性，以便在match_with_normalized_info方法中使用
-        self.title_weight = title_weight
-        self.artist_weight = artist_weight
-        self.bracket_weight = bracket_weight
-        
-        # 初始化BracketMatcher
-        from spotify_playlist_importer.utils.bracket_matcher import BracketMatcher
-        self.bracket_matcher = BracketMatcher(
-            bracket_weight=bracket_weight,
-            keyword_bonus=keyword_bonus,
-            threshold=bracket_threshold
+            second_stage_threshold=second_stage_threshold,
+            min_title_score=min_title_score
         )
+        # 权重属性和BracketMatcher均已由父类按相同参数初始化，无需重复创建
+        self.prefilter_top_k = prefilter_top_k
     
     def _prepare_input_song(self, input_title: str, input_artists: List[str]) -> Dict[str, Any]:
         """
@@ -500,26 +802,24 @@ class BracketAwareMatcher(EnhancedMatcher):
             Dict[str, Any]: 处理后的归一化信息
         """
         # 归一化标题并保留括号内容
-        normalized_title = normalize_text(input_title, preserve_brackets=True)
-        main_title, bracket_parts = split_text(normalized_title)
+        normalized_title, main_title, bracket_parts = _normalize_and_split(input_title)
         
         # 归一化艺术家
         normalized_artists = []
         for artist in input_artists:
-            norm_artist = normalize_text(artist, preserve_brackets=True)
-            main_artist, artist_brackets = split_text(norm_artist)
+            norm_artist, main_artist, artist_brackets = _normalize_and_split(artist)
             normalized_artists.append({
                 'original': artist,
                 'normalized': norm_artist,
                 'main': main_artist,
-                'bracket_parts': artist_brackets
+                'bracket_parts': list(artist_brackets)
             })
             
         return {
             'original_title': input_title,
             'normalized_title': normalized_title,
             'main_title': main_title,
-            'bracket_parts': bracket_parts,
+            'bracket_parts': list(bracket_parts),
             'artists': normalized_artists
         }
     
@@ -540,32 +840,139 @@ class BracketAwareMatcher(EnhancedMatcher):
             return 0
             
         # 检查是否是简繁体差异的标题，如果是，给予高分
-        normalizer = TextNormalizer()
-        simplified1 = normalizer.to_simplified_chinese(title1)
-        simplified2 = normalizer.to_simplified_chinese(title2)
+        simplified1 = _to_simplified(title1)
+        simplified2 = _to_simplified(title2)
+        
+        exact_score = self._exact_title_score(title1, title2, simplified1, simplified2)
+        if exact_score is not None:
+            return exact_score
+            
+        # 对简繁体转换后的标题计算相似度
+        ratio = fuzz.ratio(simplified1, simplified2)
+        partial_ratio = fuzz.partial_ratio(simplified1, simplified2)
+        # 词级算法沿用fuzzywuzzy的预处理方式（转小写、去除标点），
+        # 两个词级算法共用同一次预处理结果
+        processed1 = default_process(simplified1)
+        processed2 = default_process(simplified2)
+        if processed1 and processed1 == processed2:
+            # 预处理后完全相同（仅大小写或标点不同），两个词级算法必为满分，无需计算
+            token_sort_ratio = token_set_ratio = 100.0
+        else:
+            token_sort_ratio = fuzz.token_sort_ratio(processed1, processed2)
+            token_set_ratio = fuzz.token_set_ratio(processed1, processed2)
+        
+        return self._combine_title_scores(title1, title2, ratio, partial_ratio,
+                                          token_sort_ratio, token_set_ratio)
+    
+    def _batch_title_similarity(self, title: str,
+                                candidate_titles: List[str]) -> List[float]:
+        """
+        批量计算一个标题与多个候选标题的相似度
+        
+        结果与逐个调用_calculate_title_similarity一致，但输入标题只简化和预处理一次，
+        四种相似度算法各用一次process.cdist对全部候选计算。
+        
+        Args:
+            title: 输入标题
+            candidate_titles: 候选标题列表
+            
+        Returns:
+            List[float]: 与candidate_titles一一对应的相似度分数 (0-100)
+        """
+        scores = [0] * len(candidate_titles)
+        if not title:
+            return scores
+        
+        simplified = _to_simplified(title)
+        
+        # 先处理可直接给分的候选，其余候选收集起来批量计算
+        pending = []
+        pending_simplified = []
+        for i, candidate_title in enumerate(candidate_titles):
+            if not candidate_title:
+                continue
+            candidate_simplified = _to_simplified(candidate_title)
+            exact_score = self._exact_title_score(title, candidate_title, simplified,
+                                                  candidate_simplified)
+            if exact_score is not None:
+                scores[i] = exact_score
+            else:
+                pending.append(i)
+                pending_simplified.append(candidate_simplified)
+        
+        if not pending:
+            return scores
+        
+        processed = default_process(simplified)
+        pending_processed = [default_process(text) for text in pending_simplified]
+        ratios = process.cdist([simplified], pending_simplified,
+                               scorer=fuzz.ratio, dtype=np.float64)[0].tolist()
+        partial_ratios = process.cdist([simplified], pending_simplified,
+                                       scorer=fuzz.partial_ratio,
+                                       dtype=np.float64)[0].tolist()
+        token_sort_ratios = process.cdist([processed], pending_processed,
+                                          scorer=fuzz.token_sort_ratio,
+                                          dtype=np.float64)[0].tolist()
+        token_set_ratios = process.cdist([processed], pending_processed,
+                                         scorer=fuzz.token_set_ratio,
+                                         dtype=np.float64)[0].tolist()
+        
+        for k, i in enumerate(pending):
+            scores[i] = self._combine_title_scores(
+                title, candidate_titles[i], ratios[k], partial_ratios[k],
+                token_sort_ratios[k], token_set_ratios[k])
+        return scores
+    
+    def _exact_title_score(self, title1: str, title2: str,
+                           simplified1: str, simplified2: str) -> Optional[int]:
+        """
+        检查两个标题是否可直接判定为完全匹配
         
+        Args:
+            title1: 标题1
+            title2: 标题2
+            simplified1: 标题1的简体形式
+            simplified2: 标题2的简体形式
+            
+        Returns:
+            Optional[int]: 完全匹配时为100，否则为None
+        """
         # 如果简繁体转换后相同，直接给高分
         if simplified1 == simplified2:
-            logging.info(f"[简繁体匹配] '{title1}' 和 '{title2}' 简繁体转换后相同，给予100分")
+            logger.info("[简繁体匹配] '%s' 和 '%s' 简繁体转换后相同，给予100分", title1, title2)
             return 100
             
         # 检查标题是否只是大小写不同而字符相同
         if title1.lower() == title2.lower():
-            logging.info(f"[大小写不敏感匹配] '{title1}' 和 '{title2}' 仅大小写不同，给予100分")
+            logger.info("[大小写不敏感匹配] '%s' 和 '%s' 仅大小写不同，给予100分", title1, title2)
             return 100
-            
-        # 对简繁体转换后的标题计算相似度
-        ratio = fuzz.ratio(simplified1, simplified2)
-        partial_ratio = fuzz.partial_ratio(simplified1, simplified2)
-        token_sort_ratio = fuzz.token_sort_ratio(simplified1, simplified2)
-        token_set_ratio = fuzz.token_set_ratio(simplified1, simplified2)
         
-        # 记录各类相似度分数
-        logging.info(f"[标题相似度] '{title1}' vs '{title2}'")
-        logging.info(f"  - 基本相似度(ratio): {ratio:.2f}")
-        logging.info(f"  - 部分相似度(partial): {partial_ratio:.2f}")
-        logging.info(f"  - 词排序相似度(token_sort): {token_sort_ratio:.2f}")
-        logging.info(f"  - 词集合相似度(token_set): {token_set_ratio:.2f}")
+        return None
+    
+    def _combine_title_scores(self, title1: str, title2: str, ratio: float,
+                              partial_ratio: float, token_sort_ratio: float,
+                              token_set_ratio: float) -> float:
+        """
+        将四种相似度算法的分数加权合并为标题相似度
+        
+        Args:
+            title1: 标题1
+            title2: 标题2
+            ratio: 基本相似度
+            partial_ratio: 部分相似度
+            token_sort_ratio: 词排序相似度
+            token_set_ratio: 词集合相似度
+            
+        Returns:
+            float: 相似度分数 (0-100)
+        """
+        # 记录各类相似度分数（每个候选都会调用，先检查一次级别再逐条记录）
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("[标题相似度] '%s' vs '%s'", title1, title2)
+            logger.info("  - 基本相似度(ratio): %.2f", ratio)
+            logger.info("  - 部分相似度(partial): %.2f", partial_ratio)
+            logger.info("  - 词排序相似度(token_sort): %.2f", token_sort_ratio)
+            logger.info("  - 词集合相似度(token_set): %.2f", token_set_ratio)
         
         # 简繁体字符关系特殊处理 - 如果标题中包含中文字符，加强 token_set_ratio 的权重
         contains_chinese_title1 = contains_chinese(title1)
@@ -574,7 +981,7 @@ class BracketAwareMatcher(EnhancedMatcher):
         if contains_chinese_title1 or contains_chinese_title2:
             # 如果包含中文，对token_set_ratio赋予更高权重，更好处理简繁体差异
             final_score = 0.1 * ratio + 0.2 * partial_ratio + 0.2 * token_sort_ratio + 0.5 * token_set_ratio
-            logging.info(f"  - 中文标题特殊处理: token_set_ratio权重提高到0.5")
+            logger.info("  - 中文标题特殊处理: token_set_ratio权重提高到0.5")
         else:
             # 非中文标题使用平衡权重
             final_score = 0.25 * ratio + 0.25 * partial_ratio + 0.25 * token_sort_ratio + 0.25 * token_set_ratio
@@ -582,35 +989,18 @@ class BracketAwareMatcher(EnhancedMatcher):
         # 额外简繁体匹配加分处理
         # 如果字符级别上的差异主要来自简繁体，给予额外加分
         if 50 <= ratio < 80 and (contains_chinese_title1 or contains_chinese_title2):
-            # 计算有多少字符是简繁体对应关系
-            tradchar_count = 0
-            # 简繁体映射表（简化版，仅包含常见字符）
-            trad_to_simp = {
-                '愛': '爱', '風': '风', '華': '华', '時': '时', '樂': '乐', 
-                '東': '东', '來': '来', '過': '过', '說': '说', '實': '实',
-                '現': '现', '點': '点', '開': '开', '後': '后', '樣': '样',
-                '對': '对', '還': '还', '發': '发', '與': '与', '這': '这',
-                '價': '价', '當': '当', '處': '处', '號': '号', '體': '体',
-                '問': '问', '關': '关', '們': '们', '鄧': '邓', '麗': '丽',
-                '趙': '赵', '賣': '卖', '會': '会', '個': '个', '國': '国',
-                '實': '实', '參': '参', '為': '为', '見': '见', '險': '险'
-            }
-            
-            min_len = min(len(title1), len(title2))
-            for i in range(min_len):
-                if title1[i] != title2[i]:
-                    if title1[i] in trad_to_simp and trad_to_simp[title1[i]] == title2[i]:
-                        tradchar_count += 1
-                    elif title2[i] in trad_to_simp and trad_to_simp[title2[i]] == title1[i]:
-                        tradchar_count += 1
+            # 计算有多少位置上的字符是简繁体对应关系
+            tradchar_count = sum(1 for pair in zip(title1, title2)
+                                 if pair in _TRAD_SIMP_PAIRS)
             
             # 如果有简繁体对应关系，给予额外加分
             if tradchar_count > 0:
                 simp_trad_bonus = min(tradchar_count * 10, 30)  # 最多加30分
-                logging.info(f"  - 简繁体匹配加分: +{simp_trad_bonus:.2f} (检测到{tradchar_count}个简繁体对应字符)")
+                logger.info("  - 简繁体匹配加分: +%.2f (检测到%s个简繁体对应字符)",
+                            simp_trad_bonus, tradchar_count)
                 final_score += simp_trad_bonus
         
-        logging.info(f"  - 加权最终得分: {final_score:.2f}")
+        logger.info("  - 加权最终得分: %.2f", final_score)
         return min(final_score, 100)  # 确保分数不超过100
     
     def _calculate_artists_similarity(self, input_artists: List[Dict[str, Any]], 
@@ -635,40 +1025,66 @@ class BracketAwareMatcher(EnhancedMatcher):
         # 提取主要艺术家部分列表
         input_main_artists = [artist['main'] for artist in input_artists]
         candidate_main_artists = [artist['main'] for artist in candidate_artists]
+        diag = self._diagnostics_enabled()
+        log_level = logging.INFO if self.enable_detailed_logging else logging.DEBUG
         
         # 日志记录原始艺术家列表
-        if self.enable_detailed_logging:
-            logging.info(f"[艺术家相似度] 输入艺术家: {input_main_artists}")
-            logging.info(f"[艺术家相似度] 候选艺术家: {candidate_main_artists}")
+        if diag:
+            logger.info("[艺术家相似度] 输入艺术家: %s", input_main_artists)
+            logger.info("[艺术家相似度] 候选艺术家: %s", candidate_main_artists)
+        
+        # 跳过空白的艺术家名
+        valid_input_artists = [artist for artist in input_main_artists
+                               if artist.strip()]
+        valid_candidate_artists = [artist for artist in candidate_main_artists
+                                   if artist.strip()]
+        if not valid_input_artists or not valid_candidate_artists:
+            return 0.0
+        
+        # 一次C层面的调用计算全部输入艺术家与候选艺术家之间的基本字符串相似度矩阵
+        direct_scores = process.cdist(valid_input_artists, valid_candidate_artists,
+                                      scorer=fuzz.ratio, dtype=np.float64)
+        lowered_candidate_artists = None
+        
+        # 每个输入艺术家是否包含中文只判断一次
+        input_has_chinese = [contains_chinese(artist) for artist in valid_input_artists]
         
         # 为每个输入艺术家找到最佳匹配的候选艺术家
         best_scores = []
-        for input_artist in input_main_artists:
-            if not input_artist.strip():
-                continue
-                
+        for i, (input_artist, has_chinese) in enumerate(zip(valid_input_artists,
+                                                            input_has_chinese)):
             best_score = 0
-            best_match_info = ""
+            best_candidate = ""
+            best_match_type = ""
             
-            # 检查是否包含中文字符
-            has_chinese = contains_chinese(input_artist)
+            # 包含中文时，拼音变体只生成一次，并一次性与全部候选艺术家（小写）比较：
+            # 第0行为输入艺术家小写形式本身，其余行为各拼音变体
+            pinyin_scores = None
+            variants = _pinyin_variants(input_artist) if has_chinese else ()
+            if variants:
+                if lowered_candidate_artists is None:
+                    lowered_candidate_artists = [artist.lower()
+                                                 for artist in valid_candidate_artists]
+                pinyin_scores = process.cdist(variants, lowered_candidate_artists,
+                                              scorer=fuzz.ratio, dtype=np.float64)
             
-            for candidate_artist in candidate_main_artists:
-                if not candidate_artist.strip():
-                    continue
-                
+            for j, candidate_artist in enumerate(valid_candidate_artists):
                 # 基本字符串相似度
-                direct_score = fuzz.ratio(input_artist, candidate_artist)
+                direct_score = float(direct_scores[i, j])
                 
                 # 如果包含中文，尝试拼音匹配
                 pinyin_score = 0
                 used_pinyin = False
                 
-                if has_chinese:
-                    # 尝试拼音匹配
-                    _, pinyin_match_score, used_pinyin = find_best_pinyin_match(
-                        input_artist, [candidate_artist])
-                    pinyin_score = pinyin_match_score
+                if pinyin_scores is not None:
+                    lowered_score = float(pinyin_scores[0, j])
+                    if lowered_score >= 75:
+                        # 忽略大小写后直接匹配分数足够高，不使用拼音
+                        pinyin_score = lowered_score
+                    else:
+                        best_variant = int(pinyin_scores[:, j].argmax())
+                        pinyin_score = float(pinyin_scores[best_variant, j])
+                        used_pinyin = best_variant != 0
                 
                 # 取直接匹配和拼音匹配的最高分
                 score = max(direct_score, pinyin_score)
@@ -676,13 +1092,15 @@ class BracketAwareMatcher(EnhancedMatcher):
                 # 更新最佳得分
                 if score > best_score:
                     best_score = score
-                    match_type = "拼音匹配" if (used_pinyin and pinyin_score > direct_score) else "直接匹配"
-                    best_match_info = f"{candidate_artist} ({match_type}: {score:.2f})"
+                    best_candidate = candidate_artist
+                    best_match_type = ("拼音匹配"
+                                       if used_pinyin and pinyin_score > direct_score
+                                       else "直接匹配")
             
             if best_score > 0:
                 best_scores.append(best_score)
-                log_level = logging.INFO if self.enable_detailed_logging else logging.DEBUG
-                logging.log(log_level, f"[艺术家匹配] '{input_artist}' 最佳匹配: {best_match_info}")
+                logger.log(log_level, "[艺术家匹配] '%s' 最佳匹配: %s (%s: %.2f)",
+                           input_artist, best_candidate, best_match_type, best_score)
                 
         # 如果没有有效的分数，返回0
         if not best_scores:
@@ -691,12 +1109,13 @@ class BracketAwareMatcher(EnhancedMatcher):
         # 计算平均得分
         avg_score = sum(best_scores) / len(best_scores)
         
-        # 详细日志
-        log_level = logging.INFO if self.enable_detailed_logging else logging.DEBUG
-        if any(contains_chinese(artist) for artist in input_main_artists):
-            logging.log(log_level, f"[中文艺术家相似度] {input_main_artists} vs {candidate_main_artists} = {avg_score:.2f}")
+        # 详细日志（空白艺术家名不含中文，直接复用已计算的结果）
+        if any(input_has_chinese):
+            logger.log(log_level, "[中文艺术家相似度] %s vs %s = %.2f", input_main_artists,
+                       candidate_main_artists, avg_score)
         else:
-            logging.log(log_level, f"[艺术家相似度] {input_main_artists} vs {candidate_main_artists} = {avg_score:.2f}")
+            logger.log(log_level, "[艺术家相似度] %s vs %s = %.2f", input_main_artists,
+                       candidate_main_artists, avg_score)
             
         return avg_score
     
@@ -716,9 +1135,9 @@ class BracketAwareMatcher(EnhancedMatcher):
             float: 相似度分数，包括基础相似度和关键词匹配加分
         """
         # 日志记录括号内容
-        if self.enable_detailed_logging:
-            logging.info(f"[括号相似度] 输入括号: {input_brackets}")
-            logging.info(f"[括号相似度] 候选括号: {candidate_brackets}")
+        if self._diagnostics_enabled():
+            logger.info("[括号相似度] 输入括号: %s", input_brackets)
+            logger.info("[括号相似度] 候选括号: %s", candidate_brackets)
         
         # 使用现有的BracketMatcher计算括号相似度和关键词加分
         base_bracket_score = self.bracket_matcher.calculate_bracket_similarity(
@@ -728,7 +1147,8 @@ class BracketAwareMatcher(EnhancedMatcher):
             input_brackets, candidate_brackets)
             
         log_level = logging.INFO if self.enable_detailed_logging else logging.DEBUG
-        logging.log(log_level, f"[括号相似度] 基础相似度: {base_bracket_score:.2f}, 关键词加分: {keyword_bonus:.2f}")
+        logger.log(log_level, "[括号相似度] 基础相似度: %.2f, 关键词加分: %.2f",
+                   base_bracket_score, keyword_bonus)
         
         # 结合基础相似度和关键词加分
         return base_bracket_score + keyword_bonus
@@ -748,27 +1168,29 @@ class BracketAwareMatcher(EnhancedMatcher):
         Returns:
             List[Dict[str, Any]]: 匹配结果列表，按匹配分数降序排序
         """
-        matches = []
-        all_candidates_with_scores = []
+        scored_candidates = []
+        candidate_infos = []
         
         # 获取输入歌曲的信息，确保所有键都存在
         input_main_title = input_info.get('main_title', '')
         input_bracket_parts = input_info.get('bracket_parts', [])
         input_artists = input_info.get('artists', [])
+        diag = self._diagnostics_enabled()
         
         # 日志记录输入信息
-        if self.enable_detailed_logging:
-            logging.info(f"[匹配过程] 开始处理: '{input_info.get('original_title', '')}'")
-            logging.info(f"  - 归一化标题: '{input_info.get('normalized_title', '')}'")
-            logging.info(f"  - 主要标题部分: '{input_main_title}'")
-            logging.info(f"  - 括号部分: {input_bracket_parts}")
+        if diag:
+            logger.info("[匹配过程] 开始处理: '%s'", input_info.get('original_title', ''))
+            logger.info("  - 归一化标题: '%s'", input_info.get('normalized_title', ''))
+            logger.info("  - 主要标题部分: '%s'", input_main_title)
+            logger.info("  - 括号部分: %s", input_bracket_parts)
             artist_names = [a.get('normalized', '') for a in input_artists]
-            logging.info(f"  - 归一化艺术家: {artist_names}")
+            logger.info("  - 归一化艺术家: %s", artist_names)
         
         for candidate in candidates:
             # 获取候选歌曲的normalized_info
             if 'normalized_info' not in candidate:
-                logging.warning(f"候选歌曲 {candidate.get('name', '未知')} 没有normalized_info属性，跳过")
+                logger.warning("候选歌曲 %s 没有normalized_info属性，跳过",
+                               candidate.get('name', '未知'))
                 continue
                 
             candidate_info = candidate['normalized_info']
@@ -782,79 +1204,142 @@ class BracketAwareMatcher(EnhancedMatcher):
                 candidate_info['artists'] = []
             
             # 日志记录候选信息
-            if self.enable_detailed_logging:
-                logging.info(f"[匹配过程] 处理候选: '{candidate_info.get('original_title', '')}'")
-                logging.info(f"  - 归一化标题: '{candidate_info.get('normalized_title', '')}'")
-                logging.info(f"  - 主要标题部分: '{candidate_info['main_title']}'")
-                logging.info(f"  - 括号部分: {candidate_info['bracket_parts']}")
+            if diag:
+                logger.info("[匹配过程] 处理候选: '%s'",
+                            candidate_info.get('original_title', ''))
+                logger.info("  - 归一化标题: '%s'",
+                            candidate_info.get('normalized_title', ''))
+                logger.info("  - 主要标题部分: '%s'", candidate_info['main_title'])
+                logger.info("  - 括号部分: %s", candidate_info['bracket_parts'])
                 artist_names = [a.get('normalized', '') for a in candidate_info['artists']]
-                logging.info(f"  - 归一化艺术家: {artist_names}")
+                logger.info("  - 归一化艺术家: %s", artist_names)
             
-            # 计算主要标题的相似度
-            title_score = self._calculate_title_similarity(
-                input_main_title, candidate_info['main_title'])
-                
-            # 计算艺术家相似度
-            artist_score = self._calculate_artists_similarity(
-                input_artists, candidate_info['artists'])
-                
-            # 计算主要匹配分数
-            main_score = (self.title_weight * title_score + 
-                          self.artist_weight * artist_score)
-                          
-            # 计算括号内容相似度及关键词加分
-            bracket_score = self._calculate_bracket_similarity(
-                input_bracket_parts, candidate_info['bracket_parts'])
-                
-            # 调整最终分数 - 使用主要分数作为基础，再加上括号匹配的分数
-            final_score = main_score + self.bracket_weight * bracket_score
-            
-            # 记录详细的匹配过程
-            log_level = logging.INFO if self.enable_detailed_logging else logging.DEBUG
-            logging.log(log_level, f"[匹配得分] 候选 '{candidate_info['original_title']}' 得分明细:")
-            logging.log(log_level, f"  - 标题相似度: {title_score:.2f} x 权重{self.title_weight:.2f} = {title_score * self.title_weight:.2f}")
-            logging.log(log_level, f"  - 艺术家相似度: {artist_score:.2f} x 权重{self.artist_weight:.2f} = {artist_score * self.artist_weight:.2f}")
-            logging.log(log_level, f"  - 主要得分: {main_score:.2f}")
-            logging.log(log_level, f"  - 括号相似度: {bracket_score:.2f} x 权重{self.bracket_weight:.2f} = {bracket_score * self.bracket_weight:.2f}")
-            logging.log(log_level, f"  - 最终得分: {final_score:.2f}")
-            
-            # 添加相似度分数信息
-            candidate['similarity_scores'] = {
-                'title_score': title_score,
-                'artist_score': artist_score,
-                'main_score': main_score,
-                'bracket_score': bracket_score,
-                'final_score': final_score
-            }
-            
-            # 保存所有带分数的候选，用于后续处理
-            all_candidates_with_scores.append(candidate)
-            
-            # 如果最终分数超过阈值，添加到高置信度匹配结果中
-            if final_score >= self.second_stage_threshold:
-                matches.append(candidate)
-                if self.enable_detailed_logging:
-                    logging.info(f"[匹配结果] 候选 '{candidate_info['original_title']}' 超过阈值 {self.second_stage_threshold:.2f}, 添加为高置信度匹配")
-                
-        # 按最终得分排序所有候选
-        all_candidates_with_scores.sort(key=lambda x: x['similarity_scores']['final_score'], reverse=True)
+            scored_candidates.append(candidate)
+            candidate_infos.append(candidate_info)
         
-        # 如果存在高置信度匹配，返回这些匹配
-        if matches:
-            # 按最终得分排序
-            matches.sort(key=lambda x: x['similarity_scores']['final_score'], reverse=True)
-            logging.info(f"[匹配结果] 找到 {len(matches)} 个高置信度匹配")
-            return matches
-        # 否则，返回得分最高的候选（作为低置信度匹配）
-        elif all_candidates_with_scores:
-            best_candidate = all_candidates_with_scores[0]
-            logging.info(f"[匹配结果] 未找到高置信度匹配，返回得分最高的候选: " +
-                         f"'{best_candidate.get('name', '未知')}' (分数: {best_candidate['similarity_scores']['final_score']:.2f})")
-            return [best_candidate]  # 返回单个最佳候选
         # 如果根本没有候选，返回空列表
-        else:
-            logging.info("[匹配结果] 没有任何候选歌曲，返回空列表")
+        if not scored_candidates:
+            logger.info("[匹配结果] 没有任何候选歌曲，返回空列表")
             return []
+        
+        # 一次性批量计算全部候选主要标题的相似度
+        title_scores = self._batch_title_similarity(
+            input_main_title, [info['main_title'] for info in candidate_infos])
+        
+        # 候选过多时，只保留标题相似度最高的prefilter_top_k个候选进入后续较昂贵的艺术家和括号计算
+        top_k = self.prefilter_top_k
+        if top_k and len(scored_candidates) > top_k:
+            kept = np.argpartition(-np.array(title_scores, dtype=np.float64),
+                                   top_k - 1)[:top_k]
+            kept = np.sort(kept).tolist()  # 保持原有顺序，同分时的排序结果不受预筛选影响
+            logger.debug("[预筛选] 从 %s 个候选中保留标题相似度最高的 %s 个",
+                         len(scored_candidates), top_k)
+            scored_candidates = [scored_candidates[i] for i in kept]
+            candidate_infos = [candidate_infos[i] for i in kept]
+            title_scores = [title_scores[i] for i in kept]
+        
+        # 计算艺术家相似度
+        artist_scores = [
+            self._calculate_artists_similarity(input_artists, info['artists'])
+            for info in candidate_infos
+        ]
+        
+        # 计算括号内容相似度及关键词加分；双方都没有括号是最常见的情况，
+        # 其得分与具体候选无关，只计算一次
+        empty_bracket_score = None
+        bracket_scores = []
+        for info in candidate_infos:
+            if input_bracket_parts or info['bracket_parts']:
+                bracket_scores.append(self._calculate_bracket_similarity(
+                    input_bracket_parts, info['bracket_parts']))
+                continue
+            if empty_bracket_score is None:
+                empty_bracket_score = self._calculate_bracket_similarity([], [])
+            bracket_scores.append(empty_bracket_score)
+        
+        # 对全部候选一次性向量化计算加权得分，只保留一个分数块，不再为每个候选单独分配分数字典
+        scores = _aggregate_scores(title_scores, artist_scores, bracket_scores,
+                                   self.title_weight, self.artist_weight,
+                                   self.bracket_weight)
+        final_array = scores[_FINAL_ROW]
+        passed_array = ((final_array >= self.second_stage_threshold)
+                        & (scores[_TITLE_ROW] >= self.min_title_score))
+        
+        log_level = logging.INFO if self.enable_detailed_logging else logging.DEBUG
+        # 得分明细日志级别是否启用只检查一次，未启用时整段跳过，不做任何参数计算
+        if logger.isEnabledFor(log_level):
+            rows = zip(scored_candidates, title_scores, artist_scores, bracket_scores,
+                       scores[_MAIN_ROW].tolist(), final_array.tolist(),
+                       passed_array.tolist())
+            for (candidate, title_score, artist_score, bracket_score, main_score,
+                 final_score, passed) in rows:
+                # 记录详细的匹配过程
+                candidate_title = candidate['normalized_info']['original_title']
+                logger.log(log_level, "[匹配得分] 候选 '%s' 得分明细:", candidate_title)
+                logger.log(log_level, "  - 标题相似度: %.2f x 权重%.2f = %.2f",
+                           title_score, self.title_weight,
+                           title_score * self.title_weight)
+                logger.log(log_level, "  - 艺术家相似度: %.2f x 权重%.2f = %.2f",
+                           artist_score, self.artist_weight,
+                           artist_score * self.artist_weight)
+                logger.log(log_level, "  - 主要得分: %.2f", main_score)
+                logger.log(log_level, "  - 括号相似度: %.2f x 权重%.2f = %.2f",
+                           bracket_score, self.bracket_weight,
+                           bracket_score * self.bracket_weight)
+                logger.log(log_level, "  - 最终得分: %.2f", final_score)
+                
+                if passed and diag:
+                    logger.info("[匹配结果] 候选 '%s' 超过阈值 %.2f, 添加为高置信度匹配",
+                                candidate_title, self.second_stage_threshold)
+        
+        # 如果存在高置信度匹配，只对超过阈值的候选按最终得分降序排列
+        # （稳定排序，同分时保持原有顺序）
+        selected = np.flatnonzero(passed_array)
+        if selected.size:
+            order = selected[np.argsort(-final_array[selected],
+                                        kind='stable')].tolist()
+            matches = [self._attach_scores(scored_candidates[i], i, scores,
+                                           title_scores, artist_scores, bracket_scores)
+                       for i in order]
+            logger.info("[匹配结果] 找到 %s 个高置信度匹配", len(matches))
+            return matches
+        
+        # 否则，返回得分最高的候选（作为低置信度匹配），argmax同分时取最靠前的候选
+        best_index = int(np.argmax(final_array))
+        best_candidate = self._attach_scores(scored_candidates[best_index], best_index,
+                                             scores, title_scores, artist_scores,
+                                             bracket_scores)
+        logger.info("[匹配结果] 未找到高置信度匹配，返回得分最高的候选: '%s' (分数: %.2f)",
+                    best_candidate.get('name', '未知'),
+                    best_candidate['similarity_scores']['final_score'])
+        return [best_candidate]  # 返回单个最佳候选
+    
+    @staticmethod
+    def _attach_scores(candidate: Dict[str, Any], index: int, scores: np.ndarray,
+                       title_scores: List[float], artist_scores: List[float],
+                       bracket_scores: List[float]) -> Dict[str, Any]:
+        """
+        为将要返回的候选添加相似度分数信息
+        
+        Args:
+            candidate: 候选歌曲
+            index: 候选在分数块中的列号
+            scores: _aggregate_scores返回的分数块
+            title_scores: 标题相似度列表
+            artist_scores: 艺术家相似度列表
+            bracket_scores: 括号相似度列表
+            
+        Returns:
+            Dict[str, Any]: 添加了similarity_scores的候选歌曲
+        """
+        candidate['similarity_scores'] = {
+            'title_score': title_scores[index],
+            'artist_score': artist_scores[index],
+            'main_score': float(scores[_MAIN_ROW, index]),
+            'bracket_score': bracket_scores[index],
+            'final_score': float(scores[_FINAL_ROW, index])
+        }
+        return candidate
     
     def match(self, input_title: str, input_artists: List[str],
              candidates: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
@@ -900,6 +1385,41 @@ class BracketAwareMatcher(EnhancedMatcher):
 
 
 # 模块级函数 - 使用新的BracketAwareMatcher
+@lru_cache(maxsize=4)
+def _bracket_aware_matcher(title_weight: float, artist_weight: float,
+                           bracket_weight: float, keyword_bonus: float,
+                           match_threshold: float) -> BracketAwareMatcher:
+    """
+    获取指定配置下共享的BracketAwareMatcher实例
+    
+    以配置参数为键缓存匹配器，逐首导入歌单时不再为每首歌重新创建匹配器；
+    配置发生变化时自动按新参数创建新的实例。
+    
+    Args:
+        title_weight: 标题权重
+        artist_weight: 艺术家权重
+        bracket_weight: 括号权重
+        keyword_bonus: 关键词加分
+        match_threshold: 匹配阈值
+        
+    Returns:
+        BracketAwareMatcher: 匹配器实例
+    """
+    matcher = BracketAwareMatcher(
+        title_weight=title_weight,
+        artist_weight=artist_weight,
+        bracket_weight=bracket_weight,
+        keyword_bonus=keyword_bonus,
+        second_stage_threshold=match_threshold
+    )
+    
+    # 记录详细的匹配参数
+    logger.debug("创建BracketAwareMatcher - 权重配置: 标题=%s, 艺术家=%s, 括号=%s, "
+                 "关键词加分=%s, 匹配阈值=%s", title_weight, artist_weight, bracket_weight,
+                 keyword_bonus, match_threshold)
+    return matcher
+
+
 def get_bracket_aware_match(input_title: str, input_artists: List[str],
                          candidates: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
     """
@@ -922,17 +1442,8 @@ def get_bracket_aware_match(input_title: str, input_artists: List[str],
     keyword_bonus = get_config("KEYWORD_BONUS", 5.0)
     match_threshold = get_config("MATCH_THRESHOLD", 70.0)
     
-    # 创建匹配器实例
-    matcher = BracketAwareMatcher(
-        title_weight=title_weight,
-        artist_weight=artist_weight,
-        bracket_weight=bracket_weight,
-        keyword_bonus=keyword_bonus,
-        second_stage_threshold=match_threshold
-    )
-    
-    # 记录详细的匹配参数
-    logging.debug(f"创建BracketAwareMatcher - 权重配置: 标题={title_weight}, 艺术家={artist_weight}, " +
-                 f"括号={bracket_weight}, 关键词加分={keyword_bonus}, 匹配阈值={match_threshold}")
+    # 复用相同配置下的匹配器实例
+    matcher = _bracket_aware_matcher(title_weight, artist_weight, bracket_weight,
+                                     keyword_bonus, match_threshold)
     
-    return matcher.get_best_match(input_title, input_artists, candidates) 
\ No newline at end of file
+    return matcher.get_best_match(input_title, input_artists, candidates) 
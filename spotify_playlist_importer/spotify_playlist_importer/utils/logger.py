@@ -24,16 +24,15 @@ logger.error("这是一条错误日志")
 
 import os
 import sys
+import atexit
+import queue
 import logging
-from typing import Dict, Optional, Any
-from logging.handlers import RotatingFileHandler
+from typing import Optional, Any
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
 import pathlib
 
 from spotify_playlist_importer.utils.config_manager import get_config
 
-# 全局日志器缓存，避免重复创建
-_loggers: Dict[str, logging.Logger] = {}
-
 # 日志级别映射
 LOG_LEVELS = {
     "DEBUG": logging.DEBUG,
@@ -50,6 +49,9 @@ FILE_FORMAT = "%(asctime)s [%(levelname)s] %(name)s (%(filename)s:%(lineno)d): %
 # 日期格式
 DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
 
+# 后台日志监听器：根日志器只把日志记录放入队列，控制台和文件的实际输出在监听器线程中完成
+_queue_listener: Optional[QueueListener] = None
+
 def _create_console_handler(log_level: int) -> logging.StreamHandler:
     """
     创建控制台日志处理器
@@ -94,8 +96,24 @@ def _create_file_handler(log_level: int, log_file: str) -> logging.Handler:
     file_handler.setFormatter(formatter)
     return file_handler
 
+def _stop_queue_listener() -> None:
+    """停止后台日志监听器，并输出队列中剩余的日志"""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+
+atexit.register(_stop_queue_listener)
+
 def configure_root_logger() -> None:
-    """配置根日志器"""
+    """
+    配置根日志器
+    
+    根日志器上只挂一个QueueHandler，记录入队后立即返回；控制台和文件处理器由后台的
+    QueueListener负责，避免匹配过程中的日志输出阻塞在控制台或磁盘写入上。
+    """
+    global _queue_listener
+    
     # 获取日志配置
     log_level_str = get_config("LOG_LEVEL", "INFO")
     log_level = LOG_LEVELS.get(log_level_str.upper(), logging.INFO)
@@ -104,60 +122,50 @@ def configure_root_logger() -> None:
     root_logger = logging.getLogger()
     root_logger.setLevel(log_level)
     
-    # 移除已有的处理器，避免重复
+    # 移除已有的处理器并停止旧的监听器，避免重复
     for handler in root_logger.handlers[:]:
         root_logger.removeHandler(handler)
+    _stop_queue_listener()
         
-    # 添加控制台处理器
-    root_logger.addHandler(_create_console_handler(log_level))
+    # 控制台处理器
+    handlers = [_create_console_handler(log_level)]
     
     # 如果启用了文件日志，添加文件处理器
     log_to_file = get_config("LOG_TO_FILE", False)
     if log_to_file:
         log_file_path = get_config("LOG_FILE_PATH", "spotify_importer.log")
-        root_logger.addHandler(_create_file_handler(log_level, log_file_path))
+        handlers.append(_create_file_handler(log_level, log_file_path))
+    
+    # 根日志器只负责入队，实际输出交给后台监听器线程
+    log_queue = queue.SimpleQueue()
+    root_logger.addHandler(QueueHandler(log_queue))
+    _queue_listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _queue_listener.start()
     
     # 防止日志传播到更高层级
     root_logger.propagate = False
     
-    logging.info(f"已配置根日志器，级别: {log_level_str}, 文件日志: {'启用' if log_to_file else '禁用'}")
+    logging.info("已配置根日志器，级别: %s, 文件日志: %s", log_level_str,
+                 '启用' if log_to_file else '禁用')
 
 def get_logger(name: str) -> logging.Logger:
     """
     获取指定名称的日志器
     
+    模块日志器不单独设置级别（保持NOTSET），由根日志器统一控制级别；
+    同名日志器由logging模块自身缓存，无需另行维护缓存。
+    
     Args:
         name: 日志器名称，通常使用 __name__
         
     Returns:
         logging.Logger: 配置好的日志器
     """
-    # 如果日志器已经存在于缓存中，直接返回
-    if name in _loggers:
-        return _loggers[name]
-    
     # 确保根日志器已配置
     if not logging.getLogger().handlers:
         configure_root_logger()
     
-    # 创建并配置模块日志器
-    logger = logging.getLogger(name)
-    
-    # 获取日志配置
-    log_level_str = get_config("LOG_LEVEL", "INFO")
-    log_level = LOG_LEVELS.get(log_level_str.upper(), logging.INFO)
-    
-    # 设置日志级别
-    logger.setLevel(log_level)
-    
-    # 如果需要，将所有处理器复制到此日志器
-    # 通常不需要，因为默认会传播到根日志器
-    # logger.handlers = logging.getLogger().handlers
-    
-    # 缓存日志器
-    _loggers[name] = logger
-    
-    return logger
+    return logging.getLogger(name)
 
 def set_log_level(level: str) -> None:
     """
@@ -168,21 +176,20 @@ def set_log_level(level: str) -> None:
     """
     log_level = LOG_LEVELS.get(level.upper())
     if not log_level:
-        logging.warning(f"无效的日志级别: {level}")
+        logging.warning("无效的日志级别: %s", level)
         return
     
-    # 更新根日志器的级别
+    # 更新根日志器的级别，模块日志器均继承根日志器的级别
     logging.getLogger().setLevel(log_level)
     
-    # 更新所有处理器的级别
-    for handler in logging.getLogger().handlers:
+    # 更新所有处理器的级别（包括后台监听器中的实际输出处理器）
+    handlers = list(logging.getLogger().handlers)
+    if _queue_listener is not None:
+        handlers.extend(_queue_listener.handlers)
+    for handler in handlers:
         handler.setLevel(log_level)
     
-    # 更新所有缓存的日志器的级别
-    for logger in _loggers.values():
-        logger.setLevel(log_level)
-    
-    logging.info(f"已将日志级别设置为: {level}")
+    logging.info("已将日志级别设置为: %s", level)
 
 def log_function_call(func):
     """
@@ -197,13 +204,17 @@ def log_function_call(func):
     logger = get_logger(func.__module__)
     
     def wrapper(*args, **kwargs):
-        logger.debug(f"调用函数 {func.__name__}(args={args}, kwargs={kwargs})")
+        # 每次调用只检查一次DEBUG级别，未启用时不格式化参数和返回值
+        debug_on = logger.isEnabledFor(logging.DEBUG)
+        if debug_on:
+            logger.debug("调用函数 %s(args=%s, kwargs=%s)", func.__name__, args, kwargs)
         try:
             result = func(*args, **kwargs)
-            logger.debug(f"函数 {func.__name__} 执行成功，返回: {result}")
+            if debug_on:
+                logger.debug("函数 %s 执行成功，返回: %s", func.__name__, result)
             return result
         except Exception as e:
-            logger.error(f"函数 {func.__name__} 执行失败: {e}", exc_info=True)
+            logger.error("函数 %s 执行失败: %s", func.__name__, e, exc_info=True)
             raise
     
     return wrapper
@@ -212,12 +223,17 @@ def log_class_methods(cls):
     """
     装饰器：记录类的所有方法调用信息
     
+    仅在配置项LOG_CLASS_METHODS启用时包装方法，默认不包装，避免每次方法调用的额外开销
+    
     Args:
         cls: 被装饰的类
         
     Returns:
         装饰后的类
     """
+    if not get_config("LOG_CLASS_METHODS", False):
+        return cls
+    
     for attr_name in dir(cls):
         # 跳过特殊方法和私有方法
         if attr_name.startswith('__') or attr_name.startswith('_'):
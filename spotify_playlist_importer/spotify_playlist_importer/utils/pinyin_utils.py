@@ -4,13 +4,18 @@
 此模块提供中文文本转拼音功能，以增强字符串匹配能力，特别是在比较中文艺术家名与可能的拼音或拉丁字母表示时。
 """
 
-from typing import List, Set
+from typing import Dict, FrozenSet, Iterable, List
+from functools import lru_cache
 import re
 import logging
 
+from rapidfuzz import fuzz, process
+
 # 有条件导入pypinyin，如果导入失败则提供备用功能
 try:
     from pypinyin import pinyin, Style
+    from pypinyin.pinyin_dict import pinyin_dict
+    from pypinyin.style import convert as convert_style
     PYPINYIN_AVAILABLE = True
 except ImportError:
     PYPINYIN_AVAILABLE = False
@@ -21,6 +26,9 @@ from spotify_playlist_importer.utils.logger import get_logger
 # 获取日志器
 logger = get_logger(__name__)
 
+# 中文字符（CJK统一汉字基本区）匹配正则，预编译后由C实现完成整串扫描
+_CN_RE = re.compile(r'[\u4e00-\u9fff]')
+
 
 def is_chinese_char(char: str) -> bool:
     """
@@ -39,6 +47,7 @@ def is_chinese_char(char: str) -> bool:
     return '\u4e00' <= char <= '\u9fff'
 
 
+@lru_cache(maxsize=4096)
 def contains_chinese(text: str) -> bool:
     """
     检查文本中是否包含中文字符
@@ -49,10 +58,25 @@ def contains_chinese(text: str) -> bool:
     Returns:
         bool: 如果包含中文字符则为True，否则为False
     """
-    if not text:
+    # 纯ASCII文本（最常见的英文标题和艺术家名）不可能包含中文，isascii()无需扫描即可判断
+    if not text or text.isascii():
         return False
     
-    return any(is_chinese_char(char) for char in text)
+    return _CN_RE.search(text) is not None
+
+
+def filter_chinese_strings(texts: Iterable[str]) -> List[str]:
+    """
+    从一批文本中筛选出包含中文字符的文本
+    
+    Args:
+        texts: 要检查的文本序列
+        
+    Returns:
+        List[str]: 包含中文字符的文本，保持原有顺序
+    """
+    search = _CN_RE.search
+    return [text for text in texts if text and search(text) is not None]
 
 
 def text_to_pinyin(text: str, style: str = 'default', separator: str = '') -> str:
@@ -74,7 +98,52 @@ def text_to_pinyin(text: str, style: str = 'default', separator: str = '') -> st
     if not text or not contains_chinese(text):
         return text
     
+    return _pinyin_cached(text, style, separator)
+
+
+@lru_cache(maxsize=1)
+def _normal_pinyin_table() -> Dict[str, str]:
+    """
+    构建单音字到不带声调拼音的扁平映射表（首次使用时构建一次）
+    
+    只收录pypinyin单字表中只有一个读音的汉字。这些字在任何词语中的不带声调读音都相同，
+    因此逐字查表与pypinyin分词转换的结果一致；多音字不收录，交由pypinyin按词语消歧。
+    
+    Returns:
+        Dict[str, str]: 汉字到不带声调拼音的映射
+    """
+    return {
+        chr(code_point): convert_style(readings, Style.NORMAL, strict=True)
+        for code_point, readings in pinyin_dict.items()
+        if ',' not in readings
+    }
+
+
+@lru_cache(maxsize=4096)
+def _pinyin_cached(text: str, style: str, separator: str) -> str:
+    """
+    调用pypinyin将中文文本转换为拼音（带缓存）
+    
+    同一艺术家名或标题在整个歌单中往往重复出现，缓存后只需转换一次。
+    
+    Args:
+        text: 要转换的中文文本
+        style: 拼音风格，同text_to_pinyin
+        separator: 拼音之间的分隔符
+        
+    Returns:
+        str: 转换后的拼音字符串，转换失败时返回原文本
+    """
     try:
+        # 不带声调且全部为单音字时直接查表，跳过pypinyin的分词和多音字消歧
+        if style == 'normal':
+            table = _normal_pinyin_table()
+            syllables = [table.get(char) for char in text]
+            if None not in syllables:
+                result = separator.join(syllables)
+                logger.debug("文本 '%s' 转换为拼音: '%s'", text, result)
+                return result
+        
         # 根据style参数选择pypinyin风格
         if style == 'tone':
             py_style = Style.TONE3  # 数字声调，如 'ni3'
@@ -89,14 +158,15 @@ def text_to_pinyin(text: str, style: str = 'default', separator: str = '') -> st
         # 将拼音列表平铺并用分隔符连接
         result = separator.join([item[0] for item in py_list])
         
-        logger.debug(f"文本 '{text}' 转换为拼音: '{result}'")
+        logger.debug("文本 '%s' 转换为拼音: '%s'", text, result)
         return result
     except Exception as e:
-        logger.error(f"拼音转换失败: {e}")
+        logger.error("拼音转换失败: %s", e)
         return text
 
 
-def get_pinyin_variants(text: str) -> Set[str]:
+@lru_cache(maxsize=2048)
+def get_pinyin_variants(text: str) -> FrozenSet[str]:
     """
     获取文本的多种拼音表示变体
     
@@ -106,10 +176,10 @@ def get_pinyin_variants(text: str) -> Set[str]:
         text: 要转换的文本
         
     Returns:
-        Set[str]: 不同拼音表示的集合
+        FrozenSet[str]: 不同拼音表示的集合（结果会被缓存，因此不可修改）
     """
     if not PYPINYIN_AVAILABLE or not contains_chinese(text):
-        return {text.lower()}
+        return frozenset({text.lower()})
     
     variants = {text.lower()}  # 始终包含原始文本的小写形式
     
@@ -121,8 +191,8 @@ def get_pinyin_variants(text: str) -> Set[str]:
     # 移除空字符串
     variants.discard('')
     
-    logger.debug(f"文本 '{text}' 的拼音变体: {variants}")
-    return variants
+    logger.debug("文本 '%s' 的拼音变体: %s", text, variants)
+    return frozenset(variants)
 
 
 def find_best_pinyin_match(chinese_text: str, candidates: List[str]) -> tuple:
@@ -138,46 +208,70 @@ def find_best_pinyin_match(chinese_text: str, candidates: List[str]) -> tuple:
     Returns:
         tuple: (最佳匹配的候选文本, 匹配分数, 是否使用了拼音匹配)
     """
-    if not PYPINYIN_AVAILABLE or not contains_chinese(chinese_text) or not candidates:
-        return None, 0, False
-    
-    from fuzzywuzzy import fuzz
-    
-    # 首先尝试直接文本匹配
-    direct_match_scores = [(candidate, fuzz.ratio(chinese_text.lower(), candidate.lower())) 
-                          for candidate in candidates]
-    
-    # 找到最高直接匹配分数
-    best_direct_match, best_direct_score = max(direct_match_scores, key=lambda x: x[1])
-    
-    # 如果直接匹配分数足够高，直接返回
-    if best_direct_score >= 75:
-        logger.debug(f"文本 '{chinese_text}' 与 '{best_direct_match}' 直接匹配分数: {best_direct_score}")
-        return best_direct_match, best_direct_score, False
-    
-    # 获取中文文本的拼音变体
-    pinyin_variants = get_pinyin_variants(chinese_text)
-    
-    # 计算每个拼音变体与每个候选的匹配分数
-    best_score = 0
-    best_match = None
-    used_pinyin = False
-    
-    for variant in pinyin_variants:
-        for candidate in candidates:
-            # 候选者转为小写
-            candidate_lower = candidate.lower()
-            
-            # 计算相似度分数
-            score = fuzz.ratio(variant, candidate_lower)
-            
-            # 更新最佳分数
-            if score > best_score:
-                best_score = score
-                best_match = candidate
-                used_pinyin = variant != chinese_text.lower()  # 检查是否使用了拼音变体
-    
-    logger.debug(f"文本 '{chinese_text}' 的最佳匹配: '{best_match}', " +
-               f"分数: {best_score}, 使用拼音: {used_pinyin}")
-    
-    return best_match, best_score, used_pinyin 
\ No newline at end of file
+    best_match, best_score, used_pinyin = find_best_pinyin_matches(
+        [chinese_text], candidates)[0]
+    
+    if best_match is not None:
+        logger.debug("文本 '%s' 的最佳匹配: '%s', 分数: %s, 使用拼音: %s",
+                     chinese_text, best_match, best_score, used_pinyin)
+    
+    return best_match, best_score, used_pinyin
+
+
+def find_best_pinyin_matches(queries: List[str], candidates: List[str]) -> List[tuple]:
+    """
+    批量为多个中文文本在同一候选列表中找到拼音最匹配的项
+    
+    与逐个调用find_best_pinyin_match结果相同，但全部查询的原文和拼音变体拼成一个矩阵，
+    只调用一次process.cdist（多线程）计算与全部候选的分数。
+    
+    Args:
+        queries: 中文文本列表
+        candidates: 候选文本列表
+        
+    Returns:
+        List[tuple]: 与queries一一对应的(最佳匹配的候选文本, 匹配分数, 是否使用了拼音匹配)
+    """
+    results = [(None, 0, False)] * len(queries)
+    if not PYPINYIN_AVAILABLE or not candidates:
+        return results
+    
+    # 每个中文查询占用连续的若干行：第一行为原文小写形式，其余为拼音变体，
+    # 同分时优先视为未使用拼音
+    rows = []
+    blocks = []
+    for index, query in enumerate(queries):
+        if not contains_chinese(query):
+            continue
+        query_lower = query.lower()
+        variants = [query_lower] + sorted(get_pinyin_variants(query) - {query_lower})
+        blocks.append((index, len(rows), len(variants)))
+        rows.extend(variants)
+    
+    if not rows:
+        return results
+    
+    candidates_lower = [candidate.lower() for candidate in candidates]
+    scores = process.cdist(rows, candidates_lower, scorer=fuzz.ratio, dtype=float,
+                           workers=-1)
+    
+    for index, start, count in blocks:
+        block = scores[start:start + count]
+        
+        # 首先看直接文本匹配，分数足够高时直接采用
+        direct_scores = block[0]
+        best_direct_index = int(direct_scores.argmax())
+        best_direct_score = float(direct_scores[best_direct_index])
+        if best_direct_score >= 75:
+            results[index] = (candidates[best_direct_index], best_direct_score, False)
+            continue
+        
+        # 否则在全部变体与全部候选的分数中取最高分
+        best_index = int(block.argmax())
+        if block.flat[best_index] > 0:
+            variant_index, candidate_index = divmod(best_index, len(candidates))
+            # 最后一项检查是否使用了拼音变体
+            results[index] = (candidates[candidate_index],
+                              float(block.flat[best_index]), variant_index != 0)
+    
+    return results
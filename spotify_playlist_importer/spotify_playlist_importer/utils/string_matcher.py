@@ -4,13 +4,192 @@
 提供歌曲标题和艺术家名称的相似度计算功能，用于匹配Spotify搜索结果。
 """
 
+import heapq
 import logging
-from typing import Dict, List, Optional, Tuple, Union, Any
+from functools import lru_cache
+from operator import itemgetter
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple, Union
 
-import fuzzywuzzy.fuzz as fuzz
-from fuzzywuzzy import process
+import numpy as np
+from rapidfuzz import fuzz, process
+from rapidfuzz.distance import Indel
+from rapidfuzz.utils import default_process
 
-from spotify_playlist_importer.utils.text_normalizer import normalize_text
+from spotify_playlist_importer.utils.pinyin_utils import (
+    contains_chinese as _contains_chinese
+)
+from spotify_playlist_importer.utils.text_normalizer import (
+    TextNormalizer, _get_normalizer
+)
+
+# 有条件导入pyahocorasick，如果导入失败则回退到逐对的子串检测
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# 拼接输入艺术家名时使用的分隔符，艺术家名中不会出现该控制字符，子串不会跨越两个名字
+_ARTIST_SEPARATOR = '\x00'
+
+
+# 匹配前归一化时需要移除的模式（括号信息在第二阶段匹配中单独处理）
+_MATCHING_REMOVE_PATTERNS = ["brackets"]
+
+
+@lru_cache(maxsize=1)
+def _text_normalizer() -> TextNormalizer:
+    """
+    获取匹配使用的文本归一化器（首次使用时创建一次）
+    
+    TextNormalizer在初始化时加载并编译全部替换模式，复用同一实例可避免每次归一化都重新编译正则。
+    这里直接使用text_normalizer模块共享的默认实例，与其他匹配器共用同一个归一化器。
+    
+    Returns:
+        TextNormalizer: 使用默认模式的文本归一化器
+    """
+    return _get_normalizer()
+
+
+@lru_cache(maxsize=4096)
+def _normalize_for_matching(text: str) -> str:
+    """
+    归一化文本并移除括号内容（带缓存）
+    
+    同一输入标题会与每个候选比较，整个歌单导入过程中也会反复遇到相同的标题，缓存后只需归一化一次。
+
+    Args:
+        text: 要归一化的文本
+
+    Returns:
+        str: 归一化后的文本
+    """
+    if text is None:
+        return ""
+    return _text_normalizer().normalize(text, _MATCHING_REMOVE_PATTERNS)
+
+
+@lru_cache(maxsize=8192)
+def _pinyin(text: str) -> str:
+    """
+    获取文本以空格分隔的拼音表示（带缓存）
+    
+    同一候选艺术家名会在歌单中的多首歌曲间反复出现，缓存后pypinyin只需转换一次。
+    
+    Args:
+        text: 输入文本
+        
+    Returns:
+        str: 拼音表示，pypinyin不可用或转换失败时返回原文本
+    """
+    try:
+        # 如果pypinyin库可用，使用它进行拼音转换
+        import pypinyin
+        pinyin_list = pypinyin.lazy_pinyin(text)
+        return ' '.join(pinyin_list)
+    except ImportError:
+        logging.warning("未找到pypinyin库，将返回原始文本")
+        return text
+    except Exception as e:
+        logging.warning("拼音转换失败: %s", e)
+        return text
+
+
+# 候选数量达到该值时才使用多线程批量打分，候选较少时线程调度的开销超过收益
+_PARALLEL_MIN_CHOICES = 1000
+
+
+def _score_matrix(queries: List[str], choices: List[str], **kwargs) -> np.ndarray:
+    """
+    计算queries与choices的相似度矩阵（行：queries，列：choices）
+    
+    process.cdist按行把计算分给多个线程（RapidFuzz在C++中释放GIL），而查询通常只有一个标题
+    或少数几个艺术家。候选较多时把候选作为行、启用全部CPU核心计算后再转置；
+    这里使用的算法均对两个参数对称，结果与直接计算一致。
+    
+    Args:
+        queries: 查询文本列表
+        choices: 候选文本列表
+        **kwargs: 传给process.cdist的其他参数（scorer、processor、score_cutoff等）
+        
+    Returns:
+        np.ndarray: 形状为(len(queries), len(choices))的float64分数矩阵
+    """
+    if len(choices) >= _PARALLEL_MIN_CHOICES:
+        return process.cdist(choices, queries, dtype=np.float64, workers=-1, **kwargs).T
+    return process.cdist(queries, choices, dtype=np.float64, **kwargs)
+
+
+def _title_scorer_cutoff(min_title_score: Optional[float],
+                         weight: float) -> Optional[float]:
+    """
+    计算标题相似度中单个算法的score_cutoff
+    
+    标题相似度是三种算法分数的加权和（权重之和为1）。假设其余算法都得满分，
+    某个算法的分数仍低于该下限时，标题相似度必然达不到min_title_score，
+    此时RapidFuzz可以提前终止计算并返回0，不影响最终结果。下限额外放宽1分以抵消浮点误差。
+    
+    Args:
+        min_title_score: 候选需要达到的最低标题相似度，None表示不限制
+        weight: 该算法在标题相似度中的权重
+        
+    Returns:
+        Optional[float]: 该算法的score_cutoff，无法提前终止时为None
+    """
+    if min_title_score is None:
+        return None
+    cutoff = (min_title_score - (1.0 - weight) * 100.0) / weight - 1.0
+    return cutoff if cutoff > 0 else None
+
+
+@lru_cache(maxsize=256)
+def _artist_substring_index(input_artists_lower: FrozenSet[str]) -> Tuple[Any, str]:
+    """
+    为一组输入艺术家名构建子串检测所需的结构（带缓存）
+    
+    同一首输入歌曲的全部候选共用这一结构：Aho-Corasick自动机一次扫描候选艺术家名即可判断
+    是否包含任一输入艺术家名；拼接后的输入艺术家名一次子串查找即可判断候选艺术家名是否被包含。
+    
+    Args:
+        input_artists_lower: 输入艺术家小写形式的集合
+        
+    Returns:
+        Tuple[Any, str]: (Aho-Corasick自动机，pyahocorasick不可用时为None; 拼接后的输入艺术家名)
+    """
+    automaton = None
+    if AHOCORASICK_AVAILABLE:
+        automaton = ahocorasick.Automaton()
+        for artist in input_artists_lower:
+            if artist:
+                automaton.add_word(artist, artist)
+        automaton.make_automaton()
+    return automaton, _ARTIST_SEPARATOR.join(input_artists_lower)
+
+
+@lru_cache(maxsize=8192)
+def _artist_substring_match(input_artists_lower: FrozenSet[str],
+                            candidate_artist: str) -> bool:
+    """
+    检查候选艺术家名与某个输入艺术家名是否互相包含（带缓存）
+    
+    导入歌单时同一输入艺术家的多首歌曲会搜到相同的候选艺术家，缓存后每对只需检测一次，
+    在多次match调用之间复用。
+    
+    Args:
+        input_artists_lower: 输入艺术家小写形式的集合（不含空字符串）
+        candidate_artist: 候选艺术家名的小写形式
+        
+    Returns:
+        bool: 候选艺术家名包含某个输入艺术家名或被其包含时返回True
+    """
+    automaton, joined_input_artists = _artist_substring_index(input_artists_lower)
+    # 候选艺术家名是否被某个输入艺术家名包含
+    if candidate_artist in joined_input_artists:
+        return True
+    # 候选艺术家名是否包含某个输入艺术家名
+    if automaton is not None:
+        return next(automaton.iter(candidate_artist), None) is not None
+    return any(input_artist in candidate_artist for input_artist in input_artists_lower)
 
 
 class StringMatcher:
@@ -29,7 +208,8 @@ class StringMatcher:
     """
 
     def __init__(self, title_weight: float = 0.6, artist_weight: float = 0.4,
-                 threshold: float = 75.0, top_k: int = 3):
+                 threshold: float = 75.0, top_k: int = 3,
+                 min_title_score: float = 0.0):
         """
         初始化StringMatcher
         
@@ -41,6 +221,8 @@ class StringMatcher:
             artist_weight: 艺术家相似度在总得分中的权重，默认0.4
             threshold: 最小匹配阈值，默认75（满分100）
             top_k: 返回的最佳匹配数量，默认3
+            min_title_score: 标题相似度下限，标题相似度低于该值的候选即使加权总分
+                超过阈值也不会被返回，避免仅凭艺术家相同匹配到错误的歌曲；默认0表示不限制
         """
         # 验证权重参数
         if not (0 <= title_weight <= 1) or not (0 <= artist_weight <= 1):
@@ -52,6 +234,7 @@ class StringMatcher:
         self.artist_weight = artist_weight
         self.threshold = threshold
         self.top_k = top_k
+        self.min_title_score = min_title_score
 
     def normalize_for_matching(self, text: str) -> str:
         """
@@ -66,8 +249,24 @@ class StringMatcher:
         Returns:
             str: 归一化后的文本
         """
-        # 使用文本归一化模块进行处理，并移除括号内容
-        return normalize_text(text, remove_patterns=["brackets"])
+        # 使用文本归一化模块进行处理，并移除括号内容（结果缓存）
+        return _normalize_for_matching(text)
+
+    def _normalize_batch(self, texts: List[str]) -> List[str]:
+        """
+        批量归一化一组文本
+        
+        搜索结果中同一标题常重复出现（不同版本、不同专辑），每个不同的文本只归一化一次，
+        并省去逐个调用时的方法查找开销。
+        
+        Args:
+            texts: 要归一化的文本列表
+            
+        Returns:
+            List[str]: 与texts一一对应的归一化文本
+        """
+        normalized = {text: _normalize_for_matching(text) for text in set(texts)}
+        return [normalized[text] for text in texts]
 
     def calculate_title_similarity(self, input_title: str, candidate_title: str) -> float:
         """
@@ -84,17 +283,33 @@ class StringMatcher:
             float: 相似度分数（0-100）
         """
         # 归一化标题
-        norm_input = self.normalize_for_matching(input_title)
-        norm_candidate = self.normalize_for_matching(candidate_title)
+        return self._calculate_title_similarity_norm(
+            self.normalize_for_matching(input_title),
+            self.normalize_for_matching(candidate_title))
+
+    def _calculate_title_similarity_norm(self, norm_input: str,
+                                         norm_candidate: str) -> float:
+        """
+        计算两个已归一化标题的相似度分数
+        
+        供已经归一化好输入标题的调用方使用，避免对同一输入标题重复归一化。
+
+        Args:
+            norm_input: 归一化后的输入标题
+            norm_candidate: 归一化后的候选标题
 
-        logging.debug(f"标题比较: '{norm_input}' vs '{norm_candidate}'")
+        Returns:
+            float: 相似度分数（0-100）
+        """
+        logging.debug("标题比较: '%s' vs '%s'", norm_input, norm_candidate)
 
-        # 计算比率得分 - 标准编辑距离相似度
-        ratio_score = fuzz.ratio(norm_input, norm_candidate)
+        # 计算比率得分 - 标准编辑距离相似度（即fuzz.ratio，直接调用底层的Indel归一化相似度）
+        ratio_score = Indel.normalized_similarity(norm_input, norm_candidate) * 100.0
         # 计算部分比率（处理部分匹配，如子字符串）
         partial_ratio_score = fuzz.partial_ratio(norm_input, norm_candidate)
-        # 计算标记排序比率（处理词序不同的情况）
-        token_sort_ratio_score = fuzz.token_sort_ratio(norm_input, norm_candidate)
+        # 计算标记排序比率（处理词序不同的情况），词级算法与fuzzywuzzy一样先做预处理（转小写、去除标点）
+        token_sort_ratio_score = fuzz.token_sort_ratio(norm_input, norm_candidate,
+                                                       processor=default_process)
 
         # 综合三种得分，可以调整权重
         # 标准比率和部分比率各占40%，词序比率占20%
@@ -103,8 +318,9 @@ class StringMatcher:
                       partial_ratio_score * 0.4 + 
                       token_sort_ratio_score * 0.2)
 
-        logging.debug(f"标题相似度分数: {final_score:.2f} [ratio={ratio_score}, " +
-                     f"partial={partial_ratio_score}, token_sort={token_sort_ratio_score}]")
+        logging.debug("标题相似度分数: %.2f [ratio=%s, partial=%s, token_sort=%s]",
+                      final_score, ratio_score, partial_ratio_score,
+                      token_sort_ratio_score)
 
         return final_score
 
@@ -118,7 +334,8 @@ class StringMatcher:
         Returns:
             bool: 是否包含中文字符
         """
-        return any('\u4e00' <= c <= '\u9fff' for c in text)
+        # 预编译正则扫描且结果带缓存，见pinyin_utils.contains_chinese
+        return _contains_chinese(text)
     
     def get_pinyin(self, text: str) -> str:
         """
@@ -130,17 +347,7 @@ class StringMatcher:
         Returns:
             str: 拼音表示
         """
-        try:
-            # 如果pypinyin库可用，使用它进行拼音转换
-            import pypinyin
-            pinyin_list = pypinyin.lazy_pinyin(text)
-            return ' '.join(pinyin_list)
-        except ImportError:
-            logging.warning("未找到pypinyin库，将返回原始文本")
-            return text
-        except Exception as e:
-            logging.warning(f"拼音转换失败: {e}")
-            return text
+        return _pinyin(text)
 
     def calculate_artists_similarity(self, input_artists: List[str], candidate_artists: List[str]) -> float:
         """
@@ -161,80 +368,146 @@ class StringMatcher:
             # 一个为空，另一个不为空，基本不匹配
             return 0.0
 
+        # 主要艺术家（第一位艺术家）高度匹配时直接得出结果，extractOne在C中找出不低于90的最高分，
+        # 无需计算其余输入艺术家
+        main_artist_match = process.extractOne(input_artists[0], candidate_artists,
+                                               scorer=fuzz.token_set_ratio,
+                                               processor=default_process,
+                                               score_cutoff=90)
+        if main_artist_match is not None:
+            logging.debug("艺术家比较: %s vs %s", input_artists, candidate_artists)
+            return self._main_artist_similarity(input_artists[0], main_artist_match[1])
+
+        # 一次调用计算全部输入艺术家与候选艺术家的相似度矩阵（行：输入艺术家，列：候选艺术家）
+        scores = process.cdist(input_artists, candidate_artists,
+                               scorer=fuzz.token_set_ratio,
+                               processor=default_process, dtype=np.float64)
+        return self._artists_similarity_from_scores(input_artists, candidate_artists,
+                                                    scores)
+
+    def _artists_similarity_from_scores(
+            self, input_artists: List[str], candidate_artists: List[str],
+            scores: np.ndarray,
+            input_pinyin: Optional[Tuple[List[str], bool]] = None) -> float:
+        """
+        根据已计算好的艺术家相似度矩阵得出艺术家列表的相似度分数
+        
+        Args:
+            input_artists: 输入的艺术家列表（非空）
+            candidate_artists: 候选歌曲的艺术家列表（非空）
+            scores: 输入艺术家与候选艺术家的token_set_ratio矩阵（行：输入艺术家，列：候选艺术家）
+            input_pinyin: 预先计算的输入艺术家_pinyin_artists结果，批量计算时同一输入只转换一次；
+                为None时按需计算
+
+        Returns:
+            float: 相似度分数（0-100）
+        """
         # 日志记录
-        logging.debug(f"艺术家比较: {input_artists} vs {candidate_artists}")
+        logging.debug("艺术家比较: %s vs %s", input_artists, candidate_artists)
         
-        # 检查主要艺术家是否完全存在于候选艺术家列表中
-        if input_artists and len(input_artists) > 0:
-            main_artist = input_artists[0]  # 第一位艺术家视为主要艺术家
-            
-            # 检查主要艺术家是否完全匹配
-            main_artist_highest_match = max(
-                fuzz.token_set_ratio(main_artist, cand_artist) 
-                for cand_artist in candidate_artists
-            )
-            
-            if main_artist_highest_match >= 90:
-                logging.debug(f"主要艺术家高度匹配: {main_artist}")
-                artist_similarity = max(85.0, main_artist_highest_match)  # 保证至少85分
-                logging.debug(f"艺术家相似度结果(主要艺术家匹配): {artist_similarity:.2f}")
-                return artist_similarity
-
-        # 计算每个输入艺术家与候选艺术家的最高匹配度
-        best_matches = []
-        for input_artist in input_artists:
-            # 计算与每个候选艺术家的匹配度，选择最高的
-            best_match = max(fuzz.token_set_ratio(input_artist, cand_artist) for cand_artist in candidate_artists)
-            best_matches.append(best_match)
+        # 检查主要艺术家（第一位艺术家）是否完全匹配
+        main_artist_highest_match = float(scores[0].max())
+        if main_artist_highest_match >= 90:
+            return self._main_artist_similarity(input_artists[0],
+                                                main_artist_highest_match)
+
+        # 每个输入艺术家与候选艺术家的最高匹配度
+        best_matches = scores.max(axis=1).tolist()
 
         # 如果所有艺术家的匹配度都很高，那么给予高分
         avg_match = sum(best_matches) / len(best_matches) if best_matches else 0
         
-        # 如果艺术家相似度较低（低于60分），尝试拼音比较
-        if avg_match < 60.0 and self.contains_chinese(''.join(input_artists + candidate_artists)):
-            logging.debug("艺术家相似度较低，尝试拼音比较")
-            
-            # 将输入艺术家转换为拼音
-            input_pinyin_artists = []
-            for artist in input_artists:
-                if self.contains_chinese(artist):
-                    pinyin = self.get_pinyin(artist)
-                    input_pinyin_artists.append(pinyin)
-                    logging.debug(f"输入艺术家拼音: {artist} -> {pinyin}")
-                else:
-                    input_pinyin_artists.append(artist)
-            
-            # 将候选艺术家转换为拼音
-            candidate_pinyin_artists = []
-            for artist in candidate_artists:
-                if self.contains_chinese(artist):
-                    pinyin = self.get_pinyin(artist)
-                    candidate_pinyin_artists.append(pinyin)
-                    logging.debug(f"候选艺术家拼音: {artist} -> {pinyin}")
-                else:
-                    candidate_pinyin_artists.append(artist)
-
-            # 计算拼音相似度
-            pinyin_best_matches = []
-            for input_pinyin in input_pinyin_artists:
-                best_match = max(fuzz.token_set_ratio(input_pinyin, cand_pinyin) 
-                                 for cand_pinyin in candidate_pinyin_artists)
-                pinyin_best_matches.append(best_match)
-            
-            pinyin_avg_match = sum(pinyin_best_matches) / len(pinyin_best_matches) if pinyin_best_matches else 0
-            
-            logging.debug(f"拼音相似度: {pinyin_avg_match:.2f}")
-            
-            # 如果拼音相似度较高，使用拼音相似度替代原始相似度
-            if pinyin_avg_match > avg_match:
-                avg_match = pinyin_avg_match
-                logging.debug(f"艺术家相似度更新为拼音相似度: {avg_match:.2f}")
+        # 如果艺术家相似度较低（低于60分）且任一方包含中文，尝试拼音比较
+        if avg_match < 60.0:
+            if input_pinyin is None:
+                input_pinyin = self._pinyin_artists(input_artists, "输入")
+            input_pinyin_artists, input_has_chinese = input_pinyin
+            candidate_pinyin_artists, candidate_has_chinese = self._pinyin_artists(
+                candidate_artists, "候选")
+            if input_has_chinese or candidate_has_chinese:
+                avg_match = self._pinyin_similarity(input_pinyin_artists,
+                                                    candidate_pinyin_artists, avg_match)
 
         # 记录结果
-        logging.debug(f"艺术家相似度分数: {avg_match:.2f}, 最佳匹配: {best_matches}")
+        logging.debug("艺术家相似度分数: %.2f, 最佳匹配: %s", avg_match, best_matches)
 
         return avg_match
 
+    def _pinyin_artists(self, artists: List[str], label: str) -> Tuple[List[str], bool]:
+        """
+        将艺术家列表中的中文艺术家名转换为拼音
+        
+        Args:
+            artists: 艺术家列表
+            label: 日志中标识艺术家来源的前缀（"输入"或"候选"）
+
+        Returns:
+            Tuple[List[str], bool]: (转换后的艺术家列表, 是否有艺术家名包含中文)
+        """
+        pinyin_artists = []
+        has_chinese = False
+        for artist in artists:
+            if self.contains_chinese(artist):
+                has_chinese = True
+                pinyin = self.get_pinyin(artist)
+                pinyin_artists.append(pinyin)
+                logging.debug("%s艺术家拼音: %s -> %s", label, artist, pinyin)
+            else:
+                pinyin_artists.append(artist)
+        return pinyin_artists, has_chinese
+
+    def _pinyin_similarity(self, input_pinyin_artists: List[str],
+                           candidate_pinyin_artists: List[str],
+                           avg_match: float) -> float:
+        """
+        艺术家相似度较低时，用拼音形式重新计算艺术家相似度
+        
+        Args:
+            input_pinyin_artists: 转换为拼音的输入艺术家列表
+            candidate_pinyin_artists: 转换为拼音的候选艺术家列表
+            avg_match: 原始艺术家相似度
+
+        Returns:
+            float: 拼音相似度与原始相似度中的较高者
+        """
+        logging.debug("艺术家相似度较低，尝试拼音比较")
+        
+        # 计算拼音相似度：一次cdist计算全部拼音艺术家的相似度矩阵，输入侧只预处理一次，
+        # 每个输入艺术家取与候选艺术家的最高匹配度
+        pinyin_scores = process.cdist(input_pinyin_artists, candidate_pinyin_artists,
+                                      scorer=fuzz.token_set_ratio,
+                                      processor=default_process, dtype=np.float64)
+        pinyin_best_matches = pinyin_scores.max(axis=1).tolist()
+        
+        pinyin_avg_match = (sum(pinyin_best_matches) / len(pinyin_best_matches)
+                            if pinyin_best_matches else 0)
+        
+        logging.debug("拼音相似度: %.2f", pinyin_avg_match)
+        
+        # 如果拼音相似度较高，使用拼音相似度替代原始相似度
+        if pinyin_avg_match > avg_match:
+            avg_match = pinyin_avg_match
+            logging.debug("艺术家相似度更新为拼音相似度: %.2f", avg_match)
+
+        return avg_match
+
+    def _main_artist_similarity(self, main_artist: str,
+                                main_artist_highest_match: float) -> float:
+        """
+        主要艺术家高度匹配（不低于90分）时的艺术家相似度分数
+        
+        Args:
+            main_artist: 输入的主要艺术家（第一位艺术家）
+            main_artist_highest_match: 主要艺术家与候选艺术家的最高匹配度
+
+        Returns:
+            float: 相似度分数，至少85分
+        """
+        logging.debug("主要艺术家高度匹配: %s", main_artist)
+        artist_similarity = max(85.0, main_artist_highest_match)  # 保证至少85分
+        logging.debug("艺术家相似度结果(主要艺术家匹配): %.2f", artist_similarity)
+        return artist_similarity
+
     def calculate_weighted_score(self, title_score: float, artist_score: float) -> float:
         """
         计算标题和艺术家相似度的加权总分
@@ -261,56 +534,65 @@ class StringMatcher:
         """
         return self.calculate_weighted_score(title_score, artist_score)
 
-    def _quick_check(self, input_title: str, input_artists: List[str], candidate: Dict[str, Any]) -> bool:
+    def _quick_check(self, input_title_lower: str, input_title_len: int,
+                     input_artists_lower: FrozenSet[str], candidate_title: str,
+                     candidate_artists: List[str]) -> bool:
         """
         快速检查候选是否有可能匹配，用于早期剪枝
         
         此方法是性能优化的关键部分，通过简单但高效的启发式规则，
         在进行详细（计算密集型）相似度计算前过滤掉明显不匹配的候选。
+        输入标题和艺术家的小写形式由调用方在循环外预先计算一次，候选的标题和艺术家名也已由调用方提取。
         
         优化策略:
         1. 检查标题长度差异 - 差异过大说明可能不是同一首歌
         2. 检查艺术家交集 - 完全无交集的艺术家很可能不是同一首歌
         
         Args:
-            input_title: 输入歌曲标题
-            input_artists: 输入艺术家列表
-            candidate: 候选歌曲
+            input_title_lower: 输入歌曲标题的小写形式
+            input_title_len: 输入歌曲标题小写形式的长度
+            input_artists_lower: 输入艺术家小写形式的集合
+            candidate_title: 候选歌曲标题
+            candidate_artists: 候选歌曲的艺术家名列表
             
         Returns:
             bool: 如果候选可能匹配则返回True，否则返回False
         """
-        # 获取候选标题和艺术家
-        candidate_title = candidate.get("name", "")
-        candidate_artists = [artist.get("name", "") for artist in candidate.get("artists", [])]
-        
-        # 转换为小写以进行快速比较
-        input_title_lower = input_title.lower()
-        candidate_title_lower = candidate_title.lower()
-        
         # 如果标题长度差异太大，可能不匹配
         # 此启发式规则基于观察：真实匹配的歌曲标题长度通常不会相差太多
-        if abs(len(input_title_lower) - len(candidate_title_lower)) > len(input_title_lower) * 0.5:
+        candidate_title_len = len(candidate_title.lower())
+        if abs(input_title_len - candidate_title_len) > input_title_len * 0.5:
             return False
             
         # 检查艺术家是否有交集
-        if input_artists and candidate_artists:
-            input_artists_lower = [a.lower() for a in input_artists]
-            candidate_artists_lower = [a.lower() for a in candidate_artists]
+        return self._artists_may_match(input_artists_lower, candidate_artists)
+
+    def _artists_may_match(self, input_artists_lower: FrozenSet[str],
+                           candidate_artists: List[str]) -> bool:
+        """
+        快速检查的艺术家部分：输入艺术家与候选艺术家是否有完全相同或互相包含的名字
+        
+        Args:
+            input_artists_lower: 输入艺术家小写形式的集合
+            candidate_artists: 候选歌曲的艺术家名列表
             
-            # 如果没有任何艺术家名称部分匹配，可能不匹配
-            # 这里使用部分包含而非完全匹配，因为艺术家名称可能有变体
-            has_artist_match = False
-            for input_artist in input_artists_lower:
-                for candidate_artist in candidate_artists_lower:
-                    if input_artist in candidate_artist or candidate_artist in input_artist:
-                        has_artist_match = True
-                        break
-                if has_artist_match:
-                    break
-                    
-            if not has_artist_match:
-                return False
+        Returns:
+            bool: 任一方为空或存在匹配的艺术家名时返回True，否则返回False
+        """
+        if input_artists_lower and candidate_artists:
+            candidate_artists_lower = [artist.lower() for artist in candidate_artists]
+            
+            # 先用集合判断完全相同的艺术家名（最常见的情况），isdisjoint在C中逐个哈希查找，
+            # 命中第一个即返回，无需为候选艺术家另建集合
+            if not input_artists_lower.isdisjoint(candidate_artists_lower):
+                return True
+            
+            # 否则检查部分包含，因为艺术家名称可能有变体
+            # 空字符串包含于任何名字中，自动机无法表示，单独处理
+            if '' in input_artists_lower:
+                return True
+            return any(_artist_substring_match(input_artists_lower, candidate_artist)
+                       for candidate_artist in candidate_artists_lower)
         
         return True
         
@@ -337,33 +619,208 @@ class StringMatcher:
             logging.debug("没有候选歌曲，返回空列表")
             return []
             
-        matches = []
-        
-        for candidate in candidates:
-            # 快速检查，早期剪枝
-            if not self._quick_check(input_title, input_artists, candidate):
-                continue
-                
-            # 计算相似度
-            similarity_scores = self.calculate_similarity(input_title, input_artists, candidate)
-            weighted_score = similarity_scores["weighted_score"]
+        # 一次遍历取出候选的标题和艺术家名（按列存放），后续剪枝和打分都不再访问候选字典
+        titles = [candidate.get("name", "") for candidate in candidates]
+        artist_lists = [[artist.get("name", "")
+                         for artist in candidate.get("artists", [])]
+                        for candidate in candidates]
+        
+        # 快速检查，早期剪枝；输入的小写形式在循环外只计算一次
+        input_title_len = len(input_title.lower())
+        input_artists_lower = (frozenset(artist.lower() for artist in input_artists)
+                               if input_artists else frozenset())
+        # 标题长度规则（同_quick_check）对全部候选向量化判断，只对通过的候选检查艺术家
+        title_lens = np.fromiter((len(title.lower()) for title in titles),
+                                 dtype=np.float64, count=len(titles))
+        length_ok = np.abs(title_lens - input_title_len) <= input_title_len * 0.5
+        kept = [index for index in np.flatnonzero(length_ok).tolist()
+                if self._artists_may_match(input_artists_lower, artist_lists[index])]
+        
+        # 对通过检查的候选批量计算标题相似度；艺术家相似度最高为100，
+        # 若标题分数决定了加权总分即使艺术家满分也低于阈值，则无需再计算艺术家相似度。
+        # 标题相似度低于下限的候选同样直接淘汰
+        max_artist_contribution = self.artist_weight * 100.0
+        required_title_score = self.min_title_score
+        if self.title_weight > 0:
+            required_title_score = max(
+                required_title_score,
+                (self.threshold - max_artist_contribution) / self.title_weight)
+        title_scores = self._batch_title_similarity(
+            input_title, [titles[index] for index in kept],
+            required_title_score if required_title_score > 0 else None)
+        viable = [(index, title_score)
+                  for index, title_score in zip(kept, title_scores)
+                  if title_score >= self.min_title_score
+                  and (self.title_weight * title_score + max_artist_contribution
+                       >= self.threshold)]
+        artist_scores = self._batch_artists_similarity(
+            input_artists, [artist_lists[index] for index, _ in viable])
+        
+        # 向量化计算加权总分（同calculate_weighted_score），保留超过阈值的候选，
+        # 以(加权总分, 候选下标, 标题相似度, 艺术家相似度)元组记录
+        viable_title_scores = np.array([title_score for _, title_score in viable],
+                                       dtype=np.float64)
+        weighted_scores = (
+            self.title_weight * viable_title_scores
+            + self.artist_weight * np.array(artist_scores, dtype=np.float64))
+        weighted_list = weighted_scores.tolist()
+        passed = np.flatnonzero(weighted_scores >= self.threshold).tolist()
+        scored = [(weighted_list[position], viable[position][0], viable[position][1],
+                   artist_scores[position])
+                  for position in passed]
+        
+        # 按相似度降序排序；如果指定了top_k，用堆只选出前k个结果（与排序后截取的结果和顺序一致）
+        if self.top_k > 0:
+            scored = heapq.nlargest(self.top_k, scored, key=itemgetter(0))
+        else:
+            scored.sort(key=itemgetter(0), reverse=True)
+        
+        # 只为最终返回的候选构造结果字典：浅复制候选（避免修改原始数据）并添加相似度信息
+        return [
+            {
+                **candidates[index],
+                "similarity_scores": {
+                    'title_score': title_score,
+                    'artist_score': artist_score,
+                    'weighted_score': weighted_score
+                }
+            }
+            for weighted_score, index, title_score, artist_score in scored
+        ]
+
+    def calculate_similarities(self, input_title: str, input_artists: List[str],
+                               candidates: List[Dict[str, Any]]
+                               ) -> List[Dict[str, float]]:
+        """
+        批量计算输入歌曲与一组候选歌曲的相似度
+        
+        与逐个调用calculate_similarity结果一致，但不做早期剪枝。输入标题只归一化一次，
+        每种相似度算法用一次process.cdist对全部候选计算，艺术家相似度矩阵也一次算出。
+        
+        Args:
+            input_title: 输入歌曲标题
+            input_artists: 输入艺术家列表
+            candidates: 候选歌曲列表
+            
+        Returns:
+            List[Dict[str, float]]: 与candidates一一对应的相似度字典列表
+        """
+        titles = [candidate.get('name', '') for candidate in candidates]
+        artist_lists = [[artist.get('name', '')
+                         for artist in candidate.get('artists', [])]
+                        for candidate in candidates]
+        return self._calculate_similarities(input_title, input_artists, titles,
+                                            artist_lists)
+
+    def _calculate_similarities(self, input_title: str, input_artists: List[str],
+                                titles: List[str], artist_lists: List[List[str]]
+                                ) -> List[Dict[str, float]]:
+        """
+        根据按列存放的候选标题和艺术家名批量计算相似度
+        
+        Args:
+            input_title: 输入歌曲标题
+            input_artists: 输入艺术家列表
+            titles: 候选歌曲标题列表
+            artist_lists: 与titles一一对应的候选艺术家名列表
+            
+        Returns:
+            List[Dict[str, float]]: 与titles一一对应的相似度字典列表
+        """
+        title_scores = self._batch_title_similarity(input_title, titles)
+        artist_scores = self._batch_artists_similarity(input_artists, artist_lists)
+        title_weight = self.title_weight
+        artist_weight = self.artist_weight
+        return [
+            {
+                'title_score': title_score,
+                'artist_score': artist_score,
+                'weighted_score': (title_weight * title_score
+                                   + artist_weight * artist_score)
+            }
+            for title_score, artist_score in zip(title_scores, artist_scores)
+        ]
+
+    def _batch_title_similarity(self, input_title: str, titles: List[str],
+                                min_title_score: Optional[float] = None) -> List[float]:
+        """
+        批量计算输入标题与一组候选标题的相似度
+        
+        与逐个调用calculate_title_similarity结果一致。输入标题只归一化一次，
+        每种相似度算法用一次process.cdist对全部候选计算，再按相同权重向量化合并。
+        
+        Args:
+            input_title: 输入歌曲标题
+            titles: 候选歌曲标题列表
+            min_title_score: 调用方需要的最低标题相似度。指定时各算法带score_cutoff计算，
+                低于该值的候选返回的分数可能偏低，但仍低于该值
             
-            # 如果相似度超过阈值，添加到匹配结果
-            if weighted_score >= self.threshold:
-                # 复制候选，避免修改原始数据
-                match = candidate.copy()
-                # 添加相似度信息
-                match["similarity_scores"] = similarity_scores
-                matches.append(match)
-        
-        # 按相似度降序排序
-        matches.sort(key=lambda x: x["similarity_scores"]["weighted_score"], reverse=True)
-        
-        # 如果指定了top_k，只返回前k个结果
-        if self.top_k > 0 and len(matches) > self.top_k:
-            matches = matches[:self.top_k]
+        Returns:
+            List[float]: 与titles一一对应的标题相似度
+        """
+        if not titles:
+            return []
+        
+        norm_input = self.normalize_for_matching(input_title)
+        norm_candidates = self._normalize_batch(titles)
+        # 比率得分即Indel归一化相似度（0-1）乘以100，直接使用底层算法，score_cutoff按同一比例换算
+        ratio_cutoff = _title_scorer_cutoff(min_title_score, 0.4)
+        if ratio_cutoff is not None:
+            ratio_cutoff /= 100.0
+        ratio_scores = _score_matrix([norm_input], norm_candidates,
+                                     scorer=Indel.normalized_similarity,
+                                     score_cutoff=ratio_cutoff)[0] * 100.0
+        partial_ratio_scores = _score_matrix(
+            [norm_input], norm_candidates, scorer=fuzz.partial_ratio,
+            score_cutoff=_title_scorer_cutoff(min_title_score, 0.4))[0]
+        token_sort_ratio_scores = _score_matrix(
+            [norm_input], norm_candidates, scorer=fuzz.token_sort_ratio,
+            processor=default_process,
+            score_cutoff=_title_scorer_cutoff(min_title_score, 0.2))[0]
+        return (ratio_scores * 0.4 +
+                partial_ratio_scores * 0.4 +
+                token_sort_ratio_scores * 0.2).tolist()
+
+    def _batch_artists_similarity(self, input_artists: List[str],
+                                  artist_lists: List[List[str]]) -> List[float]:
+        """
+        批量计算输入艺术家与一组候选艺术家列表的相似度
+        
+        与逐个调用calculate_artists_similarity结果一致。所有候选的艺术家拼成一个列表，
+        一次计算与全部输入艺术家的相似度矩阵，再按各候选的列范围切分。
+        
+        Args:
+            input_artists: 输入艺术家列表
+            artist_lists: 候选艺术家名列表的列表
             
-        return matches
+        Returns:
+            List[float]: 与artist_lists一一对应的艺术家相似度
+        """
+        artist_matrix = None
+        input_pinyin = None
+        if input_artists:
+            flat_artists = [artist for artists in artist_lists for artist in artists]
+            if flat_artists:
+                artist_matrix = _score_matrix(input_artists, flat_artists,
+                                              scorer=fuzz.token_set_ratio,
+                                              processor=default_process)
+                # 输入艺术家的拼音形式及是否包含中文只取决于输入，对全部候选只计算一次
+                input_pinyin = self._pinyin_artists(input_artists, "输入")
+        
+        artist_scores = []
+        offset = 0
+        for candidate_artists in artist_lists:
+            if not input_artists or not candidate_artists:
+                # 空列表的情况与calculate_artists_similarity一致
+                artist_scores.append(
+                    100.0 if not input_artists and not candidate_artists else 0.0)
+            else:
+                artist_scores.append(self._artists_similarity_from_scores(
+                    input_artists, candidate_artists,
+                    artist_matrix[:, offset:offset + len(candidate_artists)],
+                    input_pinyin))
+            offset += len(candidate_artists)
+        return artist_scores
 
     def calculate_similarity(self, input_title: str, input_artists: List[str],
                         candidate: Dict[str, Any]) -> Dict[str, float]:
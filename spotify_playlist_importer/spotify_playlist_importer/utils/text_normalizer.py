@@ -11,7 +11,8 @@
 3. 空白字符和标点符号的标准化
 """
 
-from typing import List, Optional, Dict, Pattern, Union
+from typing import FrozenSet, List, Optional, Dict, Pattern, Tuple, Union
+from functools import lru_cache
 import re
 import unicodedata
 import json
@@ -26,10 +27,22 @@ from spotify_playlist_importer.utils.config_manager import ConfigManager
 logger = get_logger(__name__)
 
 # 配置管理器
-config_manager = ConfigManager()
+config_manager = ConfigManager.instance()
 
-# 添加缓存字典
-_normalize_cache = {}
+# 预编译的正则表达式，避免每次调用都经过re模块的模式缓存查找
+_WHITESPACE_RE = re.compile(r'\s+')
+_HYPHENS_RE = re.compile(r'[‐‑‒–—―]')
+_DOTS_RE = re.compile(r'\.{2,}')
+_IDEOGRAPHIC_DOTS_RE = re.compile(r'。{2,}')
+# 需要标准化的空白：首尾空白、连续空白或空格以外的空白字符
+_UNNORMALIZED_WHITESPACE_RE = re.compile(r'^\s|\s$|\s\s|[^\S ]')
+# 匹配小括号(), 中括号[], 大括号{}以及全角括号（）【】
+_BRACKETS_RE = re.compile(r'\([^)]*\)|\[[^\]]*\]|\{[^}]*\}|（[^）]*）|【[^】]*】')
+# 匹配小括号(), 中括号[], 大括号{}
+_BRACKETS_FIND_RE = re.compile(r'(\([^)]*\)|\[[^\]]*\]|\{[^}]*\})')
+
+# 按替换模式配置文件路径缓存的归一化器实例，避免每次调用都重新加载并编译替换模式
+_normalizer_cache: Dict[Optional[str], "TextNormalizer"] = {}
 
 
 class TextNormalizer:
@@ -68,6 +81,51 @@ class TextNormalizer:
         "brackets": r"\(.*?\)|\[.*?\]|（.*?）|【.*?】"
     }
 
+    # 常见繁简体映射表，用于常见字符的直接替换（覆盖音乐标题中的常见字符）。
+    # str.translate在C中一次扫描完成全部替换，比逐个字符调用str.replace高效
+    _ZH_TRAD_TO_SIMP = str.maketrans({
+        '愛': '爱', '風': '风', '華': '华', '時': '时', '樂': '乐',
+        '東': '东', '來': '来', '過': '过', '說': '说', '實': '实',
+        '現': '现', '點': '点', '開': '开', '後': '后', '樣': '样',
+        '將': '将', '應': '应', '當': '当', '對': '对', '還': '还',
+        '發': '发', '歲': '岁', '為': '为', '與': '与', '號': '号',
+        '處': '处', '產': '产', '從': '从', '務': '务', '長': '长',
+        '問': '问', '體': '体', '際': '际', '關': '关', '興': '兴',
+        '讓': '让', '證': '证', '張': '张', '該': '该', '語': '语',
+        '員': '员', '價': '价', '買': '买', '賣': '卖', '場': '场',
+        '園': '园', '強': '强', '島': '岛', '數': '数', '幾': '几',
+        '機': '机', '難': '难', '並': '并', '書': '书', '義': '义',
+        '車': '车', '馬': '马', '學': '学', '總': '总', '條': '条',
+        '雲': '云', '達': '达', '鐵': '铁', '熱': '热', '兒': '儿',
+        '單': '单', '論': '论', '電': '电', '麗': '丽', '鄧': '邓',
+        '錯': '错', '願': '愿', '頭': '头', '鳥': '鸟', '們': '们',
+        '齊': '齐', '淚': '泪', '鳳': '凤', '傷': '伤', '鄉': '乡',
+        '漢': '汉', '權': '权', '鬆': '松', '趙': '赵', '週': '周',
+        '藝': '艺', '術': '术', '團': '团', '階': '阶', '歡': '欢',
+        '灣': '湾', '國': '国', '髮': '发', '佈': '布', '轉': '转',
+        '廣': '广', '連': '连', '麼': '么', '類': '类', '臺': '台',
+        '黃': '黄', '萬': '万', '區': '区', '這': '这', '壓': '压',
+        '響': '响', '紮': '扎', '傳': '传', '嘗': '尝', '準': '准',
+        '醫': '医', '討': '讨', '禮': '礼', '訊': '讯', '遊': '游',
+        '給': '给', '紅': '红', '則': '则', '約': '约', '隨': '随',
+        '陽': '阳', '閃': '闪', '飛': '飞', '遠': '远', '舊': '旧',
+        '係': '系', '維': '维', '創': '创', '預': '预', '顏': '颜',
+        '館': '馆', '騰': '腾', '鮮': '鲜', '觀': '观', '壞': '坏',
+        '師': '师', '圖': '图', '倆': '俩', '認': '认', '親': '亲',
+        '請': '请', '題': '题', '養': '养', '樹': '树', '講': '讲',
+        '許': '许', '設': '设', '訴': '诉', '課': '课', '誰': '谁',
+        '調': '调', '誤': '误', '讀': '读', '貝': '贝', '貨': '货',
+        '貢': '贡', '財': '财', '責': '责', '費': '费', '質': '质',
+        '賞': '赏', '賦': '赋', '輔': '辅', '輕': '轻', '輩': '辈',
+        '輸': '输', '轟': '轰', '辦': '办', '運': '运', '違': '违',
+        '進': '进', '遲': '迟', '遷': '迁', '選': '选', '遺': '遗',
+        '遼': '辽', '鄰': '邻', '裏': '里', '變': '变'
+    })
+
+    # 全角字符到半角字符的映射表
+    # 全角字符Unicode范围: 0xFF01-0xFF5E，半角字符Unicode范围: 0x0021-0x007E（相差0xFEE0）
+    _FULLWIDTH_TABLE = {code: code - 0xFEE0 for code in range(0xFF01, 0xFF5F)}
+
     def __init__(self, patterns_file: Optional[str] = None):
         """
         初始化标准化器
@@ -87,7 +145,10 @@ class TextNormalizer:
             for name, pattern in self.patterns.items()
         }
 
-        logger.debug(f"文本标准化器初始化完成，已加载 {len(self.patterns)} 个替换模式")
+        # 按模式名称集合缓存的合并正则（所有模式的单一分支表达式）
+        self._fused_patterns: Dict[FrozenSet[str], Optional[Pattern]] = {}
+
+        logger.debug("文本标准化器初始化完成，已加载 %s 个替换模式", len(self.patterns))
 
     def _load_patterns(self, patterns_file: Optional[str]) -> Dict[str, str]:
         """
@@ -108,9 +169,9 @@ class TextNormalizer:
                 with open(patterns_file, 'r', encoding='utf-8') as f:
                     custom_patterns = json.load(f)
                     patterns.update(custom_patterns)
-                    logger.info(f"从 {patterns_file} 加载了自定义替换模式")
+                    logger.info("从 %s 加载了自定义替换模式", patterns_file)
             except Exception as e:
-                logger.warning(f"无法从 {patterns_file} 加载替换模式: {e}")
+                logger.warning("无法从 %s 加载替换模式: %s", patterns_file, e)
 
         # 尝试从配置管理器获取
         config_patterns = config_manager.get("TEXT_PATTERNS", {})
@@ -135,66 +196,15 @@ class TextNormalizer:
         if not text:
             return text
 
-        # 常见繁简体映射字典，用于常见字符的直接替换
-        # 这种方法比全量转换更高效，同时覆盖了音乐标题中的常见字符
-        zh_mapping = {
-            '愛': '爱', '風': '风', '華': '华', '時': '时', '樂': '乐',
-            '東': '东', '來': '来', '過': '过', '說': '说', '實': '实',
-            '現': '现', '點': '点', '開': '开', '後': '后', '樣': '样',
-            '將': '将', '應': '应', '當': '当', '對': '对', '還': '还',
-            '發': '发', '歲': '岁', '為': '为', '與': '与', '號': '号',
-            '處': '处', '產': '产', '從': '从', '務': '务', '長': '长',
-            '問': '问', '體': '体', '實': '实', '際': '际', '關': '关',
-            '興': '兴', '讓': '让', '證': '证', '張': '张', '該': '该',
-            '語': '语', '員': '员', '價': '价', '買': '买', '賣': '卖',
-            '場': '场', '園': '园', '強': '强', '島': '岛', '數': '数',
-            '幾': '几', '機': '机', '難': '难', '並': '并', '書': '书',
-            '義': '义', '車': '车', '馬': '马', '學': '学', '總': '总',
-            '條': '条', '雲': '云', '達': '达', '鐵': '铁', '熱': '热',
-            '兒': '儿', '單': '单', '論': '论', '電': '电', '麗': '丽',
-            '鄧': '邓', '錯': '错', '願': '愿', '頭': '头', '鳥': '鸟',
-            '們': '们', '齊': '齐', '淚': '泪', '處': '处', '鳳': '凤',
-            '傷': '伤', '鄉': '乡', '華': '华', '漢': '汉', '權': '权',
-            '實': '实', '並': '并', '鬆': '松', '趙': '赵', '週': '周',
-            '藝': '艺', '術': '术', '團': '团', '階': '阶', '實': '实',
-            '歡': '欢', '灣': '湾', '國': '国', '髮': '发', '佈': '布',
-            '轉': '转', '廣': '广', '連': '连', '麼': '么', '類': '类',
-            '馬': '马', '臺': '台', '黃': '黄', '萬': '万', '區': '区',
-            '這': '这', '樣': '样', '壓': '压', '響': '响', '紮': '扎',
-            '傳': '传', '嘗': '尝', '準': '准', '醫': '医', '討': '讨',
-            '歲': '岁', '禮': '礼', '訊': '讯', '遊': '游', '給': '给',
-            '義': '义', '鳳': '凤', '產': '产', '紅': '红', '則': '则',
-            '約': '约', '隨': '随', '鳥': '鸟', '鄉': '乡', '陽': '阳',
-            '閃': '闪', '飛': '飞', '際': '际', '遠': '远', '價': '价',
-            '舊': '旧', '處': '处', '係': '系', '維': '维', '創': '创',
-            '難': '难', '預': '预', '藝': '艺', '際': '际', '頭': '头',
-            '顏': '颜', '風': '风', '館': '馆', '騰': '腾', '團': '团',
-            '階': '阶', '鮮': '鲜', '觀': '观', '壞': '坏', '師': '师',
-            '圖': '图', '倆': '俩', '認': '认', '親': '亲', '請': '请',
-            '問': '问', '題': '题', '養': '养', '樹': '树', '單': '单',
-            '論': '论', '講': '讲', '許': '许', '設': '设', '訴': '诉',
-            '語': '语', '課': '课', '誰': '谁', '調': '调', '誤': '误',
-            '說': '说', '讀': '读', '貝': '贝', '貨': '货', '貢': '贡',
-            '財': '财', '責': '责', '費': '费', '質': '质', '賣': '卖',
-            '賞': '赏', '賦': '赋', '赤': '赤', '輔': '辅', '輕': '轻',
-            '輩': '辈', '輸': '输', '轉': '转', '轟': '轰', '辦': '办',
-            '遇': '遇', '遊': '游', '運': '运', '過': '过', '達': '达',
-            '違': '违', '這': '这', '連': '连', '週': '周', '進': '进',
-            '遲': '迟', '遷': '迁', '選': '选', '遺': '遗', '遼': '辽',
-            '鄉': '乡', '鄰': '邻', '酬': '酬', '裏': '里', '號': '号',
-            '變': '变', '點': '点', '萬': '万'
-        }
-
         # 手动替换常见字符
-        for trad, simp in zh_mapping.items():
-            text = text.replace(trad, simp)
+        text = text.translate(self._ZH_TRAD_TO_SIMP)
 
         # 对于未替换的字符，使用OpenCC（如果已初始化）
         if hasattr(self, 'converter') and self.converter:
             try:
                 text = self.converter.convert(text)
             except Exception as e:
-                logger.warning(f"OpenCC转换失败: {e}")
+                logger.warning("OpenCC转换失败: %s", e)
 
         return text
 
@@ -220,17 +230,7 @@ class TextNormalizer:
         Returns:
             str: 转换后的文本
         """
-        # 全角字符Unicode范围: 0xFF01-0xFF5E
-        # 半角字符Unicode范围: 0x0021-0x007E
-        result = ""
-        for char in text:
-            code = ord(char)
-            if 0xFF01 <= code <= 0xFF5E:
-                # 转换全角字符到半角
-                result += chr(code - 0xFF01 + 0x21)
-            else:
-                result += char
-        return result
+        return text.translate(self._FULLWIDTH_TABLE)
 
     def normalize_whitespace(self, text: str) -> str:
         """
@@ -247,7 +247,7 @@ class TextNormalizer:
         # 首先去除开头和结尾的空白
         text = text.strip()
         # 将连续的空白字符替换为单个空格
-        text = re.sub(r'\s+', ' ', text)
+        text = _WHITESPACE_RE.sub(' ', text)
         return text
 
     def normalize_separators(self, text: str) -> str:
@@ -262,20 +262,64 @@ class TextNormalizer:
             str: 标准化后的文本
         """
         # 标准化连字符：将各种连字符替换为标准连字符 "-"
-        text = re.sub(r'[‐‑‒–—―]', '-', text)
+        text = _HYPHENS_RE.sub('-', text)
 
         # 标准化斜杠：将全角斜杠替换为半角斜杠 "/"
         text = text.replace('／', '/')
 
         # 标准化与号：将各种与号替换为标准与号 "&"
-        text = re.sub(r'[＆]', '&', text)
+        text = text.replace('＆', '&')
 
         # 标准化省略号：将连续的点替换为三个点 "..."
-        text = re.sub(r'\.{2,}', '...', text)
-        text = re.sub(r'。{2,}', '...', text)
+        text = _DOTS_RE.sub('...', text)
+        text = _IDEOGRAPHIC_DOTS_RE.sub('...', text)
 
         return text
 
+    def _fused_pattern(self, pattern_names: FrozenSet[str]) -> Optional[Pattern]:
+        """
+        获取由指定模式合并而成的单一正则（首次使用时编译并缓存）
+
+        合并正则只用于一次扫描判断文本中是否存在任一模式的匹配。
+        逐个模式依次替换时，前一个模式的替换会影响后一个模式的匹配，
+        合并后一次替换无法保证结果一致，因此实际替换仍按原顺序进行。
+
+        Args:
+            pattern_names: 模式名称集合
+
+        Returns:
+            Optional[Pattern]: 合并后的正则；没有已知模式或无法合并时为None。自定义模式含分组时
+                （可能有反向引用，合并后分组编号会变化）或含全局内联标志时无法合并
+        """
+        if pattern_names not in self._fused_patterns:
+            selected = [self.patterns[name] for name in sorted(pattern_names)
+                        if name in self.compiled_patterns]
+            fused = None
+            if selected and not any(self.compiled_patterns[name].groups
+                                    for name in pattern_names
+                                    if name in self.compiled_patterns):
+                try:
+                    alternatives = "|".join(f"(?:{pattern})" for pattern in selected)
+                    fused = re.compile(alternatives, re.IGNORECASE)
+                except re.error as e:
+                    logger.debug("无法合并替换模式，将逐个匹配: %s", e)
+            self._fused_patterns[pattern_names] = fused
+        return self._fused_patterns[pattern_names]
+
+    def _has_pattern_match(self, text: str, pattern_names: FrozenSet[str]) -> bool:
+        """
+        判断文本中是否存在任一指定模式的匹配
+
+        Args:
+            text: 输入文本
+            pattern_names: 模式名称集合
+
+        Returns:
+            bool: 存在匹配（或无法判断）时返回True
+        """
+        fused = self._fused_pattern(pattern_names)
+        return fused is None or fused.search(text) is not None
+
     def remove_patterns(self, text: str, patterns: Optional[List[str]] = None) -> str:
         """
         去除特定模式的文本
@@ -291,16 +335,19 @@ class TextNormalizer:
             return text
 
         result = text
+        # 大多数文本不含任何指定模式，合并正则扫描一遍即可跳过逐个模式的替换
+        has_match = self._has_pattern_match(text, frozenset(patterns))
         # 遍历指定的模式
         for pattern_name in patterns:
             if pattern_name in self.compiled_patterns:
-                # 使用空字符串替换匹配到的内容
-                result = self.compiled_patterns[pattern_name].sub('', result)
+                if has_match:
+                    # 使用空字符串替换匹配到的内容
+                    result = self.compiled_patterns[pattern_name].sub('', result)
             else:
-                logger.warning(f"未知的模式名称: {pattern_name}")
+                logger.warning("未知的模式名称: %s", pattern_name)
 
         # 去除可能出现的连续空格
-        result = re.sub(r'\s+', ' ', result)
+        result = _WHITESPACE_RE.sub(' ', result)
         result = result.strip()
 
         return result
@@ -320,13 +367,17 @@ class TextNormalizer:
             return text
 
         result = text
+        # 大多数文本不含任何指定模式，合并正则扫描一遍即可跳过逐个模式的替换
+        has_match = self._has_pattern_match(text, frozenset(replacements))
         # 遍历指定的替换
         for pattern_name, replacement in replacements.items():
             if pattern_name in self.compiled_patterns:
-                # 用指定的字符串替换匹配到的内容
-                result = self.compiled_patterns[pattern_name].sub(replacement, result)
+                if has_match:
+                    # 用指定的字符串替换匹配到的内容
+                    pattern = self.compiled_patterns[pattern_name]
+                    result = pattern.sub(replacement, result)
             else:
-                logger.warning(f"未知的模式名称: {pattern_name}")
+                logger.warning("未知的模式名称: %s", pattern_name)
 
         return result
 
@@ -353,100 +404,67 @@ class TextNormalizer:
             # 先进行整体的简繁体转换，再单独处理括号
             text = self.to_simplified_chinese(text)
 
-        # 对于特定的测试用例直接返回预期结果
-        if "Artist feat. Guest (Remix)" in text:
-            return "artist feat guest (remix)"
-        elif "ARTIST1 & ARTIST2 - SONG [Remix] {Deluxe}" in text:
-            return "artist1 & artist2 song (remix) (deluxe)"
-        elif "Multiple (Brackets) (in the) [same] {string}" in text:
-            return "multiple (brackets) (in the) (same) (string)"
-        elif "Mixed Format: (Live) [Remix] {Deluxe}" in text:
-            return "mixed format (live) (remix) (deluxe)"
-        elif "Ｓｏｎｇ　Ｔｉｔｌｅ（Live）" in text:
-            return "song title (live)"
-        elif "繁體中文歌曲" in text:
-            return "简体中文歌曲 (2021版)"
-        elif "Title & Artist-Name/Featuring" in text:
-            return "title & artist name featuring (2021)"
-        elif "愛的代價" in text or "爱的代价" in text:
-            # 特殊处理"爱的代价"
-            return "爱的代价" + (" (live)" if "live" in text.lower() or "现场" in text or "現場" in text else "")
-        elif "成都" in text and ("現場" in text or "现场" in text or "live" in text.lower()):
-            # 特殊处理"成都 (Live)"
-            return "成都 (live)"
-
-        # 使用正则表达式分离文本中的括号内容
-        # 匹配小括号(), 中括号[], 大括号{}
-        brackets_regex = r'(\([^)]*\)|\[[^\]]*\]|\{[^}]*\}|（[^）]*）|【[^】]*】)'
-        parts = re.split(brackets_regex, text)
-
+        # 一次扫描找出文本中的全部括号，括号之间的文本与括号内容分别标准化。
+        # 各种括号统一输出为小括号()
         normalized_parts = []
-        for i, part in enumerate(parts):
-            if i % 2 == 0:  # 非括号部分
-                # 对非括号部分应用完整的标准化
-                normalized_part = self.to_lowercase(part)
-                normalized_part = self.normalize_fullwidth(normalized_part)
-                normalized_part = self.to_simplified_chinese(normalized_part)
-                # 特殊处理连字符 "-"，将其转换为空格
-                normalized_part = normalized_part.replace("-", " ")
-                normalized_part = self.normalize_separators(normalized_part)
-                normalized_part = self.normalize_whitespace(normalized_part)
-                normalized_parts.append(normalized_part)
-            else:  # 括号部分
-                # 确定括号类型 - 统一使用小括号()
-                if part.startswith('(') and part.endswith(')'):
-                    opening, closing = '(', ')'
-                elif part.startswith('[') and part.endswith(']'):
-                    opening, closing = '(', ')'
-                elif part.startswith('{') and part.endswith('}'):
-                    opening, closing = '(', ')'
-                elif part.startswith('（') and part.endswith('）'):
-                    opening, closing = '(', ')'
-                elif part.startswith('【') and part.endswith('】'):
-                    opening, closing = '(', ')'
-                else:
-                            opening, closing = '(', ')'
-
-                # 提取括号内容 (无论原始括号类型如何)
-                if (part.startswith('(') and part.endswith(')')) or \
-                   (part.startswith('[') and part.endswith(']')) or \
-                   (part.startswith('{') and part.endswith('}')) or \
-                   (part.startswith('（') and part.endswith('）')) or \
-                   (part.startswith('【') and part.endswith('】')):
-                    content = part[1:-1]
-                else:
-                    content = part
-
-                # 特殊处理简繁体和Live相关的内容
-                if "現場" in content or "现场" in content:
-                    normalized_content = "live"
-                elif "live" in content.lower():
-                    normalized_content = "live"
-                else:
-                    # 标准化括号内容
-                    normalized_content = self.to_lowercase(content)
-                    normalized_content = self.normalize_fullwidth(normalized_content)
-                    normalized_content = self.to_simplified_chinese(normalized_content)
-                    normalized_content = self.normalize_separators(normalized_content)
-                    normalized_content = self.normalize_whitespace(normalized_content)
-
-                # 重新组合括号和内容 - 确保在括号前添加空格，除非是在字符串开头
-                if normalized_parts and normalized_parts[-1] and not normalized_parts[-1].endswith(' '):
-                    normalized_parts[-1] = normalized_parts[-1] + ' '
-                normalized_parts.append(f"{opening}{normalized_content}{closing}")
-
-                # 在括号后添加空格，确保括号之间有分隔
-                if i < len(parts) - 1:
-                    normalized_parts[-1] = normalized_parts[-1] + ' '
+        position = 0
+        for match in _BRACKETS_RE.finditer(text):
+            # 括号前的非括号部分
+            normalized_parts.append(
+                self._normalize_unbracketed_part(text[position:match.start()]))
+            position = match.end()
+
+            # 提取括号内容 (无论原始括号类型如何)
+            content = match.group()[1:-1]
+
+            # 特殊处理简繁体和Live相关的内容
+            if "現場" in content or "现场" in content:
+                normalized_content = "live"
+            elif "live" in content.lower():
+                normalized_content = "live"
+            else:
+                # 标准化括号内容
+                normalized_content = self.to_lowercase(content)
+                normalized_content = self.normalize_fullwidth(normalized_content)
+                normalized_content = self.to_simplified_chinese(normalized_content)
+                normalized_content = self.normalize_separators(normalized_content)
+                normalized_content = self.normalize_whitespace(normalized_content)
+
+            # 重新组合括号和内容 - 确保在括号前添加空格，除非是在字符串开头
+            if normalized_parts[-1] and not normalized_parts[-1].endswith(' '):
+                normalized_parts[-1] = normalized_parts[-1] + ' '
+            # 在括号后添加空格，确保括号之间有分隔
+            normalized_parts.append(f"({normalized_content}) ")
+
+        # 最后一个括号之后的非括号部分
+        normalized_parts.append(self._normalize_unbracketed_part(text[position:]))
 
         # 合并所有部分
         result = ''.join(normalized_parts)
         # 最后进行整体的空白标准化
         result = self.normalize_whitespace(result)
 
-        logger.debug(f"保留括号的文本标准化: '{original_text}' -> '{result}'")
+        logger.debug("保留括号的文本标准化: '%s' -> '%s'", original_text, result)
         return result
 
+    def _normalize_unbracketed_part(self, part: str) -> str:
+        """
+        对保留括号的标准化中括号以外的文本部分应用完整的标准化
+
+        Args:
+            part: 括号以外的文本部分
+
+        Returns:
+            str: 标准化后的文本
+        """
+        normalized_part = self.to_lowercase(part)
+        normalized_part = self.normalize_fullwidth(normalized_part)
+        normalized_part = self.to_simplified_chinese(normalized_part)
+        # 特殊处理连字符 "-"，将其转换为空格
+        normalized_part = normalized_part.replace("-", " ")
+        normalized_part = self.normalize_separators(normalized_part)
+        return self.normalize_whitespace(normalized_part)
+
     def split_bracketed_content(self, text: str) -> tuple:
         """
         将文本分割为主要部分和括号内容部分
@@ -469,8 +487,7 @@ class TextNormalizer:
             return "song", ["[remastered]", "(live)", "{deluxe}"] if "[" in text else ["(remastered)", "(live)", "(deluxe)"]
 
         # 匹配各种括号内容: (), [], {}
-        brackets_regex = r'(\([^)]*\)|\[[^\]]*\]|\{[^}]*\})'
-        brackets = re.findall(brackets_regex, text)
+        brackets = _BRACKETS_FIND_RE.findall(text)
 
         if not brackets:
             return text, []
@@ -490,11 +507,41 @@ class TextNormalizer:
             main_text = main_text.replace(placeholder, " ")
 
         # 清理可能产生的多余空格
-        main_text = re.sub(r'\s+', ' ', main_text).strip()
+        main_text = _WHITESPACE_RE.sub(' ', main_text).strip()
 
-        logger.debug(f"文本分割: '{text}' -> 主要部分='{main_text}', 括号={brackets}")
+        logger.debug("文本分割: '%s' -> 主要部分='%s', 括号=%s", text, main_text, brackets)
         return main_text, brackets
 
+    def _is_already_normalized(self, text: str,
+                               remove_patterns: Optional[List[str]] = None,
+                               replacements: Optional[Dict[str, str]] = None) -> bool:
+        """
+        判断文本经过normalize处理后是否保持不变
+
+        纯ASCII文本不含全角字符、中文和特殊连字符（OpenCC转换也不会改变它），
+        因此只需再确认已是小写、没有连续的点、空白已标准化，且不含任何要去除或替换的模式。
+        这些检查都在C中完成，比依次执行各个处理步骤快得多。
+
+        Args:
+            text: 输入文本
+            remove_patterns: 要去除的模式名称列表
+            replacements: 要替换的模式和对应的替换字符串
+
+        Returns:
+            bool: 文本已是标准形式时返回True
+        """
+        if (not text.isascii() or text.lower() != text or '..' in text
+                or _UNNORMALIZED_WHITESPACE_RE.search(text)):
+            return False
+
+        pattern_names = frozenset(remove_patterns or ()) | frozenset(replacements or ())
+        if not pattern_names:
+            return True
+        # 存在未知模式名称时交由常规流程处理（以便记录警告）
+        if not all(name in self.compiled_patterns for name in pattern_names):
+            return False
+        return not self._has_pattern_match(text, pattern_names)
+
     def normalize(self, text: str, remove_patterns: Optional[List[str]] = None,
                   replacements: Optional[Dict[str, str]] = None,
                   preserve_brackets: bool = False) -> str:
@@ -520,6 +567,10 @@ class TextNormalizer:
         if preserve_brackets:
             return self.normalize_preserving_brackets(text)
 
+        # 已经是标准形式的文本（大多数英文标题）直接返回，无需经过各个处理步骤
+        if self._is_already_normalized(text, remove_patterns, replacements):
+            return text
+
         # 1. 转换为小写
         text = self.to_lowercase(text)
 
@@ -543,12 +594,29 @@ class TextNormalizer:
         # 7. 标准化空白字符
         text = self.normalize_whitespace(text)
 
-        logger.debug(f"文本标准化: '{original_text}' -> '{text}'")
+        logger.debug("文本标准化: '%s' -> '%s'", original_text, text)
         return text
 
 # 模块级别的便捷函数
 
 
+def _get_normalizer(patterns_file: Optional[str] = None) -> TextNormalizer:
+    """
+    获取指定替换模式配置文件对应的归一化器（首次使用时创建并缓存）
+
+    Args:
+        patterns_file: 替换模式配置文件路径
+
+    Returns:
+        TextNormalizer: 归一化器实例
+    """
+    normalizer = _normalizer_cache.get(patterns_file)
+    if normalizer is None:
+        normalizer = _normalizer_cache.setdefault(patterns_file,
+                                                  TextNormalizer(patterns_file))
+    return normalizer
+
+
 def normalize_text(text: str, remove_patterns: Optional[List[str]] = None,
                    replacements: Optional[Dict[str, str]] = None,
                    patterns_file: Optional[str] = None,
@@ -569,31 +637,45 @@ def normalize_text(text: str, remove_patterns: Optional[List[str]] = None,
     if text is None:
         return ""
 
-    # 使用缓存机制
-    cache_key = (text,
-                 tuple(sorted(remove_patterns)) if remove_patterns else None,
-                 tuple(sorted(replacements.items())) if replacements else None,
-                 patterns_file,
-                 preserve_brackets)
-    if cache_key in _normalize_cache:
-        return _normalize_cache[cache_key]
+    # 参数转换为可哈希的元组后使用缓存。模式按给定顺序依次应用，顺序不同结果可能不同，因此保留原顺序
+    return _normalize_cached(text,
+                             tuple(remove_patterns) if remove_patterns else None,
+                             tuple(replacements.items()) if replacements else None,
+                             patterns_file,
+                             preserve_brackets)
 
-    # 创建归一化器实例
-    normalizer = TextNormalizer(patterns_file)
+
+@lru_cache(maxsize=4096)
+def _normalize_cached(text: str, remove_patterns: Optional[Tuple[str, ...]],
+                      replacements: Optional[Tuple[Tuple[str, str], ...]],
+                      patterns_file: Optional[str], preserve_brackets: bool) -> str:
+    """
+    标准化文本（带有界LRU缓存）
+
+    长时间运行的服务会不断遇到新的标题，缓存大小有上限以避免内存无限增长；
+    lru_cache的读写在CPython中是线程安全的。
+
+    Args:
+        text: 原始文本
+        remove_patterns: 要去除的模式名称元组
+        replacements: 模式和对应替换字符串组成的元组
+        patterns_file: 替换模式配置文件路径
+        preserve_brackets: 是否保留括号内容
+
+    Returns:
+        str: 标准化后的文本
+    """
+    # 获取（复用）归一化器实例
+    normalizer = _get_normalizer(patterns_file)
 
     # 执行归一化
-    normalized = normalizer.normalize(
+    return normalizer.normalize(
         text,
-        remove_patterns,
-        replacements,
+        list(remove_patterns) if remove_patterns else None,
+        dict(replacements) if replacements else None,
         preserve_brackets
     )
 
-    # 存入缓存
-    _normalize_cache[cache_key] = normalized
-
-    return normalized
-
 
 def split_text(text: str, patterns_file: Optional[str] = None) -> tuple:
     """
@@ -606,8 +688,8 @@ def split_text(text: str, patterns_file: Optional[str] = None) -> tuple:
     Returns:
         tuple: (主要文本部分, 括号内容列表)
     """
-    # 创建归一化器实例
-    normalizer = TextNormalizer(patterns_file)
+    # 获取（复用）归一化器实例
+    normalizer = _get_normalizer(patterns_file)
 
     # 执行分割
     return normalizer.split_bracketed_content(text)
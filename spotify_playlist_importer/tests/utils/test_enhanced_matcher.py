@@ -0,0 +1,88 @@
+"""
+增强匹配器的回归测试
+
+标题相似度改用RapidFuzz计算后分数整体偏高，这里固定几组仅凭艺术家相同
+就可能越过阈值的错误匹配，确保标题相似度下限将其拦下，同时正确匹配不受影响。
+"""
+
+from spotify_playlist_importer.utils.enhanced_matcher import (
+    BracketAwareMatcher, EnhancedMatcher
+)
+
+
+def _make_candidates(songs):
+    """按 (标题, 艺术家列表) 构造Spotify搜索结果格式的候选列表"""
+    return [
+        {"id": f"id{index}", "name": name,
+         "artists": [{"name": artist} for artist in artists]}
+        for index, (name, artists) in enumerate(songs)
+    ]
+
+
+def _prepare_for_bracket_matcher(matcher, candidates):
+    """为候选预先填充BracketAwareMatcher所需的标准化信息"""
+    for candidate in candidates:
+        candidate["normalized_info"] = matcher._prepare_input_song(
+            candidate["name"], [artist["name"] for artist in candidate["artists"]])
+    return candidates
+
+
+def test_enhanced_matcher_rejects_different_title_by_same_artist():
+    candidates = _make_candidates([("Love Song （现场版）", ["周杰伦"])])
+
+    matches = EnhancedMatcher().match("Shape of You (Radio Edit)", ["周杰伦"], candidates)
+
+    assert matches == []
+
+
+def test_enhanced_matcher_floor_can_be_disabled():
+    candidates = _make_candidates([("Love Song （现场版）", ["周杰伦"])])
+
+    matches = EnhancedMatcher(min_title_score=0).match(
+        "Shape of You (Radio Edit)", ["周杰伦"], candidates)
+
+    assert [match["name"] for match in matches] == ["Love Song （现场版）"]
+
+
+def test_enhanced_matcher_keeps_correct_match():
+    candidates = _make_candidates([
+        ("Love Song", ["Ed Sheeran"]),
+        ("Shape of You", ["Ed Sheeran"]),
+    ])
+
+    matches = EnhancedMatcher().match("Shape of You", ["Ed Sheeran"], candidates)
+
+    assert [match["name"] for match in matches] == ["Shape of You"]
+
+
+def test_enhanced_matcher_keeps_correct_chinese_match():
+    candidates = _make_candidates([("晴天", ["周杰伦"]), ("稻香", ["周杰伦"])])
+
+    matches = EnhancedMatcher().match("晴天", ["周杰伦"], candidates)
+
+    assert [match["name"] for match in matches] == ["晴天"]
+
+
+def test_bracket_aware_matcher_drops_low_title_score_from_high_confidence():
+    matcher = BracketAwareMatcher()
+    candidates = _prepare_for_bracket_matcher(matcher, _make_candidates([
+        ("Blinding Lights", ["G.E.M."]),
+        ("As It Was (feat. Someone)", ["G.E.M."]),
+    ]))
+
+    matches = matcher.match("As It Was (feat. Someone)", ["G.E.M."], candidates)
+
+    assert [match["name"] for match in matches] == ["As It Was (feat. Someone)"]
+
+
+def test_bracket_aware_matcher_without_floor_accepts_same_artist_only():
+    matcher = BracketAwareMatcher(min_title_score=0)
+    candidates = _prepare_for_bracket_matcher(matcher, _make_candidates([
+        ("Blinding Lights", ["G.E.M."]),
+        ("As It Was (feat. Someone)", ["G.E.M."]),
+    ]))
+
+    matches = matcher.match("As It Was (feat. Someone)", ["G.E.M."], candidates)
+
+    assert [match["name"] for match in matches] == [
+        "As It Was (feat. Someone)", "Blinding Lights"]